@@ -22,6 +22,7 @@ setup(
     install_requires=[
         "pandas>=2.0.0",
         "numpy>=1.24.0",
+        "pyarrow>=14.0.0",
         "tabula-py>=2.8.0",
         "PyPDF2>=3.0.0",
         "requests>=2.31.0",
@@ -41,6 +42,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-benchmark>=4.0.0",
             "black>=23.9.0",
             "flake8>=6.1.0",
             "mypy>=1.5.0",
@@ -52,6 +54,17 @@ setup(
             "notebook>=7.0.0",
             "plotly>=5.17.0",
         ],
+        "ocr": [
+            "pypdfium2>=4.0.0",
+            "pytesseract>=0.3.10",
+            "Pillow>=10.0.0",
+        ],
+        "geo": [
+            "rasterio>=1.3.0",
+            "shapely>=2.0.0",
+            "pyogrio>=0.7.0",
+            "mapbox-vector-tile>=2.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,3 +1,17 @@
 """Analysis and comparison tools."""
 
-__all__ = []
+from ag_dedicated.utils.lazy import lazy_exports
+
+# Public name -> defining module, imported on first access
+__all__, __getattr__ = lazy_exports(__name__, {
+    "DedicationIntervals": "ag_dedicated.analysis.intervals",
+    "StatuteComparison": "ag_dedicated.analysis.statute_comparison",
+    "build_lifecycle": "ag_dedicated.analysis.lifecycle",
+    "TaxRules": "ag_dedicated.analysis.tax_benefit",
+    "estimate_tax_benefit": "ag_dedicated.analysis.tax_benefit",
+    "summarize_tax_benefit": "ag_dedicated.analysis.tax_benefit",
+    "PolicyReport": "ag_dedicated.analysis.policy_report",
+    "PolicySimulator": "ag_dedicated.analysis.scenarios",
+    "Scenario": "ag_dedicated.analysis.scenarios",
+    "scenario_grid": "ag_dedicated.analysis.scenarios",
+})
@@ -0,0 +1,212 @@
+"""Year-over-year change feed between dedication snapshots."""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from ag_dedicated.extractors.parquet import (
+    DEDICATION_COLUMNS,
+    read_dedications_parquet,
+)
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+from ag_dedicated.utils.validation import decode_petitions
+
+
+CHANGE_TYPES = ['added', 'removed', 'renewed', 'end_year_changed']
+"""
+Change classes:
+
+- added: new petition not paired with a petition gone from the same TMK
+- removed: petition gone, not paired with a new petition on the same TMK
+- renewed: new petition paired one-to-one with a petition gone from the
+  same TMK
+- end_year_changed: same petition and TMK, different end year
+"""
+
+CHANGE_SCHEMA = pa.schema([
+    pa.field('tmk_key', pa.int64()),
+    pa.field('petition', pa.string()),
+    pa.field('petition_key', pa.int64()),
+    pa.field('end_year', pa.int16()),
+    pa.field('previous_petition', pa.string()),
+    pa.field('previous_end_year', pa.int16()),
+    pa.field('change', pa.dictionary(pa.int8(), pa.string())),
+    pa.field('year_from', pa.int16()),
+    pa.field('year_to', pa.int16()),
+])
+
+
+def _snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """Reduce one snapshot to unique (tmk_key, petition) rows with end year."""
+    renamed = df.rename(columns=DEDICATION_COLUMNS)
+
+    if 'tmk_key' in renamed.columns:
+        tmk_key = renamed['tmk_key'].to_numpy(dtype=np.int64)
+    else:
+        tmk_key = encode_tmks(renamed['tmk'])
+
+    snap = pd.DataFrame({
+        'tmk_key': tmk_key,
+        'petition': renamed['petition'].astype('string').str.strip().to_numpy(),
+        'end_year': pd.to_numeric(renamed['end_year'], errors='coerce').to_numpy(),
+    })
+    snap = snap[(snap['tmk_key'] != TMK_NULL) & snap['petition'].notna()]
+    return snap.groupby(['tmk_key', 'petition'], as_index=False, sort=False)['end_year'].max()
+
+
+def diff_snapshots(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Classify the differences between two dedication snapshots.
+
+    Both snapshots are reduced to unique (TMK key, petition) rows and
+    joined with hash joins; unchanged rows are not returned.
+
+    Args:
+        before: Earlier snapshot rows (CSV or Parquet column names)
+        after: Later snapshot rows
+        year_from: Earlier snapshot year, recorded in the output
+        year_to: Later snapshot year, recorded in the output
+
+    Returns:
+        DataFrame matching ``CHANGE_SCHEMA`` with one row per change
+    """
+    a = _snapshot(before)
+    b = _snapshot(after)
+
+    joined = a.merge(
+        b,
+        on=['tmk_key', 'petition'],
+        how='outer',
+        suffixes=('_a', '_b'),
+        indicator=True,
+    )
+
+    both = joined[joined['_merge'] == 'both']
+    end_changed = both[
+        both['end_year_a'].ne(both['end_year_b'])
+        & ~(both['end_year_a'].isna() & both['end_year_b'].isna())
+    ]
+
+    gone = joined[joined['_merge'] == 'left_only']
+    new = joined[joined['_merge'] == 'right_only']
+
+    # A new petition on a TMK that lost one is a renewal. Pair gone and new
+    # petitions one-to-one within each TMK (in end-year, then petition
+    # order); unpaired ones are removals and additions
+    gone = gone.sort_values(['tmk_key', 'end_year_a', 'petition'])
+    new = new.sort_values(['tmk_key', 'end_year_b', 'petition'])
+    gone = gone.assign(rank=gone.groupby('tmk_key').cumcount())
+    new = new.assign(rank=new.groupby('tmk_key').cumcount())
+    paired = new[['tmk_key', 'rank', 'petition', 'end_year_b']].merge(
+        gone[['tmk_key', 'rank', 'petition', 'end_year_a']].rename(
+            columns={'petition': 'previous_petition', 'end_year_a': 'previous_end_year'}
+        ),
+        on=['tmk_key', 'rank'],
+        how='outer',
+    )
+    renewed = paired['petition'].notna() & paired['previous_petition'].notna()
+    change = np.where(renewed, 'renewed', np.where(paired['petition'].notna(), 'added', 'removed'))
+
+    parts = [
+        pd.DataFrame({
+            'tmk_key': paired['tmk_key'],
+            'petition': paired['petition'],
+            'end_year': paired['end_year_b'],
+            'previous_petition': paired['previous_petition'],
+            'previous_end_year': paired['previous_end_year'],
+            'change': change,
+        }),
+        pd.DataFrame({
+            'tmk_key': end_changed['tmk_key'],
+            'petition': end_changed['petition'],
+            'end_year': end_changed['end_year_b'],
+            'previous_petition': end_changed['petition'],
+            'previous_end_year': end_changed['end_year_a'],
+            'change': 'end_year_changed',
+        }),
+    ]
+    changes = pd.concat([p for p in parts if len(p)], ignore_index=True)
+    if changes.empty:
+        changes = pd.DataFrame(columns=['tmk_key', 'petition', 'end_year',
+                                        'previous_petition', 'previous_end_year', 'change'])
+
+    changes = changes.sort_values(['tmk_key', 'change'], ignore_index=True)
+
+    return pd.DataFrame({
+        'tmk_key': changes['tmk_key'].astype(np.int64),
+        'petition': changes['petition'].astype('string'),
+        'petition_key': decode_petitions(changes['petition'].fillna(''))['petition_key'].to_numpy(),
+        'end_year': pd.to_numeric(changes['end_year']).astype('Int16'),
+        'previous_petition': changes['previous_petition'].astype('string'),
+        'previous_end_year': pd.to_numeric(changes['previous_end_year']).astype('Int16'),
+        'change': pd.Categorical(changes['change'], categories=CHANGE_TYPES),
+        'year_from': pd.array([year_from] * len(changes), dtype='Int16'),
+        'year_to': pd.array([year_to] * len(changes), dtype='Int16'),
+    })
+
+
+def diff_years(
+    source: Path,
+    year_from: int,
+    year_to: int,
+) -> pd.DataFrame:
+    """
+    Diff two snapshot years from the Parquet dataset or a merged/cleaned CSV.
+
+    With a Parquet dataset only the two year partitions are read.
+
+    Args:
+        source: Parquet dataset directory or CSV with a Year column
+        year_from: Earlier snapshot year
+        year_to: Later snapshot year
+
+    Returns:
+        Change DataFrame (see ``diff_snapshots``)
+    """
+    columns = ['tmk_key', 'petition', 'end_year', 'year']
+    if source.is_dir():
+        df = read_dedications_parquet(source, years=[year_from, year_to], columns=columns)
+    else:
+        df = pd.read_csv(source).rename(columns=DEDICATION_COLUMNS)
+
+    year = pd.to_numeric(df['year'], errors='coerce')
+    before = df[year == year_from]
+    after = df[year == year_to]
+
+    if before.empty or after.empty:
+        missing = year_from if before.empty else year_to
+        raise ValueError(f"No dedication rows found for snapshot year {missing}")
+
+    changes = diff_snapshots(before, after, year_from=year_from, year_to=year_to)
+
+    counts = changes['change'].value_counts().to_dict()
+    logger.info(f"Diff {year_from} -> {year_to}: {counts}")
+    return changes
+
+
+def write_changes(changes: pd.DataFrame, output_path: Path) -> Path:
+    """
+    Write a change set as a typed Parquet file.
+
+    Args:
+        changes: Output of ``diff_snapshots``
+        output_path: Parquet file path
+
+    Returns:
+        Output path
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(changes, schema=CHANGE_SCHEMA, preserve_index=False)
+    pq.write_table(table, output_path)
+    logger.info(f"Saved {len(changes):,} changes to {output_path}")
+    return output_path
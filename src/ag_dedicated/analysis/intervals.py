@@ -0,0 +1,237 @@
+"""Interval index over dedication start and end years."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class _Node:
+    """Centered interval tree node holding the intervals that contain ``center``."""
+
+    __slots__ = ('center', 'by_start', 'starts', 'by_end', 'ends', 'left', 'right')
+
+    def __init__(self, center, by_start, starts, by_end, ends, left, right):
+        self.center = center
+        self.by_start = by_start  # positions sorted by start
+        self.starts = starts
+        self.by_end = by_end  # positions sorted by end
+        self.ends = ends
+        self.left = left
+        self.right = right
+
+
+class DedicationIntervals:
+    """
+    Static interval index for "active in year Y" and window overlap queries.
+
+    Dedications are closed year intervals ``[start, end]``. Two structures
+    are kept:
+
+    - globally sorted start and end arrays, which give active *counts* for
+      any year with two binary searches, and per-year counts for a whole
+      range from one sweep
+    - a centered interval tree, which returns the matching *rows*. A
+      single year visits one root-to-leaf path, O(log n + k) for k
+      matches; a window also descends into both children of every node
+      whose center falls inside it
+
+    Examples:
+        >>> idx = DedicationIntervals.from_frame(lifecycle, 'first_seen', 'end_year')
+        >>> idx.count_active([2019, 2020])
+        >>> active = lifecycle.loc[idx.active_in(2020)]
+        >>> overlapping = lifecycle.loc[idx.overlapping(2018, 2022)]
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        labels: Optional[Sequence] = None,
+    ):
+        """
+        Build the index.
+
+        Args:
+            starts: Interval start years
+            ends: Interval end years (inclusive)
+            labels: Optional row labels returned by queries (defaults to positions)
+        """
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+
+        if self.starts.shape != self.ends.shape:
+            raise ValueError("starts and ends must have the same length")
+        if (self.ends < self.starts).any():
+            raise ValueError("Interval end years must not precede start years")
+
+        self.labels = np.arange(len(self.starts)) if labels is None else np.asarray(labels)
+        self._sorted_starts = np.sort(self.starts)
+        self._sorted_ends = np.sort(self.ends)
+        self._root = self._build(np.arange(len(self.starts)))
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        start_col: str = 'start_year',
+        end_col: str = 'end_year',
+    ) -> 'DedicationIntervals':
+        """
+        Build an index from DataFrame columns, labelled by the DataFrame index.
+
+        Rows with a missing start or end year are left out.
+
+        Args:
+            df: DataFrame with start and end year columns
+            start_col: Start year column
+            end_col: End year column
+
+        Returns:
+            DedicationIntervals over the complete rows of ``df``
+        """
+        starts = pd.to_numeric(df[start_col], errors='coerce')
+        ends = pd.to_numeric(df[end_col], errors='coerce')
+        complete = (starts.notna() & ends.notna() & (ends >= starts)).to_numpy(dtype=bool)
+        return cls(
+            starts[complete].to_numpy(dtype=np.int64),
+            ends[complete].to_numpy(dtype=np.int64),
+            labels=df.index[complete],
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _build(self, positions: np.ndarray) -> Optional[_Node]:
+        """Recursively build the centered tree over ``positions``."""
+        if len(positions) == 0:
+            return None
+
+        s = self.starts[positions]
+        e = self.ends[positions]
+        center = np.median(np.concatenate([s, e]))
+
+        left = e < center
+        right = s > center
+        here = ~(left | right)
+
+        # The median endpoint can fall in a gap between intervals, leaving
+        # this node empty. Recursion still ends: the median lies within the
+        # endpoints' range, so neither side takes every interval
+        node_pos = positions[here]
+        by_start = node_pos[np.argsort(self.starts[node_pos], kind='stable')]
+        by_end = node_pos[np.argsort(self.ends[node_pos], kind='stable')]
+
+        return _Node(
+            center,
+            by_start,
+            self.starts[by_start],
+            by_end,
+            self.ends[by_end],
+            self._build(positions[left]),
+            self._build(positions[right]),
+        )
+
+    def _overlap_positions(self, low: int, high: int) -> np.ndarray:
+        """Positions of intervals overlapping ``[low, high]``."""
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if high < node.center:
+                # Node intervals all reach past high; keep those starting by high
+                found.append(node.by_start[:np.searchsorted(node.starts, high, side='right')])
+                stack.append(node.left)
+            elif low > node.center:
+                # Node intervals all start before low; keep those ending at or after low
+                found.append(node.by_end[np.searchsorted(node.ends, low, side='left'):])
+                stack.append(node.right)
+            else:
+                found.append(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(found))
+
+    def active_in(self, year: int) -> np.ndarray:
+        """
+        Labels of dedications active in a year (``start <= year <= end``).
+
+        Args:
+            year: Year to query
+
+        Returns:
+            Array of row labels
+        """
+        return self.labels[self._overlap_positions(year, year)]
+
+    def overlapping(self, start: int, end: int) -> np.ndarray:
+        """
+        Labels of dedications active at any point in ``[start, end]``.
+
+        Args:
+            start: First year of the window
+            end: Last year of the window (inclusive)
+
+        Returns:
+            Array of row labels
+        """
+        if end < start:
+            raise ValueError("Window end must not precede start")
+        return self.labels[self._overlap_positions(start, end)]
+
+    def count_active(self, years) -> np.ndarray:
+        """
+        Number of dedications active in each given year, via binary search.
+
+        Args:
+            years: Year or array of years
+
+        Returns:
+            Count (scalar input) or array of counts
+        """
+        y = np.asarray(years, dtype=np.int64)
+        started = np.searchsorted(self._sorted_starts, y, side='right')
+        ended = np.searchsorted(self._sorted_ends, y, side='left')
+        return started - ended
+
+    def active_counts(
+        self,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+    ) -> pd.Series:
+        """
+        Active dedication count for every year in a range from one sweep.
+
+        Each interval adds +1 at its start and -1 after its end; a cumulative
+        sum over the year axis gives every year's count at once.
+
+        Args:
+            first_year: First year (defaults to earliest start)
+            last_year: Last year (defaults to latest end)
+
+        Returns:
+            Series of counts indexed by year
+        """
+        if len(self) == 0:
+            return pd.Series(dtype=np.int64, name='active')
+
+        first = int(self.starts.min()) if first_year is None else first_year
+        last = int(self.ends.max()) if last_year is None else last_year
+        if last < first:
+            raise ValueError("Range end must not precede start")
+        width = last - first + 2
+
+        open_at = np.clip(self.starts - first, 0, width - 1)
+        close_at = np.clip(self.ends - first + 1, 0, width - 1)
+        deltas = (
+            np.bincount(open_at, minlength=width)
+            - np.bincount(close_at, minlength=width)
+        )
+        counts = np.cumsum(deltas)[:width - 1]
+
+        return pd.Series(counts, index=pd.RangeIndex(first, last + 1, name='year'), name='active')
@@ -0,0 +1,155 @@
+"""Longitudinal petition lifecycles across yearly dedication snapshots."""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.extractors.parquet import DEDICATION_COLUMNS
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+from ag_dedicated.utils.validation import decode_petitions
+
+
+LIFECYCLE_STATUSES = ['active', 'renewed', 'expired', 'terminated']
+"""
+Lifecycle outcomes:
+
+- active: present in the latest snapshot
+- renewed: followed by a new petition on the same TMK
+- expired: last seen in or just before its end year
+- terminated: disappeared before its end year with no renewal
+"""
+
+
+def snapshot_observations(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce merged snapshot rows to one typed observation per petition, TMK, and year.
+
+    Accepts either the extractor's CSV columns or the Parquet column names.
+
+    Args:
+        df: Merged dedication rows with a snapshot year column
+
+    Returns:
+        DataFrame with tmk_key, petition, year, and end_year columns
+    """
+    renamed = df.rename(columns=DEDICATION_COLUMNS)
+
+    if 'tmk_key' in renamed.columns:
+        tmk_key = renamed['tmk_key'].to_numpy(dtype=np.int64)
+    else:
+        tmk_key = encode_tmks(renamed['tmk'])
+
+    obs = pd.DataFrame({
+        'tmk_key': tmk_key,
+        'petition': renamed['petition'].astype('string').str.strip().to_numpy(),
+        'year': pd.to_numeric(renamed['year'], errors='coerce').to_numpy(),
+        'end_year': pd.to_numeric(renamed['end_year'], errors='coerce').to_numpy(),
+    })
+
+    valid = (obs['tmk_key'] != TMK_NULL) & obs['petition'].notna() & obs['year'].notna()
+    obs = obs[valid]
+    obs['year'] = obs['year'].astype(np.int16)
+
+    # Overlapping PDF pages can repeat a row within a snapshot
+    return obs.groupby(['tmk_key', 'petition', 'year'], as_index=False, sort=True)['end_year'].max()
+
+
+def build_lifecycle(df: pd.DataFrame, snapshot_years: Optional[list[int]] = None) -> pd.DataFrame:
+    """
+    Build one lifecycle row per petition and TMK from yearly snapshots.
+
+    Everything is done with sorts, groupby aggregates, and an as-of merge,
+    so cost grows as O(n log n) in the number of snapshot rows.
+
+    Args:
+        df: Merged dedication rows (e.g. merged_output.csv or the Parquet dataset)
+        snapshot_years: All snapshot years, used to count gaps. Defaults to
+            the years present in ``df``.
+
+    Returns:
+        DataFrame with columns tmk_key, petition, petition_key, term,
+        first_seen, last_seen, n_snapshots, gaps, end_year,
+        end_year_changes, left_censored, status, renewed_by, renews
+    """
+    obs = snapshot_observations(df)
+
+    years = np.array(sorted(snapshot_years or obs['year'].unique()), dtype=np.int16)
+    latest = years.max()
+
+    grouped = obs.groupby(['tmk_key', 'petition'], sort=False)
+    life = grouped.agg(
+        first_seen=('year', 'min'),
+        last_seen=('year', 'max'),
+        n_snapshots=('year', 'size'),
+        end_year=('end_year', 'last'),
+        end_year_values=('end_year', 'nunique'),
+    ).reset_index()
+
+    # Gaps: snapshots between first and last sighting where the petition was absent
+    first = np.searchsorted(years, life['first_seen'])
+    span = np.searchsorted(years, life['last_seen']) - first + 1
+    life['gaps'] = (span - life['n_snapshots']).astype(np.int16)
+    life['end_year_changes'] = (life.pop('end_year_values') - 1).clip(lower=0).astype(np.int8)
+    life['end_year'] = life['end_year'].astype('Int16')
+    life['n_snapshots'] = life['n_snapshots'].astype(np.int16)
+    life['left_censored'] = life['first_seen'] == years.min()
+
+    # Renewal links: the next petition to appear on the same TMK, if it
+    # shows up no later than the snapshot after this one was last seen
+    life = life.sort_values(['first_seen', 'tmk_key', 'petition'], ignore_index=True)
+    successors = life[['tmk_key', 'first_seen', 'petition']].rename(columns={
+        'first_seen': 'next_first_seen',
+        'petition': 'next_petition',
+    })
+    linked = pd.merge_asof(
+        life[['tmk_key', 'first_seen']],
+        successors,
+        left_on='first_seen',
+        right_on='next_first_seen',
+        by='tmk_key',
+        direction='forward',
+        allow_exact_matches=False,
+    )
+    next_index = np.searchsorted(years, life['last_seen']) + 1
+    next_year = years[np.minimum(next_index, len(years) - 1)]
+    window = np.where(next_index < len(years), next_year, latest + 1)
+    renews_ok = linked['next_first_seen'].notna() & (linked['next_first_seen'] <= window)
+    life['renewed_by'] = linked['next_petition'].where(renews_ok).astype('string')
+
+    predecessors = life.loc[renews_ok, ['tmk_key', 'renewed_by', 'petition']].rename(
+        columns={'renewed_by': 'successor', 'petition': 'renews'}
+    )
+    life = life.merge(
+        predecessors.drop_duplicates(['tmk_key', 'successor'], keep='last'),
+        left_on=['tmk_key', 'petition'],
+        right_on=['tmk_key', 'successor'],
+        how='left',
+    ).drop(columns='successor')
+    life['renews'] = life['renews'].astype('string')
+
+    status = np.select(
+        [
+            life['last_seen'] == latest,
+            life['renewed_by'].notna(),
+            life['end_year'].isna() | (life['end_year'] <= life['last_seen'] + 1),
+        ],
+        ['active', 'renewed', 'expired'],
+        default='terminated',
+    )
+    life['status'] = pd.Categorical(status, categories=LIFECYCLE_STATUSES)
+
+    decoded = decode_petitions(life['petition'])
+    life.insert(2, 'petition_key', decoded['petition_key'].to_numpy())
+    life.insert(3, 'term', decoded['term'].array)
+
+    life['petition'] = life['petition'].astype('string')
+    life = life.sort_values(['tmk_key', 'first_seen', 'petition'], ignore_index=True)
+
+    counts = life['status'].value_counts()
+    logger.info(
+        f"Built lifecycle for {len(life):,} petitions from {len(obs):,} observations "
+        f"across {len(years)} snapshots: {counts.to_dict()}"
+    )
+    return life
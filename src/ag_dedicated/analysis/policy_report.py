@@ -0,0 +1,371 @@
+"""
+County policy comparison report: statute CSVs, figures, and a text summary.
+
+Each figure is a task whose cache key hashes its input files, its
+parameters, and its rendering code. Figures whose key matches the last
+build are reused; the rest render in a process pool.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.pipeline.dag import HashCache, write_if_changed
+from ag_dedicated.utils.profiling import stage
+
+
+# Qualitative comparisons from the county program documentation (not in config.yaml)
+REQUIREMENTS_TABLE = {
+    'Honolulu': {
+        'Land Use Minimum': '75%',
+        'Income Requirement': 'Revenue-gen',
+        'Application Deadline': 'No deadline',
+        'Recent Changes': 'Stable',
+    },
+    'Hawaii': {
+        'Land Use Minimum': 'Not specified',
+        'Income Requirement': '$2,000/year',
+        'Application Deadline': 'No deadline',
+        'Recent Changes': '2023 reforms',
+    },
+    'Maui': {
+        'Land Use Minimum': 'Not specified',
+        'Income Requirement': 'Not specified',
+        'Application Deadline': 'Sept 1',
+        'Recent Changes': 'Ongoing review',
+    },
+    'Kauai': {
+        'Land Use Minimum': 'Commercial farming',
+        'Income Requirement': 'Not specified',
+        'Application Deadline': 'July 1',
+        'Recent Changes': 'Ord. 1132 (new)',
+    },
+}
+
+FLEXIBILITY_SCORES = {
+    'Honolulu': {
+        'Period Options': 2,
+        'Assessment Methods': 1,
+        'Deadline Flexibility': 2,  # No deadline
+        'Requirements Clarity': 2,  # Clear requirements
+    },
+    'Hawaii': {
+        'Period Options': 2,
+        'Assessment Methods': 3,  # Multiple programs
+        'Deadline Flexibility': 2,  # No deadline
+        'Requirements Clarity': 2,  # Clear income requirement
+    },
+    'Maui': {
+        'Period Options': 4,  # Most options
+        'Assessment Methods': 1,
+        'Deadline Flexibility': 0,  # Fixed deadline
+        'Requirements Clarity': 0,  # Less clear
+    },
+    'Kauai': {
+        'Period Options': 1,  # Least options
+        'Assessment Methods': 1,
+        'Deadline Flexibility': 0,  # Fixed deadline
+        'Requirements Clarity': 1,  # Recent changes
+    },
+}
+
+KEY_FINDINGS = [
+    "Maui offers the most flexibility in dedication periods (4 options)",
+    "Hawaii has the clearest income requirement ($2,000/year)",
+    "Honolulu and Hawaii allow rolling applications (no deadline)",
+    "Recent reforms in Hawaii and Kauai show active policy evolution",
+]
+
+
+def _pyplot():
+    """Import pyplot with a non-interactive backend (safe in worker processes)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set_style('whitegrid')
+    return plt, sns
+
+
+def render_dedication_periods(inputs: Sequence[Path], params: Dict[str, Any], path: Path) -> None:
+    """Heatmap of period availability and count of options per county."""
+    plt, sns = _pyplot()
+    periods = pd.read_csv(inputs[0]).set_index('County').astype(int)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    sns.heatmap(periods, annot=True, cmap='YlGn', cbar_kws={'label': 'Available'},
+                fmt='d', ax=ax1, linewidths=1, linecolor='gray')
+    ax1.set_title('Dedication Period Availability by County', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('')
+    ax1.set_ylabel('County', fontsize=12)
+
+    counts = periods.sum(axis=1)
+    counts.plot(kind='barh', color='steelblue', ax=ax2)
+    ax2.set_title('Number of Dedication Period Options', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Number of Options', fontsize=12)
+    ax2.set_ylabel('County', fontsize=12)
+    ax2.grid(axis='x', alpha=0.3)
+    for i, v in enumerate(counts):
+        ax2.text(v + 0.1, i, str(int(v)), va='center', fontweight='bold')
+
+    fig.tight_layout()
+    fig.savefig(path, dpi=params['dpi'], bbox_inches='tight', format='png')
+    plt.close(fig)
+
+
+def render_requirements(inputs: Sequence[Path], params: Dict[str, Any], path: Path) -> None:
+    """Eligibility requirements as a styled table."""
+    plt, _ = _pyplot()
+    table_df = pd.DataFrame(params['requirements']).T
+
+    fig, ax = plt.subplots(figsize=(14, 6))
+    ax.axis('tight')
+    ax.axis('off')
+    table = ax.table(cellText=table_df.values, rowLabels=table_df.index, colLabels=table_df.columns,
+                     cellLoc='left', loc='center', colWidths=[0.15, 0.15, 0.2, 0.15])
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 2)
+
+    for i in range(len(table_df.columns)):
+        table[(0, i)].set_facecolor('#4472C4')
+        table[(0, i)].set_text_props(weight='bold', color='white')
+    colors = ['#E7E6E6', '#FFFFFF']
+    for i in range(1, len(table_df) + 1):
+        for j in range(-1, len(table_df.columns)):
+            table[(i, j)].set_facecolor(colors[i % 2])
+
+    ax.set_title('Eligibility Requirements Comparison', fontsize=16, fontweight='bold', pad=20)
+    fig.savefig(path, dpi=params['dpi'], bbox_inches='tight', format='png')
+    plt.close(fig)
+
+
+def render_flexibility(inputs: Sequence[Path], params: Dict[str, Any], path: Path) -> None:
+    """Stacked flexibility score components and overall ranking."""
+    plt, _ = _pyplot()
+    scores = pd.DataFrame(params['scores']).T
+    totals = scores.sum(axis=1)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    colors = ['#4472C4', '#ED7D31', '#A5A5A5', '#FFC000']
+    scores.plot(kind='barh', stacked=True, ax=ax1, color=colors)
+    ax1.set_title('Policy Flexibility Components', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Flexibility Score', fontsize=12)
+    ax1.set_ylabel('County', fontsize=12)
+    ax1.legend(title='Components', bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax1.grid(axis='x', alpha=0.3)
+
+    totals.plot(kind='barh', color='steelblue', ax=ax2)
+    ax2.set_title('Overall Flexibility Ranking', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Total Score', fontsize=12)
+    ax2.set_ylabel('County', fontsize=12)
+    ax2.grid(axis='x', alpha=0.3)
+    for i, v in enumerate(totals):
+        ax2.text(v + 0.2, i, str(int(v)), va='center', fontweight='bold')
+
+    fig.tight_layout()
+    fig.savefig(path, dpi=params['dpi'], bbox_inches='tight', format='png')
+    plt.close(fig)
+
+
+def _render(render: Callable, inputs: Sequence[Path], params: Dict[str, Any], path: Path) -> None:
+    """Render one figure (runs in a worker process); write then rename."""
+    tmp = path.with_name(path.name + '.tmp')
+    render(inputs, params, tmp)
+    tmp.replace(path)
+
+
+class FigureTask:
+    """One figure: its renderer, input files, parameters, and output path."""
+
+    def __init__(
+        self,
+        path: Path,
+        render: Callable[[Sequence[Path], Dict[str, Any], Path], None],
+        inputs: Sequence[Path] = (),
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        self.path = path
+        self.render = render
+        self.inputs = [Path(p) for p in inputs]
+        self.params = params or {}
+
+    def key(self, hashes: HashCache) -> str:
+        """Cache key from the rendering code, parameters, and input contents."""
+        digest = hashlib.sha256()
+        digest.update(inspect.getsource(self.render).encode())
+        digest.update(json.dumps(self.params, sort_keys=True, default=str).encode())
+        digest.update(hashes.paths_hash(self.inputs).encode())
+        return digest.hexdigest()
+
+    def __repr__(self) -> str:
+        return f"FigureTask({self.path.name!r})"
+
+
+class PolicyReport:
+    """
+    Build the county policy comparison report into one directory.
+
+    Writes the statute comparison CSVs and text report, the figures, and
+    ``detailed_policy_analysis.txt``. The figure cache keys are kept in
+    ``.report_cache.json`` alongside.
+    """
+
+    CACHE_FILE = '.report_cache.json'
+
+    def __init__(
+        self,
+        config: Optional[Settings] = None,
+        output_dir: Optional[Path] = None,
+        dpi: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize report builder.
+
+        Args:
+            config: Configuration (default: Settings())
+            output_dir: Report directory (default: ``paths.policy_report``)
+            dpi: Figure resolution (default: ``policy_report.dpi``)
+            workers: Render processes (default: ``policy_report.workers``, or
+                CPU count)
+        """
+        self.config = config or Settings()
+        self.output_dir = output_dir or self.config.get_path('paths.policy_report')
+        self.dpi = dpi or self.config.get('policy_report.dpi', 300)
+        self.workers = workers or self.config.get('policy_report.workers') or os.cpu_count() or 1
+        self.logger = logger.bind(name=__name__)
+
+    def tasks(self) -> List[FigureTask]:
+        """The report's figures."""
+        out = self.output_dir
+        return [
+            FigureTask(
+                out / 'dedication_periods_analysis.png', render_dedication_periods,
+                inputs=[out / 'dedication_periods.csv'], params={'dpi': self.dpi},
+            ),
+            FigureTask(
+                out / 'requirements_comparison.png', render_requirements,
+                params={'dpi': self.dpi, 'requirements': REQUIREMENTS_TABLE},
+            ),
+            FigureTask(
+                out / 'flexibility_analysis.png', render_flexibility,
+                params={'dpi': self.dpi, 'scores': FLEXIBILITY_SCORES},
+            ),
+        ]
+
+    def _load_cache(self) -> Dict[str, Any]:
+        path = self.output_dir / self.CACHE_FILE
+        if path.exists():
+            return json.loads(path.read_text())
+        return {}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        path = self.output_dir / self.CACHE_FILE
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        tmp.replace(path)
+
+    def build(self, force: bool = False) -> Dict[str, str]:
+        """
+        Write the report, rendering only figures whose inputs changed.
+
+        Text and CSV outputs are only rewritten when their contents change.
+
+        Args:
+            force: Re-render every figure
+
+        Returns:
+            Figure file name -> 'rendered' or 'cached'
+        """
+        from ag_dedicated.analysis.statute_comparison import StatuteComparison
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        comparison = StatuteComparison(self.config)
+        # Unchanged text and CSVs are not rewritten, so their hashes (the
+        # figure inputs) come straight from the cache
+        write_if_changed(
+            self.output_dir / 'comparison_report.txt', comparison.generate_comparison_report(),
+        )
+        comparison.export_to_csv(self.output_dir)
+
+        cache = self._load_cache()
+        hashes = HashCache(cache.get('files'))
+        figures = cache.get('figures', {})
+
+        keys = {}
+        stale = []
+        for task in self.tasks():
+            keys[task.path.name] = task.key(hashes)
+            changed = figures.get(task.path.name) != keys[task.path.name]
+            if force or changed or not task.path.exists():
+                stale.append(task)
+
+        status = {name: 'cached' for name in keys}
+        if stale:
+            self.logger.info(f"Rendering {len(stale)} of {len(keys)} figures at {self.dpi} dpi")
+            with stage('render'):
+                if len(stale) == 1 or self.workers <= 1:
+                    for task in stale:
+                        _render(task.render, task.inputs, task.params, task.path)
+                else:
+                    with ProcessPoolExecutor(max_workers=min(self.workers, len(stale))) as pool:
+                        futures = [
+                            pool.submit(_render, task.render, task.inputs, task.params, task.path)
+                            for task in stale
+                        ]
+                        for future in futures:
+                            future.result()
+            for task in stale:
+                status[task.path.name] = 'rendered'
+        else:
+            self.logger.info(f"All {len(keys)} figures up to date")
+
+        self._write_text_report()
+        self._save_cache({'figures': keys, 'files': hashes.entries})
+        return status
+
+    def _write_text_report(self) -> None:
+        """Write ``detailed_policy_analysis.txt`` from the exported CSVs."""
+        periods = pd.read_csv(self.output_dir / 'dedication_periods.csv')
+        requirements = pd.read_csv(self.output_dir / 'requirements.csv')
+        rule = "=" * 80 + "\n"
+        section = "-" * 80 + "\n"
+
+        lines = [
+            rule,
+            "HAWAII AGRICULTURAL DEDICATION POLICY ANALYSIS\n",
+            "Detailed Comparison Across All Counties\n",
+            rule + "\n",
+            "EXECUTIVE SUMMARY\n", section,
+            "This analysis compares agricultural land dedication programs across\n",
+            "Hawaii's four counties (Honolulu, Hawaii, Maui, Kauai), examining:\n",
+            "• Dedication period options\n",
+            "• Assessment methodologies\n",
+            "• Eligibility requirements\n",
+            "• Application procedures\n",
+            "• Recent policy changes\n\n",
+            "DEDICATION PERIODS\n", section,
+            periods.to_string(index=False), "\n\n",
+            "REQUIREMENTS\n", section,
+            requirements.to_string(index=False), "\n\n",
+            "FLEXIBILITY SCORES\n", section,
+        ]
+        for county, scores in FLEXIBILITY_SCORES.items():
+            lines.append(f"\n{county}:\n")
+            for metric, score in {**scores, 'Total': sum(scores.values())}.items():
+                lines.append(f"  {metric}: {score}\n")
+        lines += ["\n", "KEY FINDINGS\n", section]
+        lines += [f"{i}. {finding}\n" for i, finding in enumerate(KEY_FINDINGS, 1)]
+        lines.append("\n")
+
+        write_if_changed(self.output_dir / 'detailed_policy_analysis.txt', ''.join(lines))
@@ -0,0 +1,352 @@
+"""
+Monte Carlo policy scenarios: how county revenue and dedication enrollment
+respond to changes in the ``counties`` rules.
+
+A scenario is a set of dotted-key overrides on the ``counties`` config
+(e.g. ``{'honolulu.assessment_rates.10_year': 0.02}``). Each scenario is
+simulated over ``draws`` samples of the uncertain inputs (market values,
+gross income, renewal), batched as ``(draws, parcels)`` arrays, and the
+scenarios run in a process pool.
+
+Every scenario uses the same random stream (common random numbers), so
+differences between scenarios come from the policy, not sampling noise,
+and results do not depend on the number of workers or their scheduling.
+"""
+
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.analysis.tax_benefit import TaxRules, compute_tax_benefit
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.utils.profiling import stage
+
+
+METRICS = ('revenue', 'enrollment', 'tax_foregone')
+QUANTILES = (0.05, 0.5, 0.95)
+
+
+class Scenario:
+    """A named set of dotted-key overrides on the ``counties`` config."""
+
+    def __init__(self, name: str, overrides: Optional[Mapping[str, Any]] = None):
+        self.name = name
+        self.overrides = dict(overrides or {})
+
+    def __repr__(self) -> str:
+        return f"Scenario({self.name!r}, {self.overrides!r})"
+
+
+def _thaw(value: Any) -> Any:
+    """Plain, mutable copy of a (frozen) config section."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _lookup(counties: Mapping[str, Any], key: str) -> Any:
+    """Value at a dotted key in the counties mapping (None if absent)."""
+    node: Any = counties
+    for part in key.split('.'):
+        if not isinstance(node, Mapping) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+
+def apply_overrides(counties: Mapping[str, Any], overrides: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a ``counties`` mapping with dotted-key overrides applied.
+
+    Args:
+        counties: The ``counties`` config section
+        overrides: Mapping like ``{'hawaii.min_gross_income': 4000}``
+
+    Returns:
+        New nested dict; ``counties`` is not modified
+
+    Raises:
+        ValueError: If an override names a county that is not configured
+    """
+    result = _thaw(counties)
+    for key, value in overrides.items():
+        county, *parents, leaf = key.split('.')
+        if county not in result:
+            raise ValueError(f"Unknown county in scenario override: {key}")
+        node = result[county]
+        for part in parents:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        node[leaf] = value
+    return result
+
+
+def scenario_grid(grid: Mapping[str, Sequence[Any]], baseline: bool = True) -> List[Scenario]:
+    """
+    Every combination of the given parameter values.
+
+    Args:
+        grid: Dotted ``counties`` key -> values to try, e.g.
+            ``{'honolulu.assessment_rates.10_year': [0.01, 0.015, 0.02]}``
+        baseline: Prepend an unmodified ``baseline`` scenario, which the
+            summary's ``*_change`` columns are measured against
+
+    Returns:
+        Scenarios named ``key=value,...``
+    """
+    keys = list(grid)
+    scenarios = [Scenario('baseline')] if baseline else []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        overrides = dict(zip(keys, values))
+        scenarios.append(Scenario(','.join(f"{k}={v}" for k, v in overrides.items()), overrides))
+    return scenarios
+
+
+# Per-process simulation inputs, set once by _init_worker rather than sent with every task
+_state: Dict[str, Any] = {}
+
+
+def _init_worker(state: Dict[str, Any]) -> None:
+    """Install the shared inputs in a worker (or in this process)."""
+    global _state
+    _state = dict(state)
+
+
+def _sample_batches() -> Iterator[Tuple[slice, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Yield ``(rows, market values, gross incomes, renewal uniforms)`` per batch.
+
+    The stream is the same for every scenario, so when all draws fit in
+    one batch they are sampled once per process and reused.
+    """
+    s = _state
+    cached = s.get('sample_cache')
+    if cached is not None:
+        yield cached
+        return
+
+    market, n, draws = s['market_value'], len(s['county']), s['draws']
+    rng = np.random.default_rng(np.random.SeedSequence(s['seed']))
+    batch = max(1, s['batch_cells'] // max(n, 1))
+    for start in range(0, draws, batch):
+        size = min(batch, draws - start)
+        sample = (
+            slice(start, start + size),
+            market * np.exp(rng.normal(0, s['value_sigma'], (size, n))),
+            s['gross_income'] * np.exp(rng.normal(0, s['income_sigma'], (size, n))),
+            rng.random((size, n)),
+        )
+        if size == draws:
+            s['sample_cache'] = sample
+        yield sample
+
+
+def _simulate(overrides: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Simulate one scenario over all draws (runs in a worker process).
+
+    Returns:
+        Metric name -> ``(draws, counties)`` array
+    """
+    s = _state
+    rules = TaxRules.from_counties(apply_overrides(s['counties'], overrides))
+    county, market, term, acres = s['county'], s['market_value'], s['term'], s['acres']
+    onehot = s['onehot']
+
+    # Renewal responds to the change in each parcel's assessment discount
+    # at its point-estimate market value (deterministic per scenario)
+    point = compute_tax_benefit(rules, county, market, term, acres)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discount = np.nan_to_num(1 - point['dedicated_value'] / market)
+    renewal = np.clip(
+        s['renewal_probability'] + s['renewal_elasticity'] * (discount - s['base_discount']), 0, 1,
+    )
+
+    results = {metric: np.empty((s['draws'], onehot.shape[1])) for metric in METRICS}
+    for rows, values, income, uniform in _sample_batches():
+        out = compute_tax_benefit(rules, county, values, term, acres, gross_income=income)
+        enrolled = (uniform < renewal) & out['eligible']
+        tax = np.where(enrolled, out['tax_dedicated'], out['tax_market'])
+        foregone = np.where(enrolled, out['tax_foregone'], 0.0)
+
+        # NaN (no market value or county) contributes nothing to the sums
+        results['revenue'][rows] = np.where(np.isnan(tax), 0.0, tax) @ onehot
+        results['enrollment'][rows] = enrolled @ onehot
+        results['tax_foregone'][rows] = np.where(np.isnan(foregone), 0.0, foregone) @ onehot
+    return results
+
+
+class PolicySimulator:
+    """
+    Simulate county revenue, enrollment, and tax foregone under policy scenarios.
+
+    Uncertain inputs, sampled per parcel and draw:
+
+    - market value: the parcel's value times a lognormal factor
+      (``simulation.value_sigma``)
+    - gross income: the parcel's ``gross_income`` (or
+      ``simulation.gross_income_median`` where unknown) times a lognormal
+      factor (``simulation.income_sigma``)
+    - renewal: a parcel stays dedicated with probability
+      ``simulation.renewal_probability``, shifted by
+      ``simulation.renewal_elasticity`` times the change in its assessment
+      discount relative to the baseline rules
+
+    A parcel that renews and meets the scenario's requirements pays tax on
+    its dedicated value; every other parcel pays tax on market value.
+    """
+
+    def __init__(
+        self,
+        parcels: pd.DataFrame,
+        config: Optional[Settings] = None,
+        draws: Optional[int] = None,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize simulator.
+
+        Args:
+            parcels: Frame with ``tax_benefit.PARCEL_COLUMNS`` (see
+                ``parcels_from_map`` and ``parcels_from_scrape``)
+            config: Configuration (default: Settings())
+            draws: Samples per scenario (default: ``simulation.draws``)
+            seed: Root seed (default: ``simulation.seed``)
+            workers: Worker processes (default: ``simulation.workers``, or
+                CPU count); 1 runs in this process
+        """
+        config = config or Settings()
+        self.counties = _thaw(config.get('counties', {}))
+        self.draws = draws or config.get('simulation.draws', 1000)
+        self.seed = config.get('simulation.seed', 0) if seed is None else seed
+        self.workers = workers or config.get('simulation.workers') or os.cpu_count() or 1
+        self.logger = logger.bind(name=__name__)
+
+        rules = TaxRules.from_counties(self.counties)
+        self.county_names = rules.counties
+
+        def column(name: str, default: float = np.nan) -> np.ndarray:
+            if name not in parcels.columns:
+                return np.full(len(parcels), default)
+            return pd.to_numeric(parcels[name], errors='coerce').to_numpy(dtype=np.float64)
+
+        county = rules.county_index(parcels['county'])
+        market = column('market_value')
+        term = column('term')
+        acres = column('acres')
+        gross_income = column('gross_income')
+        income_median = config.get('simulation.gross_income_median', 10000)
+        gross_income = np.where(np.isnan(gross_income), income_median, gross_income)
+
+        onehot = np.zeros((len(parcels), len(self.county_names)))
+        known = county >= 0
+        onehot[np.flatnonzero(known), county[known]] = 1.0
+
+        point = compute_tax_benefit(rules, county, market, term, acres)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            base_discount = np.nan_to_num(1 - point['dedicated_value'] / market)
+
+        self._state = {
+            'counties': self.counties,
+            'county': county,
+            'market_value': market,
+            'term': term,
+            'acres': acres,
+            'gross_income': gross_income,
+            'onehot': onehot,
+            'base_discount': base_discount,
+            'draws': self.draws,
+            'seed': self.seed,
+            'value_sigma': config.get('simulation.value_sigma', 0.1),
+            'income_sigma': config.get('simulation.income_sigma', 0.5),
+            'renewal_probability': config.get('simulation.renewal_probability', 0.9),
+            'renewal_elasticity': config.get('simulation.renewal_elasticity', 1.0),
+            'batch_cells': config.get('simulation.batch_cells', 2_000_000),
+        }
+
+    def run(self, scenarios: Sequence[Scenario]) -> pd.DataFrame:
+        """
+        Simulate each scenario and summarize the draws.
+
+        Args:
+            scenarios: Scenarios to run (e.g. from ``scenario_grid``); the
+                first is the reference for the ``*_change`` columns
+
+        Returns:
+            One row per scenario and county plus a ``total`` row per
+            scenario, with the overridden parameters' effective values and
+            each metric's mean, std, and 5th/50th/95th percentiles
+
+        Examples:
+            >>> simulator = PolicySimulator(parcels_from_map(features, assessments))
+            >>> simulator.run(scenario_grid({'honolulu.assessment_rates.10_year': [0.01, 0.02]}))
+        """
+        for scenario in scenarios:
+            apply_overrides(self.counties, scenario.overrides)  # fail fast on bad keys
+
+        workers = min(self.workers, len(scenarios))
+        self.logger.info(
+            f"Simulating {len(scenarios):,} scenarios x {self.draws:,} draws "
+            f"over {len(self._state['county']):,} parcels ({workers} workers)"
+        )
+        started = time.perf_counter()
+        with stage('simulate'):
+            overrides = [scenario.overrides for scenario in scenarios]
+            if workers <= 1:
+                _init_worker(self._state)
+                results = [_simulate(o) for o in overrides]
+            else:
+                chunksize = max(1, len(scenarios) // (workers * 4))
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(self._state,),
+                ) as pool:
+                    results = list(pool.map(_simulate, overrides, chunksize=chunksize))
+        elapsed = time.perf_counter() - started
+        self.logger.info(f"Simulated {len(scenarios):,} scenarios in {elapsed:.1f}s")
+
+        return self._summarize(scenarios, results)
+
+    def _summarize(
+        self, scenarios: Sequence[Scenario], results: List[Dict[str, np.ndarray]],
+    ) -> pd.DataFrame:
+        """Distribution summary rows per scenario and county."""
+        params = list(dict.fromkeys(key for scenario in scenarios for key in scenario.overrides))
+        labels = self.county_names + ['total']
+
+        rows = []
+        for scenario, result in zip(scenarios, results):
+            effective = {
+                key: scenario.overrides.get(key, _lookup(self.counties, key)) for key in params
+            }
+            stats = {}
+            for metric in METRICS:
+                draws = result[metric]
+                draws = np.column_stack([draws, draws.sum(axis=1)])
+                stats[f'{metric}_mean'] = draws.mean(axis=0)
+                stats[f'{metric}_std'] = draws.std(axis=0)
+                for q, values in zip(QUANTILES, np.quantile(draws, QUANTILES, axis=0)):
+                    stats[f'{metric}_p{round(q * 100)}'] = values
+            for i, label in enumerate(labels):
+                rows.append({
+                    'scenario': scenario.name, **effective, 'county': label,
+                    **{name: values[i] for name, values in stats.items()},
+                })
+
+        summary = pd.DataFrame(rows)
+        reference = summary.groupby('county', sort=False).head(1).set_index('county')
+        for metric in ('revenue', 'enrollment'):
+            summary[f'{metric}_change'] = (
+                summary[f'{metric}_mean'] - summary['county'].map(reference[f'{metric}_mean'])
+            )
+        return summary
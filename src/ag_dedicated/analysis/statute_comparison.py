@@ -1,13 +1,16 @@
 """Statute and policy comparison across Hawaii counties."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
 from loguru import logger
 
 from ag_dedicated.config.settings import Settings
 
+# pandas is only needed for the table exports; county-info stays light without it
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class StatuteComparison:
     """
@@ -71,13 +74,15 @@ class StatuteComparison:
 
         return summary
 
-    def compare_all_counties(self) -> pd.DataFrame:
+    def compare_all_counties(self) -> 'pd.DataFrame':
         """
         Create comparison table of all counties.
 
         Returns:
             DataFrame with county comparisons
         """
+        import pandas as pd
+
         counties = self.config.get_enabled_counties()
 
         comparisons = []
@@ -91,13 +96,15 @@ class StatuteComparison:
 
         return df
 
-    def compare_dedication_periods(self) -> pd.DataFrame:
+    def compare_dedication_periods(self) -> 'pd.DataFrame':
         """
         Compare dedication period options across counties.
 
         Returns:
             DataFrame showing which periods each county offers
         """
+        import pandas as pd
+
         counties = self.config.get_enabled_counties()
 
         # Collect all unique periods
@@ -257,24 +264,29 @@ class StatuteComparison:
 
     def export_to_csv(self, output_dir: Path) -> None:
         """
-        Export comparison data to CSV files.
+        Export comparison data to CSV files, rewriting only changed ones.
 
         Args:
             output_dir: Directory for output files
         """
+        import pandas as pd
+
+        from ag_dedicated.pipeline.dag import write_if_changed
+
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Files whose contents are unchanged are left untouched
         # County summary
         summary_df = self.compare_all_counties()
-        summary_df.to_csv(output_dir / 'county_summary.csv', index=False)
+        write_if_changed(output_dir / 'county_summary.csv', summary_df.to_csv(index=False))
 
         # Dedication periods
         periods_df = self.compare_dedication_periods()
-        periods_df.to_csv(output_dir / 'dedication_periods.csv', index=False)
+        write_if_changed(output_dir / 'dedication_periods.csv', periods_df.to_csv(index=False))
 
         # Requirements
         requirements = self.compare_requirements()
         req_df = pd.DataFrame(requirements)
-        req_df.to_csv(output_dir / 'requirements.csv', index=False)
+        write_if_changed(output_dir / 'requirements.csv', req_df.to_csv(index=False))
 
         self.logger.info(f"Exported comparison data to {output_dir}")
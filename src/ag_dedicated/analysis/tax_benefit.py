@@ -0,0 +1,367 @@
+"""Estimate what agricultural dedication is worth, per parcel and per county."""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+
+
+# Columns estimate_tax_benefit reads; only county and market_value are required
+PARCEL_COLUMNS = ['county', 'market_value', 'term', 'acres', 'gross_income', 'ag_share']
+
+NO_TERM = 0
+"""Term index for programs without a fixed dedication period."""
+
+
+def _county_keys(names: pd.Series) -> pd.Series:
+    """Config keys from county names ('County of Hawaii' -> 'hawaii')."""
+    keys = names.astype('string').str.lower().str.strip()
+    return keys.str.replace(r'^(city and )?county of ', '', regex=True)
+
+
+def _money(values: Any) -> np.ndarray:
+    """Parse values like '$249,500' to float64 (NaN where missing)."""
+    text = pd.Series(values, dtype='string').str.replace(r'[$,\s]', '', regex=True)
+    return pd.to_numeric(text, errors='coerce').to_numpy(dtype=np.float64)
+
+
+class TaxRules:
+    """
+    County dedication rules compiled into lookup arrays.
+
+    ``rates[c, t]`` is the assessment rate (fraction of market value) for
+    county ``c`` and dedication term ``t`` years, and ``value_per_acre[c, t]``
+    the per-acre valuation where a program assesses by area instead. Both
+    are NaN where a county has no rule for that term. Term 0 stands for
+    programs without a fixed period.
+    """
+
+    def __init__(
+        self,
+        counties: List[str],
+        rates: np.ndarray,
+        value_per_acre: np.ndarray,
+        tax_rates: np.ndarray,
+        min_gross_income: np.ndarray,
+        min_ag_use: np.ndarray,
+    ):
+        self.counties = counties
+        self.rates = rates
+        self.value_per_acre = value_per_acre
+        self.tax_rates = tax_rates
+        self.min_gross_income = min_gross_income
+        self.min_ag_use = min_ag_use
+
+    @classmethod
+    def from_counties(cls, counties: Mapping[str, Mapping[str, Any]]) -> 'TaxRules':
+        """
+        Compile rules from a ``counties`` config mapping.
+
+        Reads ``assessment_rates`` (``'<n>_year': rate``), ``programs``
+        (``years`` with ``assessment_rate`` or ``value_per_acre``),
+        ``tax_rate`` (per $1,000), ``min_gross_income`` and
+        ``min_agricultural_use``. Rates differ by county, so a county
+        without ``tax_rate`` gets NaN taxes rather than another county's.
+
+        Args:
+            counties: Mapping of county name to its config section
+
+        Returns:
+            Compiled rules
+        """
+        names = [name.lower() for name in counties]
+        max_term = 0
+        for cfg in counties.values():
+            for key in (cfg.get('assessment_rates') or {}):
+                max_term = max(max_term, int(str(key).split('_')[0]))
+            for program in cfg.get('programs') or []:
+                max_term = max(max_term, program.get('years') or NO_TERM)
+
+        shape = (len(names), max_term + 1)
+        rates = np.full(shape, np.nan)
+        value_per_acre = np.full(shape, np.nan)
+        tax_rates = np.full(len(names), np.nan)
+        min_gross_income = np.zeros(len(names))
+        min_ag_use = np.zeros(len(names))
+
+        for c, cfg in enumerate(counties.values()):
+            for key, rate in (cfg.get('assessment_rates') or {}).items():
+                rates[c, int(str(key).split('_')[0])] = rate
+            for program in cfg.get('programs') or []:
+                term = program.get('years') or NO_TERM
+                if program.get('assessment_rate') is not None:
+                    rates[c, term] = program['assessment_rate']
+                if program.get('value_per_acre') is not None:
+                    value_per_acre[c, term] = program['value_per_acre']
+
+            if cfg.get('tax_rate') is not None:
+                tax_rates[c] = cfg['tax_rate']
+            min_gross_income[c] = cfg.get('min_gross_income') or 0.0
+            min_ag_use[c] = cfg.get('min_agricultural_use') or 0.0
+
+        return cls(names, rates, value_per_acre, tax_rates, min_gross_income, min_ag_use)
+
+    @classmethod
+    def from_config(cls, config: Optional[Settings] = None) -> 'TaxRules':
+        """Compile rules from the ``counties`` config section."""
+        config = config or Settings()
+        return cls.from_counties(config.get('counties', {}))
+
+    def county_index(self, counties: Any) -> np.ndarray:
+        """
+        Map county names to row indices (-1 where unknown).
+
+        Accepts config keys ('hawaii') or display names ('Honolulu',
+        'County of Kauai'), case-insensitively.
+        """
+        # Normalize the few distinct names, not every row
+        codes, uniques = pd.factorize(np.asarray(counties, dtype=object))
+        names = _county_keys(pd.Series(uniques))
+        lookup = pd.Index(self.counties).get_indexer(names).astype(np.int64)
+        return np.where(codes >= 0, lookup[codes], -1) if len(lookup) else np.full(len(codes), -1)
+
+
+def compute_tax_benefit(
+    rules: TaxRules,
+    county: np.ndarray,
+    market_value: np.ndarray,
+    term: np.ndarray,
+    acres: Optional[np.ndarray] = None,
+    gross_income: Optional[np.ndarray] = None,
+    ag_share: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Array core of the estimate: dedicated value and tax foregone per parcel.
+
+    Parcel attributes (county, term, acres) are 1-D. Value inputs
+    (market_value, gross_income, ag_share) may carry leading axes, e.g.
+    ``(draws, parcels)`` for simulation, and the outputs broadcast to match.
+
+    A parcel's dedicated value is its market value times the county's
+    assessment rate for its term, or acres times the per-acre valuation,
+    capped at market value. Parcels below the county's minimum gross income
+    or agricultural-use share, or with no rule for their county and term,
+    keep their market value. NaN inputs are not held against eligibility.
+    Taxes are NaN for counties without a configured tax rate.
+
+    Args:
+        rules: Compiled county rules
+        county: County row index per parcel (from ``rules.county_index``)
+        market_value: Market (fair) value per parcel
+        term: Dedication term in years (0 for open-ended programs)
+        acres: Parcel area, for per-acre valuations
+        gross_income: Annual agricultural gross income
+        ag_share: Fraction of the parcel in agricultural use
+
+    Returns:
+        Dict of arrays: dedicated_value, tax_market, tax_dedicated,
+        tax_foregone, eligible, rule_found
+    """
+    market_value = np.asarray(market_value, dtype=np.float64)
+    term = np.nan_to_num(np.asarray(term, dtype=np.float64), nan=-1).astype(np.int64)
+    county = np.asarray(county, dtype=np.int64)
+
+    valid = (county >= 0) & (term >= 0) & (term < rules.rates.shape[1])
+    c = np.where(valid, county, 0)
+    t = np.where(valid, term, 0)
+
+    rate = np.where(valid, rules.rates[c, t], np.nan)
+    per_acre = np.where(valid, rules.value_per_acre[c, t], np.nan)
+    acres = np.full(len(county), np.nan) if acres is None else np.asarray(acres, dtype=np.float64)
+    dedicated = np.where(np.isnan(rate), acres * per_acre, market_value * rate)
+
+    rule_found = ~np.isnan(dedicated)
+    eligible = rule_found
+    if gross_income is not None:
+        income = np.asarray(gross_income, dtype=np.float64)
+        eligible = eligible & ~(income < rules.min_gross_income[c])
+    if ag_share is not None:
+        eligible = eligible & ~(np.asarray(ag_share, dtype=np.float64) < rules.min_ag_use[c])
+
+    dedicated = np.where(eligible, np.fmin(dedicated, market_value), market_value)
+
+    mill_rate = np.where(county >= 0, rules.tax_rates[c], np.nan) / 1000
+    tax_market = market_value * mill_rate
+    tax_dedicated = dedicated * mill_rate
+
+    return {
+        'dedicated_value': dedicated,
+        'tax_market': tax_market,
+        'tax_dedicated': tax_dedicated,
+        'tax_foregone': tax_market - tax_dedicated,
+        'eligible': eligible,
+        'rule_found': rule_found,
+    }
+
+
+def estimate_tax_benefit(
+    parcels: pd.DataFrame,
+    rules: Optional[TaxRules] = None,
+) -> pd.DataFrame:
+    """
+    Market versus dedicated assessed value and tax foregone per parcel.
+
+    Args:
+        parcels: Frame with ``PARCEL_COLUMNS`` (only county and
+            market_value are required); see ``parcels_from_map`` and
+            ``parcels_from_scrape``
+        rules: Compiled rules (default: from config)
+
+    Returns:
+        ``parcels`` plus dedicated_value, tax_market, tax_dedicated,
+        tax_foregone, eligible and rule_found columns
+
+    Examples:
+        >>> parcels = parcels_from_map(load_parcel_features(path), assessments)
+        >>> result = estimate_tax_benefit(parcels)
+        >>> summarize_tax_benefit(result)
+    """
+    rules = rules or TaxRules.from_config()
+
+    def column(name: str) -> Optional[np.ndarray]:
+        if name not in parcels.columns:
+            return None
+        return pd.to_numeric(parcels[name], errors='coerce').to_numpy(dtype=np.float64)
+
+    term = column('term')
+    estimate = compute_tax_benefit(
+        rules,
+        rules.county_index(parcels['county']),
+        column('market_value'),
+        np.full(len(parcels), np.nan) if term is None else term,
+        acres=column('acres'),
+        gross_income=column('gross_income'),
+        ag_share=column('ag_share'),
+    )
+
+    result = parcels.copy()
+    for name, values in estimate.items():
+        result[name] = values
+
+    missing = int((~estimate['rule_found']).sum())
+    if missing:
+        logger.info(f"No dedication rule for {missing:,} of {len(result):,} parcels (county/term)")
+    untaxed = int((~np.isnan(estimate['dedicated_value']) & np.isnan(estimate['tax_market'])).sum())
+    if untaxed:
+        logger.warning(f"No county tax rate for {untaxed:,} parcels; their taxes are NaN")
+    return result
+
+
+def summarize_tax_benefit(result: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate an ``estimate_tax_benefit`` result by county.
+
+    Counties without a configured tax rate have NaN taxes, so the
+    ``total`` row's taxes cover only the counties that have one;
+    ``n_missing_rate`` counts the valued parcels left out that way.
+
+    Returns:
+        One row per county plus a ``total`` row, with parcel counts,
+        summed market value, dedicated value, and taxes, and
+        ``n_missing_rate``
+    """
+    value_cols = ['market_value', 'dedicated_value', 'tax_market', 'tax_dedicated', 'tax_foregone']
+    county = result['county'].astype('category')
+    keys = _county_keys(county.cat.categories.to_series()).to_numpy()
+    county = county.cat.rename_categories(keys)
+    grouped = result[value_cols + ['eligible']].groupby(county, observed=True)
+    summary = grouped[value_cols].sum(min_count=1)
+    summary.insert(0, 'eligible', grouped['eligible'].sum())
+    summary.insert(0, 'parcels', grouped.size())
+    no_rate = result['market_value'].notna() & result['tax_market'].isna()
+    summary['n_missing_rate'] = no_rate.groupby(county, observed=True).sum()
+    summary.loc['total'] = summary.sum(min_count=1)
+    counts = ['parcels', 'eligible', 'n_missing_rate']
+    summary[counts] = summary[counts].astype(np.int64)
+
+    unrated = summary.index[(summary['n_missing_rate'] > 0) & (summary.index != 'total')]
+    if len(unrated):
+        logger.warning(
+            f"Tax totals exclude {summary.loc['total', 'n_missing_rate']:,} parcels in counties "
+            f"with no tax rate: {', '.join(map(str, unrated))}"
+        )
+    summary.index.name = 'county'
+    return summary.reset_index()
+
+
+def parcels_from_map(
+    features: List[Dict[str, Any]],
+    assessments: Optional[pd.DataFrame] = None,
+    tmk_col: str = 'TMK',
+) -> pd.DataFrame:
+    """
+    Engine input from parcel map features (``website/parcels_cdl.json``).
+
+    The map's QPublic ``net_taxable`` is already assessed at the dedicated
+    rate, so it cannot stand in for market value. Market value comes from
+    ``assessments``, scraper output (e.g. ``honolulu_enriched.csv``) joined
+    on the dedicated TMK and read like ``parcels_from_scrape`` does; parcels
+    without one get NaN. The term is the longest attached petition term.
+    These parcels are already dedicated, so no agricultural-use share is
+    supplied (CDL land cover is not a substitute for the county's use
+    determination).
+
+    Args:
+        features: Parcel map features
+        assessments: Scraper output with ``tmk_col`` and ``Land_Value``
+        tmk_col: TMK column in ``assessments``
+    """
+    props = [f.get('properties', {}) for f in features]
+
+    terms = []
+    for p in props:
+        years = [
+            int(petition['type'].split('-')[0])
+            for petition in p.get('petitions') or []
+            if str(petition.get('type', '')).split('-')[0].isdigit()
+        ]
+        terms.append(max(years) if years else np.nan)
+
+    tmks = [p.get('ded_tmk') or p.get('tmk') for p in props]
+    market_value = np.full(len(props), np.nan)
+    if assessments is not None:
+        values = pd.Series(
+            _money(assessments['Land_Value']), index=encode_tmks(assessments[tmk_col]),
+        )
+        values = values[(values.index != TMK_NULL) & values.notna()]
+        values = values[~values.index.duplicated(keep='last')]
+        market_value = values.reindex(encode_tmks(tmks)).to_numpy(dtype=np.float64)
+
+    missing = int(np.isnan(market_value).sum())
+    if missing:
+        logger.warning(f"No assessed market value for {missing:,} of {len(props):,} map parcels")
+
+    return pd.DataFrame({
+        'tmk': tmks,
+        'county': [p.get('county') for p in props],
+        'market_value': market_value,
+        'term': np.array(terms, dtype=np.float64),
+        'acres': np.array([p.get('acres') for p in props], dtype=np.float64),
+    })
+
+
+def parcels_from_scrape(df: pd.DataFrame, county: str, tmk_col: str = 'TMK') -> pd.DataFrame:
+    """
+    Engine input from scraper output (e.g. ``honolulu_enriched.csv``).
+
+    Uses ``Land_Value`` as the market value (dedication applies to land),
+    and the term parsed from ``Dedication_Type`` (e.g. 'AG DEDI - 10 YEARS').
+    """
+    def text(name: str) -> pd.Series:
+        if name not in df.columns:
+            return pd.Series(pd.NA, index=df.index, dtype='string')
+        return df[name].astype('string')
+
+    term = text('Dedication_Type').str.extract(r'(\d+)\s*Y', expand=False)
+
+    return pd.DataFrame({
+        'tmk': text(tmk_col).to_numpy(),
+        'county': county,
+        'market_value': _money(text('Land_Value')),
+        'term': pd.to_numeric(term, errors='coerce').to_numpy(dtype=np.float64),
+        'acres': _money(text('Acres')),
+    })
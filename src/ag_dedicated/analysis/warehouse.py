@@ -0,0 +1,218 @@
+"""Embedded SQLite warehouse for indexed dedication queries."""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.extractors.parquet import read_dedications_parquet, to_dedication_table
+from ag_dedicated.utils.tmk import decode_tmks, encode_tmks
+
+
+# (table, column) pairs to index after loading
+INDEXES = [
+    ('dedications', 'tmk_key'),
+    ('dedications', 'petition'),
+    ('dedications', 'year'),
+    ('dedications', 'zone, end_year'),
+    ('parcels', 'tmk_key'),
+    ('land_use', 'tmk_key'),
+]
+
+
+class Warehouse:
+    """
+    SQLite database holding dedications, scrape results, and CDL land-use stats.
+
+    Tables:
+    - dedications: one row per snapshot record, with decoded TMK fields
+    - parcels: county scrape results
+    - land_use: per-parcel CDL land-use percentages from the map data
+
+    All tables carry the integer ``tmk_key`` so they join without string
+    matching.
+    """
+
+    def __init__(self, config: Optional[Settings] = None, db_path: Optional[Path] = None):
+        """
+        Initialize warehouse.
+
+        Args:
+            config: Settings instance
+            db_path: Database file (default from config)
+        """
+        self.config = config or Settings()
+        self.db_path = db_path or self.config.get_path('paths.warehouse')
+        self.logger = logger.bind(name=__name__)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Open (or reuse) a connection to the warehouse file."""
+        if self._conn is None:
+            if not self.db_path.exists():
+                raise FileNotFoundError(
+                    f"Warehouse not found at {self.db_path}. "
+                    "Run: ag-dedicated warehouse build"
+                )
+            self._conn = sqlite3.connect(self.db_path)
+        return self._conn
+
+    def _load_dedications(self, source: Path) -> pd.DataFrame:
+        """Load dedications from a Parquet dataset or cleaned CSV."""
+        if source.is_dir():
+            df = read_dedications_parquet(source)
+        else:
+            df = to_dedication_table(pd.read_csv(source)).to_pandas()
+
+        fields = decode_tmks(df['tmk_key'])
+        df = pd.concat([df.reset_index(drop=True), fields], axis=1)
+        df['petition_prefix'] = df['petition_prefix'].astype('string')
+        return df
+
+    def _load_scrape_results(self, paths: Sequence[Path]) -> pd.DataFrame:
+        """Load and concatenate county scrape output CSVs."""
+        frames = []
+        for path in paths:
+            df = pd.read_csv(path, dtype=str)
+            tmk_col = 'TMK' if 'TMK' in df.columns else 'identifier'
+            df.insert(0, 'tmk_key', encode_tmks(df[tmk_col]))
+            df.insert(1, 'source', path.name)
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def _load_land_use(self, parcels_path: Path) -> pd.DataFrame:
+        """Load scalar CDL properties from the parcel map GeoJSON."""
+        with open(parcels_path, 'r') as f:
+            features = json.load(f).get('features', [])
+
+        df = pd.DataFrame([feat.get('properties', {}) for feat in features])
+        if df.empty:
+            return df
+
+        # Nested values (petition lists) live in the dedications table
+        nested = [c for c in df.columns if df[c].map(lambda v: isinstance(v, (list, dict))).any()]
+        scalar = [c for c in df.columns if c not in nested]
+        df = df[scalar]
+        tmk_col = 'ded_tmk' if 'ded_tmk' in df.columns else 'tmk'
+        df.insert(0, 'tmk_key', encode_tmks(df[tmk_col]))
+        return df
+
+    def build(
+        self,
+        dedications_path: Optional[Path] = None,
+        scrape_paths: Iterable[Path] = (),
+        parcels_path: Optional[Path] = None,
+    ) -> Path:
+        """
+        (Re)build the warehouse file from pipeline outputs.
+
+        The database is written to a temporary file and swapped in at the
+        end, so readers never see a half-built warehouse.
+
+        Args:
+            dedications_path: Parquet dataset dir or cleaned CSV (default: the
+                extractor's Parquet output if present, else cleaned_output.csv)
+            scrape_paths: Scrape result CSV files
+            parcels_path: Parcel map GeoJSON with CDL stats (default from config)
+
+        Returns:
+            Path to the warehouse file
+        """
+        output_dir = self.config.get_path('paths.output')
+        if dedications_path is None:
+            parquet_dir = output_dir / 'parquet'
+            dedications_path = (
+                parquet_dir if parquet_dir.exists() else output_dir / 'cleaned_output.csv'
+            )
+
+        if parcels_path is None:
+            parcels_path = self.config.get_path('paths.parcel_map')
+
+        tables = {'dedications': self._load_dedications(dedications_path)}
+        self.logger.info(f"Loaded {len(tables['dedications']):,} dedication rows")
+
+        scrape_paths = list(scrape_paths)
+        if scrape_paths:
+            tables['parcels'] = self._load_scrape_results(scrape_paths)
+            self.logger.info(f"Loaded {len(tables['parcels']):,} scraped parcel rows")
+
+        if parcels_path.exists():
+            tables['land_use'] = self._load_land_use(parcels_path)
+            self.logger.info(f"Loaded {len(tables['land_use']):,} land-use rows")
+        else:
+            self.logger.warning(f"Parcel map data not found at {parcels_path}")
+
+        self.close()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.db_path.with_suffix(self.db_path.suffix + '.tmp')
+        tmp_path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            for name, df in tables.items():
+                if not df.empty:
+                    df.to_sql(name, conn, index=False, chunksize=10_000)
+
+            existing = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+            for table, columns in INDEXES:
+                if table in existing:
+                    name = f"idx_{table}_{columns.replace(', ', '_')}"
+                    conn.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+
+        tmp_path.replace(self.db_path)
+        self.logger.info(f"Warehouse built at {self.db_path}")
+        return self.db_path
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        """
+        Run a SQL query against the warehouse.
+
+        Args:
+            sql: SQL statement
+            params: Optional query parameters
+
+        Returns:
+            Query result as DataFrame
+
+        Examples:
+            >>> wh = Warehouse()
+            >>> wh.query(
+            ...     "SELECT * FROM dedications WHERE zone = ? AND end_year < ?",
+            ...     (4, 2026),
+            ... )
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def tables(self) -> list[str]:
+        """List warehouse tables."""
+        rows = self.connection.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
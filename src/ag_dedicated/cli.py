@@ -1,38 +1,139 @@
-"""Command-line interface for ag-dedicated."""
+"""
+Command-line interface for ag-dedicated.
+
+Heavy dependencies (pandas, tabula, scrapers, pyarrow) are imported inside
+the commands that use them, so ``--help``, ``info`` and ``county-info``
+start without loading them. tests/test_import_time.py guards this.
+"""
 
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from ag_dedicated import config
-from ag_dedicated.analysis.statute_comparison import StatuteComparison
-from ag_dedicated.extractors.pdf_extractor import PDFExtractor
-from ag_dedicated.scrapers.honolulu import HonoluluScraper
-from ag_dedicated.scrapers.hawaii import HawaiiScraper
-from ag_dedicated.scrapers.maui import MauiScraper
-from ag_dedicated.scrapers.kauai import KauaiScraper
-from ag_dedicated.utils.logging import setup_logging_from_config
 
 
-console = Console()
+class _LazyConsole:
+    """rich Console created on first use, so ``--help`` doesn't import rich."""
+
+    _console = None
+
+    def __getattr__(self, name: str):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+
+# Commands that only print configuration; they skip logging setup (and the
+# loguru import) so they start fast in cron wrappers
+QUIET_COMMANDS = {'info'}
+
+
+class MainGroup(click.Group):
+    """Top-level group that notes ``--help`` anywhere on the command line."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        # Subcommand help is handled after the group callback runs
+        ctx.meta['help_requested'] = any(arg in ctx.help_option_names for arg in args)
+        return super().parse_args(ctx, args)
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return 'n/a'
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:,.0f} {unit}" if unit == 'B' else f"{size:,.1f} {unit}"
+        size /= 1024
+
+
+def _print_profile(report: dict) -> None:
+    """Summarize a --profile report: time per stage, peak memory, allocators."""
+    from rich.table import Table
+
+    table = Table(title=f"Profile: {report['command']}")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall (s)", style="green", justify="right")
+    table.add_column("CPU (s)", style="yellow", justify="right")
+    table.add_column("% of wall", justify="right")
+
+    total = report['wall'] or 1.0
+    for name, entry in sorted(report['stages'].items(), key=lambda item: -item[1]['wall']):
+        table.add_row(
+            name,
+            str(entry['calls']),
+            f"{entry['wall']:.2f}",
+            f"{entry['cpu']:.2f}",
+            f"{entry['wall'] / total:.0%}",
+        )
+    table.add_row(
+        "[bold]total[/bold]", "", f"{report['wall']:.2f}", f"{report['cpu']:.2f}", "100%",
+        end_section=True,
+    )
+    console.print(table)
+
+    console.print(
+        f"Peak RSS: [bold]{_format_bytes(report['peak_rss'])}[/bold]   "
+        f"Peak traced Python memory: [bold]{_format_bytes(report['peak_traced'])}[/bold]"
+    )
+
+    if report['allocations']:
+        alloc_table = Table(title="Top allocations still held (tracemalloc)")
+        alloc_table.add_column("Location", style="cyan", overflow="fold")
+        alloc_table.add_column("Size", style="green", justify="right")
+        alloc_table.add_column("Blocks", justify="right")
+        for location, size, count in report['allocations']:
+            alloc_table.add_row(location, _format_bytes(size), f"{count:,}")
+        console.print(alloc_table)
+
+    if report['cprofile_path']:
+        console.print(
+            f"cProfile written to {report['cprofile_path']} (view with: python -m pstats)"
+        )
 
 
-@click.group()
+@click.group(cls=MainGroup)
 @click.option('--debug', is_flag=True, help='Enable debug logging')
-def main(debug: bool):
+@click.option(
+    '--profile',
+    is_flag=True,
+    help='Report wall/CPU time per stage, peak memory and top allocators (slows the run)',
+)
+@click.option(
+    '--profile-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    help='Also write a cProfile dump <command>.prof here (implies --profile)',
+)
+@click.pass_context
+def main(ctx: click.Context, debug: bool, profile: bool, profile_dir: Optional[Path]):
     """
     AG-Dedicated: Hawaii Agricultural Dedication Analysis Tool
 
     Analyze agricultural property tax dedications across all Hawaii counties.
     """
+    if ctx.meta['help_requested']:
+        return
+
+    if profile or profile_dir:
+        from ag_dedicated.utils.profiling import Profiler
+
+        profiler = Profiler(ctx.invoked_subcommand or 'main', cprofile_dir=profile_dir).start()
+        ctx.call_on_close(lambda: _print_profile(profiler.stop()))
+
     # Setup logging
     if debug:
-        config._config['logging']['level'] = 'DEBUG'
+        config.reload(overrides={'logging.level': 'DEBUG'})
 
-    setup_logging_from_config(config)
+    if ctx.invoked_subcommand not in QUIET_COMMANDS:
+        from ag_dedicated.utils.logging import setup_logging_from_config
+
+        setup_logging_from_config(config)
     config.ensure_directories()
 
 
@@ -49,6 +150,10 @@ def main(debug: bool):
 )
 def extract(pdf_dir: Optional[Path], output_dir: Optional[Path]):
     """Extract dedication data from PDF reports."""
+    from rich.table import Table
+
+    from ag_dedicated.extractors.pdf_extractor import PDFExtractor
+
     console.print("\n[bold blue]PDF Extraction Pipeline[/bold blue]\n")
 
     extractor = PDFExtractor(config)
@@ -107,6 +212,8 @@ def scrape(
     """Scrape parcel data from county databases."""
     import pandas as pd
 
+    from ag_dedicated.scrapers import SCRAPERS
+
     console.print(f"\n[bold blue]Scraping {county.title()} County Parcels[/bold blue]\n")
 
     # Load input file
@@ -118,14 +225,7 @@ def scrape(
         return
 
     # Create appropriate scraper
-    scrapers = {
-        'honolulu': HonoluluScraper,
-        'hawaii': HawaiiScraper,
-        'maui': MauiScraper,
-        'kauai': KauaiScraper,
-    }
-
-    ScraperClass = scrapers[county]
+    ScraperClass = SCRAPERS[county]
 
     with ScraperClass(config) as scraper:
         result_df = scraper.scrape_from_dedication_list(
@@ -139,6 +239,89 @@ def scrape(
             console.print(f"\n[bold green]✓ Saved {len(result_df):,} records to {output_file}[/bold green]")
 
 
+@main.command()
+@click.argument('stages', nargs=-1)
+@click.option('--force', is_flag=True, help='Run stages even if their inputs are unchanged')
+@click.option('--dry-run', is_flag=True, help='Show which stages would run')
+@click.option(
+    '--workers',
+    type=int,
+    help='Maximum stages running at once (default from config)',
+)
+@click.option(
+    '--scrape/--no-scrape',
+    default=None,
+    help='Include the county scrape stage (default from config)',
+)
+@click.option(
+    '--max-parcels',
+    type=int,
+    help='Maximum number of parcels to scrape',
+)
+def run(
+    stages: tuple,
+    force: bool,
+    dry_run: bool,
+    workers: Optional[int],
+    scrape: Optional[bool],
+    max_parcels: Optional[int],
+):
+    """
+    Run the full pipeline, skipping stages whose inputs are unchanged.
+
+    Optionally name STAGES to bring up to date (with their dependencies).
+    """
+    from rich.table import Table
+
+    from ag_dedicated.pipeline import build_pipeline
+
+    pipeline = build_pipeline(config, scrape=scrape, max_parcels=max_parcels)
+
+    console.print("\n[bold blue]Pipeline Run[/bold blue]\n")
+
+    try:
+        results = pipeline.run(
+            targets=stages or None,
+            force=force,
+            workers=workers or config.get('pipeline.workers', 4),
+            dry_run=dry_run,
+        )
+    except ValueError as e:
+        console.print(f"[bold red]✗ {e}[/bold red]")
+        raise SystemExit(1)
+
+    styles = {
+        'ran': 'green',
+        'skipped': 'dim',
+        'planned': 'yellow',
+        'failed': 'bold red',
+        'blocked': 'red',
+    }
+
+    table = Table(title="Stages")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Depends on")
+    table.add_column("Status")
+    table.add_column("Seconds", justify="right")
+
+    for name, result in results.items():
+        status = result['status']
+        table.add_row(
+            name,
+            ', '.join(pipeline.dependencies(name)) or '-',
+            f"[{styles[status]}]{status}[/{styles[status]}]",
+            f"{result['seconds']:.1f}" if status == 'ran' else '',
+        )
+
+    console.print(table)
+
+    failed = [name for name, result in results.items() if result['status'] == 'failed']
+    if failed:
+        for name in failed:
+            console.print(f"[bold red]✗ {name}: {results[name]['error']}[/bold red]")
+        raise SystemExit(1)
+
+
 @main.command()
 @click.option(
     '--output-dir',
@@ -153,6 +336,8 @@ def scrape(
 )
 def compare(output_dir: Optional[Path], format: str):
     """Compare agricultural dedication statutes across counties."""
+    from ag_dedicated.analysis.statute_comparison import StatuteComparison
+
     console.print("\n[bold blue]County Statute Comparison[/bold blue]\n")
 
     comparison = StatuteComparison(config)
@@ -177,9 +362,253 @@ def compare(output_dir: Optional[Path], format: str):
         console.print(f"\n[green]Saved CSV files to {output_dir}[/green]")
 
 
+@main.command()
+@click.option(
+    '--output-dir',
+    type=click.Path(path_type=Path),
+    help='Report directory (default: paths.policy_report)',
+)
+@click.option('--dpi', type=int, help='Figure resolution (default: policy_report.dpi)')
+@click.option('--workers', type=int, help='Figure render processes (default: CPU count)')
+@click.option('--force', is_flag=True, help='Re-render figures even if their inputs are unchanged')
+def report(output_dir: Optional[Path], dpi: Optional[int], workers: Optional[int], force: bool):
+    """Build the county policy comparison report (CSVs, figures, text)."""
+    from ag_dedicated.analysis.policy_report import PolicyReport
+
+    console.print("\n[bold blue]Policy Comparison Report[/bold blue]\n")
+
+    builder = PolicyReport(config, output_dir=output_dir, dpi=dpi, workers=workers)
+    status = builder.build(force=force)
+
+    for name, state in status.items():
+        style = 'green' if state == 'rendered' else 'dim'
+        console.print(f"  [{style}]{state:>8}[/{style}]  {name}")
+    console.print(f"\n[green]Saved report to {builder.output_dir}[/green]")
+
+
+@main.command('build-tiles')
+@click.option(
+    '--parcels',
+    type=click.Path(exists=True, path_type=Path),
+    help='Parcel map GeoJSON (default: paths.parcel_map)',
+)
+@click.option(
+    '--output-dir',
+    type=click.Path(path_type=Path),
+    help='Tile pyramid directory (default: paths.tiles)',
+)
+@click.option('--min-zoom', type=int, help='Lowest zoom level (default: tiles.min_zoom)')
+@click.option('--max-zoom', type=int, help='Highest zoom level (default: tiles.max_zoom)')
+def build_tiles(
+    parcels: Optional[Path],
+    output_dir: Optional[Path],
+    min_zoom: Optional[int],
+    max_zoom: Optional[int],
+):
+    """Write the parcel map as a static vector tile pyramid."""
+    from ag_dedicated.geo.parcels import load_parcel_features
+    from ag_dedicated.geo.tiles import build_tiles as write_tiles
+
+    console.print("\n[bold blue]Building Parcel Tiles[/bold blue]\n")
+
+    features = load_parcel_features(parcels or config.get_path('paths.parcel_map'))
+    output_dir = output_dir or config.get_path('paths.tiles')
+    written = write_tiles(features, output_dir, config=config, min_zoom=min_zoom, max_zoom=max_zoom)
+
+    for zoom, count in written.items():
+        console.print(f"  zoom {zoom:>2}: {count:,} tiles")
+    console.print(f"\n[green]Saved {sum(written.values()):,} tiles to {output_dir}[/green]")
+
+
+@main.command()
+@click.argument('year_from', type=int)
+@click.argument('year_to', type=int)
+@click.option(
+    '--source',
+    type=click.Path(exists=True, path_type=Path),
+    help='Parquet dataset dir or merged/cleaned CSV (default from extract output)',
+)
+@click.option(
+    '--output-file',
+    type=click.Path(path_type=Path),
+    help='Parquet file for the change set (default: data/processed/changes/)',
+)
+@click.option(
+    '--show',
+    type=int,
+    default=20,
+    help='Number of changes to print',
+)
+def diff(
+    year_from: int,
+    year_to: int,
+    source: Optional[Path],
+    output_file: Optional[Path],
+    show: int,
+):
+    """Show added, removed, renewed, and end-year-changed dedications between two years."""
+    from rich.table import Table
+
+    from ag_dedicated.analysis.changes import diff_years, write_changes
+
+    console.print(f"\n[bold blue]Dedication Changes {year_from} → {year_to}[/bold blue]\n")
+
+    if source is None:
+        output_dir = config.get_path('paths.output')
+        parquet_dir = output_dir / 'parquet'
+        source = parquet_dir if parquet_dir.exists() else output_dir / 'cleaned_output.csv'
+
+    try:
+        changes = diff_years(source, year_from, year_to)
+    except ValueError as e:
+        console.print(f"[bold red]✗ {e}[/bold red]")
+        return
+
+    if output_file is None:
+        output_file = (
+            config.get_path('paths.data.processed') / 'changes'
+            / f'changes_{year_from}_{year_to}.parquet'
+        )
+    write_changes(changes, output_file)
+
+    summary = Table(title="Changes by Type")
+    summary.add_column("Change", style="cyan")
+    summary.add_column("Count", style="green", justify="right")
+    for change, count in changes['change'].value_counts(sort=False).items():
+        summary.add_row(str(change), f"{count:,}")
+    console.print(summary)
+
+    if show:
+        detail = Table(title=f"First {min(show, len(changes))} changes")
+        for column in ['tmk_key', 'change', 'previous_petition', 'petition',
+                       'previous_end_year', 'end_year']:
+            detail.add_column(column, style="cyan")
+        for row in changes.head(show).itertuples(index=False):
+            detail.add_row(
+                str(row.tmk_key), str(row.change), str(row.previous_petition),
+                str(row.petition), str(row.previous_end_year), str(row.end_year),
+            )
+        console.print(detail)
+
+    console.print(f"\n[bold green]✓ Saved change set to {output_file}[/bold green]")
+
+
+@main.group()
+def warehouse():
+    """Manage the embedded SQLite query warehouse."""
+
+
+@warehouse.command('build')
+@click.option(
+    '--dedications',
+    type=click.Path(exists=True, path_type=Path),
+    help='Parquet dataset dir or cleaned CSV (default from extract output)',
+)
+@click.option(
+    '--scrape-file',
+    'scrape_files',
+    type=click.Path(exists=True, path_type=Path),
+    multiple=True,
+    help='Scrape result CSV to load (repeatable)',
+)
+@click.option(
+    '--parcels',
+    type=click.Path(exists=True, path_type=Path),
+    help='Parcel map GeoJSON with CDL stats (default from config)',
+)
+@click.option(
+    '--db',
+    type=click.Path(path_type=Path),
+    help='Warehouse file (default from config)',
+)
+def warehouse_build(
+    dedications: Optional[Path],
+    scrape_files: tuple[Path, ...],
+    parcels: Optional[Path],
+    db: Optional[Path],
+):
+    """Load dedications, scrape results, and land-use stats into the warehouse."""
+    from rich.table import Table
+
+    from ag_dedicated.analysis.warehouse import Warehouse
+
+    console.print("\n[bold blue]Building Warehouse[/bold blue]\n")
+
+    with Warehouse(config, db_path=db) as wh:
+        db_path = wh.build(
+            dedications_path=dedications,
+            scrape_paths=scrape_files,
+            parcels_path=parcels,
+        )
+
+        table = Table(title="Warehouse Tables")
+        table.add_column("Table", style="cyan")
+        table.add_column("Rows", style="green", justify="right")
+
+        for name in wh.tables():
+            count = wh.connection.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+            table.add_row(name, f"{count:,}")
+
+        console.print(table)
+
+    console.print(f"\n[bold green]✓ Warehouse saved to {db_path}[/bold green]")
+
+
+@main.command()
+@click.argument('sql')
+@click.option(
+    '--db',
+    type=click.Path(path_type=Path),
+    help='Warehouse file (default from config)',
+)
+@click.option(
+    '--output-file',
+    type=click.Path(path_type=Path),
+    help='Save full result to CSV instead of printing',
+)
+@click.option(
+    '--limit',
+    type=int,
+    default=50,
+    help='Maximum rows to print',
+)
+def query(sql: str, db: Optional[Path], output_file: Optional[Path], limit: int):
+    """Run SQL against the warehouse."""
+    from rich.table import Table
+
+    from ag_dedicated.analysis.warehouse import Warehouse
+
+    with Warehouse(config, db_path=db) as wh:
+        try:
+            df = wh.query(sql)
+        except FileNotFoundError as e:
+            console.print(f"[bold red]✗ {e}[/bold red]")
+            return
+        except Exception as e:
+            console.print(f"[bold red]✗ Query failed: {e}[/bold red]")
+            return
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(output_file, index=False)
+        console.print(f"[green]Saved {len(df):,} rows to {output_file}[/green]")
+        return
+
+    table = Table(title=f"{len(df):,} rows")
+    for column in df.columns:
+        table.add_column(str(column), style="cyan")
+
+    for row in df.head(limit).itertuples(index=False):
+        table.add_row(*(str(v) for v in row))
+
+    console.print(table)
+
+
 @main.command()
 def info():
     """Show configuration and system information."""
+    from rich.table import Table
+
     console.print("\n[bold blue]AG-Dedicated Configuration[/bold blue]\n")
 
     # Project info
@@ -216,6 +645,10 @@ def info():
 @click.argument('county', type=click.Choice(['honolulu', 'hawaii', 'maui', 'kauai', 'all']))
 def county_info(county: str):
     """Show detailed information about a county's dedication program."""
+    from rich.table import Table
+
+    from ag_dedicated.analysis.statute_comparison import StatuteComparison
+
     console.print(f"\n[bold blue]{county.title()} County Information[/bold blue]\n")
 
     comparison = StatuteComparison(config)
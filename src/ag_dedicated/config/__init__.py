@@ -1,5 +1,5 @@
 """Configuration module for ag-dedicated."""
 
-from ag_dedicated.config.settings import Settings
+from ag_dedicated.config.settings import ConfigSnapshot, Settings
 
-__all__ = ["Settings"]
+__all__ = ["ConfigSnapshot", "Settings"]
@@ -2,48 +2,108 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
-import yaml
 
+# Environment variables of the form AG_DEDICATED__SECTION__KEY=value override
+# config.yaml entries (here: section.key); values are parsed as YAML scalars
+ENV_PREFIX = 'AG_DEDICATED__'
 
-class Settings:
+
+class FrozenDict(dict):
+    """Read-only dict for nested config sections handed out by ``get``."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are read-only; use Settings.reload(overrides=...)")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only equivalents."""
+    if isinstance(value, dict):
+        return FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _flatten(node: Mapping[str, Any], prefix: str, flat: Dict[str, Any]) -> None:
+    """Record every dotted key path (sections and leaves) in ``flat``."""
+    for key, value in node.items():
+        dotted = f"{prefix}{key}"
+        flat[dotted] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{dotted}.", flat)
+
+
+def _set_dotted(data: Dict[str, Any], key: str, value: Any) -> None:
+    """Set a dotted key in nested dicts, creating sections as needed."""
+    *parents, leaf = key.split('.')
+    node = data
+    for part in parents:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            child = node[part] = {}
+        node = child
+    node[leaf] = value
+
+
+def env_overrides(environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
     """
-    Configuration settings loaded from config.yaml.
+    Collect ``AG_DEDICATED__...`` overrides from the environment.
+
+    Double underscores separate levels, and names are lower-cased, so
+    ``AG_DEDICATED__PIPELINE__WORKERS=8`` sets ``pipeline.workers`` to 8.
 
-    Provides convenient access to configuration values with support
-    for environment variable overrides.
+    Args:
+        environ: Environment mapping (default: ``os.environ``)
+
+    Returns:
+        Mapping of dotted key to parsed value
     """
+    import yaml
 
-    _instance = None
-    _config: Dict[str, Any] = {}
+    environ = os.environ if environ is None else environ
+    overrides = {}
+    for name, raw in environ.items():
+        if name.startswith(ENV_PREFIX) and len(name) > len(ENV_PREFIX):
+            key = name[len(ENV_PREFIX):].lower().replace('__', '.')
+            overrides[key] = yaml.safe_load(raw) if raw.strip() else None
+    return overrides
 
-    def __new__(cls):
-        """Singleton pattern to ensure single config instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_config()
-        return cls._instance
 
-    def _load_config(self) -> None:
-        """Load configuration from YAML file."""
-        # Find project root (where config/ directory is)
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent.parent
+class ConfigSnapshot:
+    """
+    Frozen, flattened view of the configuration.
 
-        config_path = project_root / "config" / "config.yaml"
+    Every dotted key path is compiled into one dict at load time, so
+    ``get`` is a single hash lookup. Snapshots are immutable and picklable,
+    so they can be sent to worker processes in place of ``Settings``.
+    """
 
-        if not config_path.exists():
-            raise FileNotFoundError(
-                f"Configuration file not found at {config_path}. "
-                "Please ensure config/config.yaml exists in project root."
-            )
+    __slots__ = ('_flat', '_project_root', '_paths')
 
-        with open(config_path, "r") as f:
-            self._config = yaml.safe_load(f)
+    def __init__(self, data: Mapping[str, Any], project_root: Path):
+        """
+        Compile a snapshot.
 
-        # Store project root for path resolution
+        Args:
+            data: Nested configuration (overrides already applied)
+            project_root: Root that relative paths resolve against
+        """
+        flat: Dict[str, Any] = {}
+        _flatten(_freeze(dict(data)), '', flat)
+        self._flat = flat
         self._project_root = project_root
+        self._paths: Dict[str, Path] = {}
+
+    def __reduce__(self):
+        return (_restore_snapshot, (self._flat, self._project_root))
 
     @property
     def project_root(self) -> Path:
@@ -59,25 +119,15 @@ class Settings:
             default: Default value if key not found
 
         Returns:
-            Configuration value or default
+            Configuration value (sections as read-only dicts) or default
 
         Examples:
             >>> config = Settings()
             >>> config.get('counties.honolulu.name')
             'City and County of Honolulu'
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def get_path(self, key: str) -> Path:
         """
@@ -89,11 +139,13 @@ class Settings:
         Returns:
             Absolute Path object
         """
-        relative_path = self.get(key)
-        if relative_path is None:
-            raise ValueError(f"Path not found in config: {key}")
-
-        return (self.project_root / relative_path).resolve()
+        path = self._paths.get(key)
+        if path is None:
+            relative_path = self.get(key)
+            if relative_path is None:
+                raise ValueError(f"Path not found in config: {key}")
+            path = self._paths[key] = (self._project_root / relative_path).resolve()
+        return path
 
     def get_county_config(self, county: str) -> Dict[str, Any]:
         """
@@ -118,6 +170,10 @@ class Settings:
             if cfg.get('enabled', False)
         ]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flattened copy of every dotted key and its value."""
+        return dict(self._flat)
+
     def __getitem__(self, key: str) -> Any:
         """Allow dict-like access: config['key']."""
         value = self.get(key)
@@ -167,3 +223,102 @@ class Settings:
             except ValueError:
                 # Path not in config, skip
                 pass
+
+
+def _restore_snapshot(flat: Dict[str, Any], project_root: Path) -> ConfigSnapshot:
+    """Rebuild a pickled snapshot without recompiling."""
+    snapshot = ConfigSnapshot.__new__(ConfigSnapshot)
+    snapshot._flat = flat
+    snapshot._project_root = project_root
+    snapshot._paths = {}
+    return snapshot
+
+
+class Settings:
+    """
+    Configuration settings loaded from config.yaml.
+
+    The YAML file is read on first access and compiled, together with any
+    ``AG_DEDICATED__...`` environment overrides, into a frozen
+    ``ConfigSnapshot`` that serves all lookups. Pickling a ``Settings``
+    yields that snapshot, so process-pool workers get the configuration
+    without re-reading YAML.
+    """
+
+    _instance = None
+    _snapshot: Optional[ConfigSnapshot] = None
+    _overrides: Dict[str, Any] = {}
+
+    def __new__(cls):
+        """Singleton pattern to ensure single config instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def _load_config(self) -> ConfigSnapshot:
+        """Load config.yaml, apply overrides, and compile the snapshot."""
+        import yaml
+
+        # Find project root (where config/ directory is)
+        current_file = Path(__file__)
+        project_root = current_file.parent.parent.parent.parent
+
+        config_path = project_root / "config" / "config.yaml"
+
+        if not config_path.exists():
+            raise FileNotFoundError(
+                f"Configuration file not found at {config_path}. "
+                "Please ensure config/config.yaml exists in project root."
+            )
+
+        with open(config_path, "r") as f:
+            data = yaml.safe_load(f) or {}
+
+        # Environment first, then programmatic overrides (e.g. --debug)
+        for key, value in {**env_overrides(), **self._overrides}.items():
+            _set_dotted(data, key, value)
+
+        Settings._snapshot = ConfigSnapshot(data, project_root)
+        return Settings._snapshot
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The compiled configuration (loaded on first use)."""
+        return self._snapshot or self._load_config()
+
+    def reload(self, overrides: Optional[Dict[str, Any]] = None) -> ConfigSnapshot:
+        """
+        Recompile the snapshot, optionally with extra dotted-key overrides.
+
+        Args:
+            overrides: Mapping such as ``{'logging.level': 'DEBUG'}``; these
+                take precedence over environment overrides and persist
+                across later reloads
+
+        Returns:
+            New snapshot
+        """
+        if overrides:
+            Settings._overrides = {**self._overrides, **overrides}
+        return self._load_config()
+
+    def __reduce__(self):
+        return self.snapshot.__reduce__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get configuration value by dot-notation key (see ``ConfigSnapshot.get``)."""
+        return (self._snapshot or self._load_config()).get(key, default)
+
+    def __getattr__(self, name: str) -> Any:
+        # Accessors (get, get_path, data_dir, ...) are served by the snapshot
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.snapshot, name)
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-like access: config['key']."""
+        return self.snapshot[key]
+
+    def __contains__(self, key: str) -> bool:
+        """Check if key exists in configuration."""
+        return key in self.snapshot
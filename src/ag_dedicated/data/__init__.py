@@ -0,0 +1,10 @@
+"""Lazy, cached access to pipeline datasets."""
+
+from ag_dedicated.data.dataset import (
+    DedicationDataset,
+    clear_cache,
+    col,
+    load_dedications,
+)
+
+__all__ = ["DedicationDataset", "clear_cache", "col", "load_dedications"]
@@ -0,0 +1,345 @@
+"""Lazy dedication dataset with predicate and projection pushdown."""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.extractors.parquet import (
+    DEDICATION_SCHEMA,
+    PARTITIONING,
+    to_dedication_table,
+)
+from ag_dedicated.utils.tmk import TMK_FIELDS, tmk_prefix_range
+
+
+_TYPES_MAPPER = {pa.int16(): pd.Int16Dtype(), pa.int8(): pd.Int8Dtype()}.get
+
+
+def col(name: str) -> ds.Expression:
+    """
+    Reference a stored or TMK-derived column in a filter expression.
+
+    TMK fields (island, zone, section, plat, parcel, cpr) are computed from
+    ``tmk_key`` inside the scan, so they filter without a TMK string parse.
+
+    Args:
+        name: Column name
+
+    Returns:
+        pyarrow dataset expression
+
+    Examples:
+        >>> load_dedications().filter(col('year') >= 2020, col('zone') == 4)
+    """
+    if name in TMK_FIELDS:
+        mult, limit = TMK_FIELDS[name]
+        key = ds.field('tmk_key')
+        # (key // mult) % limit, spelled with operations expressions support
+        return pc.subtract(pc.divide(key, mult), pc.multiply(pc.divide(key, mult * limit), limit))
+    if name not in DEDICATION_SCHEMA.names:
+        raise KeyError(f"Unknown dedication column: {name}")
+    return ds.field(name)
+
+
+def _equals(name: str, value: Any) -> ds.Expression:
+    """Expression for a ``name=value`` keyword filter."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return col(name).isin(list(value))
+    return col(name) == value
+
+
+def _keyword_filters(equals: dict[str, Any]) -> list[ds.Expression]:
+    """
+    Turn keyword filters into expressions.
+
+    A run of scalar TMK fields from ``island`` downward becomes a single
+    ``tmk_key`` range, which Parquet row-group statistics can prune on.
+    """
+    expressions = []
+    tmk = {k: v for k, v in equals.items() if k in TMK_FIELDS and k != 'cpr'}
+    prefix = {}
+    for name in ('island', 'zone', 'section', 'plat', 'parcel'):
+        value = tmk.get(name)
+        if value is None or isinstance(value, (list, tuple, set, frozenset)):
+            break
+        prefix[name] = int(value)
+
+    if prefix:
+        low, high = tmk_prefix_range(**prefix)
+        expressions.append((ds.field('tmk_key') >= low) & (ds.field('tmk_key') < high))
+
+    for name, value in equals.items():
+        if name not in prefix:
+            expressions.append(_equals(name, value))
+    return expressions
+
+
+class ResultCache:
+    """
+    LRU cache of materialized query results, bounded by entries and bytes.
+
+    Entries are evicted least-recently-used first once either bound is
+    exceeded. A single result larger than the byte bound is not cached.
+    """
+
+    def __init__(self, max_entries: int = 16, max_bytes: int = 1024 * 1024**2):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total in-memory size of cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return a cached value and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple, value: Any, nbytes: int) -> None:
+        """Cache a value, evicting least-recently-used entries as needed."""
+        if nbytes > self.max_bytes or self.max_entries <= 0:
+            return
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self._bytes += nbytes
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def info(self) -> dict[str, int]:
+        """Cache statistics."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_cache: Optional[ResultCache] = None
+
+
+def get_cache() -> ResultCache:
+    """Shared result cache, sized from the ``dataset`` config section."""
+    global _cache
+    if _cache is None:
+        config = Settings()
+        _cache = ResultCache(
+            max_entries=config.get('dataset.cache_entries', 16),
+            max_bytes=int(config.get('dataset.cache_mb', 1024)) * 1024**2,
+        )
+    return _cache
+
+
+def clear_cache() -> None:
+    """Drop all cached dataset results."""
+    get_cache().clear()
+
+
+class DedicationDataset:
+    """
+    Lazy, immutable query over the dedication records.
+
+    ``filter`` and ``select`` only build up a query; nothing is read until
+    ``to_pandas``, ``count`` or ``head`` is called. Filters are handed to
+    the pyarrow scanner, so year filters prune whole partitions and other
+    predicates skip row groups by their statistics. Only selected columns
+    are decoded. Materialized results are kept in a shared LRU cache keyed
+    by source state, filter, and columns.
+
+    Examples:
+        >>> from ag_dedicated.data import col, load_dedications
+        >>> recent = load_dedications().filter(col('year') >= 2020, zone=4)
+        >>> recent.select('tmk_key', 'petition', 'end_year').to_pandas()
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        filter: Optional[ds.Expression] = None,
+        columns: Optional[tuple[str, ...]] = None,
+        cache: Optional[ResultCache] = None,
+    ):
+        """
+        Initialize dataset query.
+
+        Args:
+            source: Parquet dataset directory or cleaned/merged CSV file
+            filter: Combined filter expression
+            columns: Projected columns (None for all stored columns)
+            cache: Result cache (default: shared cache)
+        """
+        self.source = Path(source)
+        self._filter = filter
+        self._columns = columns
+        self._cache = cache
+
+    def _derive(self, **changes: Any) -> 'DedicationDataset':
+        state = {
+            'source': self.source,
+            'filter': self._filter,
+            'columns': self._columns,
+            'cache': self._cache,
+        }
+        state.update(changes)
+        return DedicationDataset(**state)
+
+    @property
+    def cache(self) -> ResultCache:
+        return self._cache if self._cache is not None else get_cache()
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns the query will return."""
+        return list(self._columns) if self._columns is not None else list(DEDICATION_SCHEMA.names)
+
+    def filter(self, *expressions: ds.Expression, **equals: Any) -> 'DedicationDataset':
+        """
+        Add row filters, combined with AND.
+
+        Args:
+            *expressions: Expressions built with ``col``
+            **equals: ``column=value`` equality filters; list values mean
+                "any of". TMK fields are allowed (``zone=4``).
+
+        Returns:
+            New dataset with the filters applied
+        """
+        combined = self._filter
+        for expression in [*expressions, *_keyword_filters(equals)]:
+            combined = expression if combined is None else combined & expression
+        return self._derive(filter=combined)
+
+    def select(self, *columns: str) -> 'DedicationDataset':
+        """
+        Project to a subset of columns, which may include TMK fields.
+
+        Args:
+            *columns: Column names
+
+        Returns:
+            New dataset returning only these columns
+        """
+        for name in columns:
+            col(name)  # validate
+        return self._derive(columns=tuple(columns))
+
+    def _dataset(self) -> ds.Dataset:
+        """Open the underlying pyarrow dataset."""
+        if self.source.is_dir():
+            return ds.dataset(
+                self.source,
+                schema=DEDICATION_SCHEMA,
+                format='parquet',
+                partitioning=PARTITIONING,
+            )
+
+        # CSV has no pushdown; parse it once per file version and scan in memory
+        key = ('csv', str(self.source), self.source.stat().st_mtime_ns)
+        table = self.cache.get(key)
+        if table is None:
+            logger.info(f"Parsing {self.source.name}; write the Parquet dataset for faster loads")
+            table = to_dedication_table(pd.read_csv(self.source))
+            self.cache.put(key, table, table.nbytes)
+        return ds.dataset(table)
+
+    def _source_token(self) -> tuple:
+        """Identify the current source state so rewritten data invalidates the cache."""
+        if self.source.is_dir():
+            files = sorted(self.source.rglob('*.parquet'))
+            return tuple((str(f), f.stat().st_mtime_ns) for f in files)
+        return (str(self.source), self.source.stat().st_mtime_ns)
+
+    def _projection(self) -> Optional[dict[str, ds.Expression]]:
+        if self._columns is None:
+            return None
+        return {name: col(name) for name in self._columns}
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Materialize the query, reusing a cached result when possible.
+
+        Returns:
+            DataFrame with typed columns. Cached frames are shared, so the
+            returned frame is a shallow copy; use ``.copy()`` before
+            modifying values in place.
+        """
+        key = (self._source_token(), str(self._filter), self._columns)
+        df = self.cache.get(key)
+        if df is None:
+            table = self._dataset().to_table(columns=self._projection(), filter=self._filter)
+            # TMK fields come out of the scan as int64; they fit in int16
+            for name in set(table.column_names) & set(TMK_FIELDS):
+                index = table.column_names.index(name)
+                table = table.set_column(index, name, table[name].cast(pa.int16()))
+            df = table.to_pandas(types_mapper=_TYPES_MAPPER)
+            self.cache.put(key, df, int(df.memory_usage(deep=True).sum()))
+        return df.copy(deep=False)
+
+    def count(self) -> int:
+        """Number of matching rows, without materializing them."""
+        return self._dataset().count_rows(filter=self._filter)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """First ``n`` matching rows, reading only as much as needed."""
+        table = self._dataset().head(n, columns=self._projection(), filter=self._filter)
+        return table.to_pandas(types_mapper=_TYPES_MAPPER)
+
+    def __repr__(self) -> str:
+        return (
+            f"DedicationDataset(source={self.source}, "
+            f"filter={self._filter}, columns={self.columns})"
+        )
+
+
+def load_dedications(
+    source: Optional[Union[str, Path]] = None,
+    config: Optional[Settings] = None,
+) -> DedicationDataset:
+    """
+    Start a lazy query over the dedication records.
+
+    Args:
+        source: Parquet dataset directory or CSV file (default: the
+            extractor's Parquet output if present, else cleaned_output.csv)
+        config: Settings instance
+
+    Returns:
+        DedicationDataset; nothing is read until it is materialized
+    """
+    if source is None:
+        output_dir = (config or Settings()).get_path('paths.output')
+        parquet_dir = output_dir / 'parquet'
+        source = parquet_dir if parquet_dir.exists() else output_dir / 'cleaned_output.csv'
+
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(
+            f"Dedication data not found at {source}. Run: ag-dedicated extract"
+        )
+    return DedicationDataset(source)
@@ -1,5 +1,6 @@
 """PDF and data extraction utilities."""
 
+from ag_dedicated.extractors.parquet import read_dedications_parquet, write_dedications_parquet
 from ag_dedicated.extractors.pdf_extractor import PDFExtractor
 
-__all__ = ["PDFExtractor"]
+__all__ = ["PDFExtractor", "read_dedications_parquet", "write_dedications_parquet"]
@@ -0,0 +1,154 @@
+"""Hash-based duplicate removal for merged dedication rows."""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ag_dedicated.utils.tmk import encode_tmks
+
+
+DEDUP_MODES = ('exact', 'near')
+
+
+def _normalized_keys(
+    df: pd.DataFrame,
+    mode: str,
+    tmk_col: str,
+    petition_col: str,
+    end_year_col: str,
+    year_col: str,
+) -> pd.DataFrame:
+    """Build the normalized key columns that are hashed into fingerprints."""
+    petition = df[petition_col].astype('string').str.upper().str.strip()
+    if mode == 'near':
+        # Tabula splits and OCR noise: ignore spacing and punctuation
+        petition = petition.str.replace(r'[^A-Z0-9]', '', regex=True)
+
+    tmk_key = encode_tmks(df[tmk_col])
+    # Unparseable TMKs fall back to their raw text so they don't all collide
+    raw_tmk = df[tmk_col].astype('string').str.strip().fillna('').to_numpy()
+
+    keys = {
+        'tmk_key': tmk_key,
+        'tmk_raw': np.where(tmk_key < 0, raw_tmk, ''),
+        'petition': petition.fillna('').to_numpy(),
+        'year': pd.to_numeric(df[year_col], errors='coerce').fillna(-1).astype(np.int64).to_numpy(),
+    }
+
+    # Near mode ignores end year so a row missing it matches its complete twin
+    if mode == 'exact' and end_year_col in df.columns:
+        keys['end_year'] = (
+            pd.to_numeric(df[end_year_col], errors='coerce').fillna(-1).astype(np.int64).to_numpy()
+        )
+
+    return pd.DataFrame(keys)
+
+
+def row_fingerprints(
+    df: pd.DataFrame,
+    mode: str = 'exact',
+    tmk_col: str = 'Parcel ID (TMK)',
+    petition_col: str = 'Petition Number',
+    end_year_col: str = 'End Year',
+    year_col: str = 'Year',
+) -> np.ndarray:
+    """
+    Hash normalized key columns into one 64-bit fingerprint per row.
+
+    Args:
+        df: Dedication rows
+        mode: ``'exact'`` hashes TMK key, petition, end year, and year;
+            ``'near'`` also strips punctuation from petitions and ignores end year
+        tmk_col: TMK column
+        petition_col: Petition number column
+        end_year_col: End year column
+        year_col: Snapshot year column
+
+    Returns:
+        uint64 array aligned with ``df``
+    """
+    if mode not in DEDUP_MODES:
+        raise ValueError(f"Unknown dedup mode: {mode} (expected one of {DEDUP_MODES})")
+
+    keys = _normalized_keys(df, mode, tmk_col, petition_col, end_year_col, year_col)
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def find_duplicates(
+    df: pd.DataFrame,
+    mode: str = 'exact',
+    **columns: str,
+) -> tuple[np.ndarray, pd.DataFrame]:
+    """
+    Mark duplicate rows by fingerprint, in linear time.
+
+    Exact mode keeps the first row of each fingerprint. Near mode keeps the
+    most complete row (most non-null fields, first on ties).
+
+    Args:
+        df: Dedication rows
+        mode: ``'exact'`` or ``'near'``
+        **columns: Column name overrides passed to ``row_fingerprints``
+
+    Returns:
+        Tuple of (boolean keep mask, removal report). The report has one row
+        per removed row with its index, fingerprint, and the index of the
+        row kept in its place.
+    """
+    fp = row_fingerprints(df, mode=mode, **columns)
+    frame = pd.DataFrame({'fingerprint': fp, 'row': df.index})
+
+    if mode == 'exact':
+        keep = ~frame['fingerprint'].duplicated(keep='first').to_numpy()
+    else:
+        frame['completeness'] = df.notna().sum(axis=1).to_numpy()
+        winners = frame.groupby('fingerprint', sort=False)['completeness'].idxmax()
+        keep = np.zeros(len(frame), dtype=bool)
+        keep[winners.to_numpy()] = True
+
+    kept_rows = frame[keep].set_index('fingerprint')['row']
+    removed = frame[~keep]
+    report = pd.DataFrame({
+        'row': removed['row'].to_numpy(),
+        'fingerprint': [f"{v:016x}" for v in removed['fingerprint']],
+        'kept_row': removed['fingerprint'].map(kept_rows).to_numpy(),
+        'mode': mode,
+    })
+
+    return keep, report
+
+
+def remove_duplicates(
+    df: pd.DataFrame,
+    mode: str = 'exact',
+    report_path: Optional[Path] = None,
+    **columns: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Drop duplicate rows and optionally write a removal report.
+
+    The report lists the removed rows alongside the fingerprint and the
+    index of the row that was kept.
+
+    Args:
+        df: Dedication rows
+        mode: ``'exact'`` or ``'near'``
+        report_path: Optional CSV path for the removal report
+        **columns: Column name overrides passed to ``row_fingerprints``
+
+    Returns:
+        Tuple of (deduplicated DataFrame, report DataFrame)
+    """
+    keep, report = find_duplicates(df, mode=mode, **columns)
+
+    if not report.empty:
+        removed_rows = df.iloc[np.flatnonzero(~keep)].reset_index(drop=True)
+        report = report.join(removed_rows)
+
+    if report_path is not None:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report.to_csv(report_path, index=False)
+
+    return df[keep], report
@@ -0,0 +1,214 @@
+"""OCR fallback for scanned (image-only) dedication PDFs."""
+
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+from loguru import logger
+
+# Optional OCR dependencies (pip install ag-dedicated[ocr]; needs the tesseract binary)
+try:
+    import pypdfium2 as pdfium
+    import pytesseract
+    from PIL import Image
+
+    OCR_AVAILABLE = True
+except ImportError:
+    OCR_AVAILABLE = False
+
+
+# Output columns, matching the tabula CSVs so the merge/clean steps apply unchanged
+OCR_COLUMNS = ['Parcel ID (TMK)', 'Petition Number', 'Site Address', 'End Year']
+
+# OCR commonly reads these letters in place of digits inside numeric fields
+_DIGIT_FIXES = str.maketrans({'O': '0', 'o': '0', 'I': '1', 'l': '1', '|': '1', 'S': '5', 'B': '8'})
+
+_TMK_PATTERN = re.compile(r'(?<![\w-])(\d(?:[ -]?[\dOoIl|]){11,12})(?![\w-])')
+_PETITION_PATTERN = re.compile(r'\b(A[VD]?) ?([\dOoIlSB]{8})([A-Z]?)\b')
+_END_YEAR_PATTERN = re.compile(r'\b((?:19|20)\d{2})\s*$')
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def page_cache_key(pdf_hash: str, page: int, dpi: int) -> str:
+    """Cache key for one rendered page: PDF content hash, page index, and resolution."""
+    return hashlib.sha256(f"{pdf_hash}:{page}:{dpi}".encode()).hexdigest()
+
+
+def _ocr_page(
+    pdf_path: str,
+    page: int,
+    dpi: int,
+    lang: str,
+    psm: int,
+    raster_path: str,
+    text_path: str,
+) -> str:
+    """
+    Rasterize and OCR one page, writing both to the cache (runs in a worker process).
+
+    An already cached raster is reused, so changing OCR settings does not
+    re-render pages.
+    """
+    raster = Path(raster_path)
+    if raster.exists():
+        image = Image.open(raster)
+    else:
+        document = pdfium.PdfDocument(pdf_path)
+        try:
+            image = document[page].render(scale=dpi / 72).to_pil().convert('L')
+        finally:
+            document.close()
+        raster.parent.mkdir(parents=True, exist_ok=True)
+        image.save(raster)
+
+    text = pytesseract.image_to_string(image, lang=lang, config=f'--psm {psm}')
+
+    # Write then rename so an interrupted run never leaves a partial entry
+    tmp = Path(text_path + '.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    tmp.replace(text_path)
+    return text
+
+
+class OCREngine:
+    """
+    Rasterize PDF pages and run Tesseract over them in a process pool.
+
+    Page rasters and OCR text are cached on disk under a key derived from
+    the PDF's content hash, so unchanged files are never re-rendered or
+    re-recognized.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        dpi: int = 300,
+        lang: str = 'eng',
+        psm: int = 6,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize OCR engine.
+
+        Args:
+            cache_dir: Directory for cached rasters and text
+            dpi: Rasterization resolution
+            lang: Tesseract language
+            psm: Tesseract page segmentation mode (6 = uniform block of text)
+            workers: Worker processes (default: CPU count)
+        """
+        if not OCR_AVAILABLE:
+            raise ImportError(
+                "OCR requires pypdfium2, pytesseract and Pillow: "
+                "pip install ag-dedicated[ocr] (plus the tesseract binary)"
+            )
+        self.cache_dir = cache_dir
+        self.dpi = dpi
+        self.lang = lang
+        self.psm = psm
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logger.bind(name=__name__)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        shard = self.cache_dir / key[:2]
+        return shard / f"{key}.png", shard / f"{key}.{self.lang}.psm{self.psm}.txt"
+
+    def ocr_pdf(self, pdf_path: Path) -> list[str]:
+        """
+        OCR every page of a PDF.
+
+        Args:
+            pdf_path: PDF file
+
+        Returns:
+            OCR text per page, in page order
+        """
+        pdf_hash = file_hash(pdf_path)
+        document = pdfium.PdfDocument(str(pdf_path))
+        n_pages = len(document)
+        document.close()
+
+        texts: dict[int, str] = {}
+        pending = []
+        for page in range(n_pages):
+            raster_path, text_path = self._paths(page_cache_key(pdf_hash, page, self.dpi))
+            if text_path.exists():
+                texts[page] = text_path.read_text(encoding='utf-8')
+            else:
+                pending.append((page, raster_path, text_path))
+
+        self.logger.info(
+            f"OCR {pdf_path.name}: {n_pages} pages, "
+            f"{n_pages - len(pending)} cached, {len(pending)} to process"
+        )
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                futures = {
+                    page: pool.submit(
+                        _ocr_page, str(pdf_path), page, self.dpi, self.lang, self.psm,
+                        str(raster_path), str(text_path),
+                    )
+                    for page, raster_path, text_path in pending
+                }
+                for page, future in futures.items():
+                    texts[page] = future.result()
+
+        return [texts[page] for page in range(n_pages)]
+
+
+def parse_ocr_text(pages: list[str]) -> pd.DataFrame:
+    """
+    Parse OCR'd report text into the standard dedication columns.
+
+    A line becomes a row when it holds both a TMK and a petition number.
+    Letters OCR commonly confuses with digits are corrected inside those
+    two fields; whatever text remains is the site address, minus a
+    trailing end year if present.
+
+    Args:
+        pages: OCR text per page
+
+    Returns:
+        DataFrame with ``OCR_COLUMNS``
+    """
+    rows = []
+    for text in pages:
+        for line in text.splitlines():
+            tmk_match = _TMK_PATTERN.search(line)
+            petition_match = _PETITION_PATTERN.search(line)
+            if not tmk_match or not petition_match:
+                continue
+
+            tmk = re.sub(r'[ -]', '', tmk_match.group(1).translate(_DIGIT_FIXES))
+            prefix, digits, suffix = petition_match.groups()
+            petition = prefix + digits.translate(_DIGIT_FIXES) + suffix
+
+            rest = line
+            for span in sorted([tmk_match.span(), petition_match.span()], reverse=True):
+                rest = rest[:span[0]] + ' ' + rest[span[1]:]
+            rest = ' '.join(rest.split())
+
+            end_year = None
+            year_match = _END_YEAR_PATTERN.search(rest)
+            if year_match:
+                end_year = int(year_match.group(1))
+                rest = rest[:year_match.start()].rstrip()
+
+            rows.append((tmk, petition, rest or None, end_year))
+
+    df = pd.DataFrame(rows, columns=OCR_COLUMNS)
+    df['End Year'] = df['End Year'].astype('Int16')
+    return df
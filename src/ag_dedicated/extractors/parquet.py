@@ -0,0 +1,149 @@
+"""Typed, Year-partitioned Parquet storage for dedication records."""
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from loguru import logger
+
+from ag_dedicated.utils.tmk import encode_tmks
+
+
+# Source CSV column -> Parquet column
+DEDICATION_COLUMNS = {
+    'Parcel ID (TMK)': 'tmk',
+    'Petition Number': 'petition',
+    'Site Address': 'site_address',
+    'End Year': 'end_year',
+    'Year': 'year',
+}
+
+DEDICATION_SCHEMA = pa.schema([
+    pa.field('tmk_key', pa.int64()),
+    pa.field('tmk', pa.string()),
+    pa.field('petition', pa.string()),
+    pa.field('petition_prefix', pa.dictionary(pa.int8(), pa.string())),
+    pa.field('site_address', pa.string()),
+    pa.field('end_year', pa.int16()),
+    pa.field('year', pa.int16()),
+])
+
+PARTITIONING = ds.partitioning(pa.schema([pa.field('year', pa.int16())]), flavor='hive')
+
+
+def to_dedication_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a merged or cleaned dedication DataFrame to the fixed Parquet schema.
+
+    Args:
+        df: DataFrame with the extractor's CSV columns
+
+    Returns:
+        Arrow table matching ``DEDICATION_SCHEMA``
+    """
+    renamed = df.rename(columns=DEDICATION_COLUMNS)
+    n = len(renamed)
+
+    def text(column: str) -> pd.Series:
+        if column not in renamed.columns:
+            return pd.Series([None] * n, dtype='string')
+        return renamed[column].astype('string').str.strip()
+
+    def small_int(column: str) -> pd.Series:
+        if column not in renamed.columns:
+            return pd.Series([None] * n, dtype='Int16')
+        return pd.to_numeric(renamed[column], errors='coerce').astype('Int16')
+
+    # Numeric TMK columns with gaps are read as floats ("220270390000.0")
+    tmk = text('tmk').str.replace(r'\.0+$', '', regex=True)
+    petition = text('petition')
+
+    if 'tmk_key' in renamed.columns:
+        tmk_key = renamed['tmk_key'].astype('int64')
+    else:
+        tmk_key = pd.Series(encode_tmks(tmk), index=renamed.index)
+
+    typed = pd.DataFrame({
+        'tmk_key': tmk_key,
+        'tmk': tmk,
+        'petition': petition,
+        'petition_prefix': petition.str.extract(r'^([A-Z]+)', expand=False).astype('category'),
+        'site_address': text('site_address'),
+        'end_year': small_int('end_year'),
+        'year': small_int('year'),
+    })
+
+    return pa.Table.from_pandas(typed, schema=DEDICATION_SCHEMA, preserve_index=False)
+
+
+def write_dedications_parquet(df: pd.DataFrame, output_dir: Path) -> Path:
+    """
+    Write dedications as a Parquet dataset partitioned by snapshot year.
+
+    Existing partitions for the years being written are replaced.
+
+    Args:
+        df: Dedication DataFrame with the extractor's CSV columns
+        output_dir: Dataset root directory
+
+    Returns:
+        Dataset root directory
+    """
+    table = to_dedication_table(df)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    ds.write_dataset(
+        table,
+        output_dir,
+        format='parquet',
+        partitioning=PARTITIONING,
+        existing_data_behavior='delete_matching',
+        basename_template='part-{i}.parquet',
+    )
+
+    logger.info(f"Wrote {table.num_rows:,} rows to Parquet dataset {output_dir}")
+    return output_dir
+
+
+def read_dedications_parquet(
+    dataset_dir: Path,
+    years: Optional[Iterable[int]] = None,
+    columns: Optional[list[str]] = None,
+    filter: Optional[ds.Expression] = None,
+) -> pd.DataFrame:
+    """
+    Read dedications from a Parquet dataset, touching only what is asked for.
+
+    Year selection prunes whole partitions; ``columns`` limits which column
+    chunks are decoded.
+
+    Args:
+        dataset_dir: Dataset root directory
+        years: Optional snapshot years to load
+        columns: Optional subset of columns to load
+        filter: Optional additional pyarrow dataset filter expression
+
+    Returns:
+        DataFrame with typed columns
+
+    Examples:
+        >>> df = read_dedications_parquet(path, years=[2023, 2024],
+        ...                               columns=['tmk_key', 'end_year'])
+    """
+    dataset = ds.dataset(
+        dataset_dir,
+        schema=DEDICATION_SCHEMA,
+        format='parquet',
+        partitioning=PARTITIONING,
+    )
+
+    expression = filter
+    if years is not None:
+        year_filter = ds.field('year').isin([int(y) for y in years])
+        expression = year_filter if expression is None else expression & year_filter
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    # Keep years as nullable int16 instead of widening to float on nulls
+    return table.to_pandas(types_mapper={pa.int16(): pd.Int16Dtype()}.get)
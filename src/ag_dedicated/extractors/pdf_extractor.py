@@ -1,6 +1,7 @@
 """PDF extraction utilities for agricultural dedication reports."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,7 +10,26 @@ import tabula
 from loguru import logger
 
 from ag_dedicated.config.settings import Settings
-from ag_dedicated.utils.validation import validate_petition_number, clean_petition_number
+from ag_dedicated.extractors.dedup import remove_duplicates
+from ag_dedicated.extractors.ocr import OCR_AVAILABLE, OCREngine, parse_ocr_text
+from ag_dedicated.extractors.parquet import write_dedications_parquet
+from ag_dedicated.utils.profiling import stage
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+from ag_dedicated.utils.validation import (
+    clean_petition_number,
+    decode_petitions,
+    validate_petition_number,
+)
+
+
+@lru_cache(maxsize=None)
+def _warn_ocr_unavailable() -> None:
+    """Warn once per process that OCR is enabled but not installed."""
+    logger.warning(
+        "pdf_extraction.ocr.enabled is set but the OCR packages are missing; "
+        "scanned PDFs will be skipped. Install them with pip install ag-dedicated[ocr] "
+        "(plus the tesseract binary) or set pdf_extraction.ocr.enabled: false"
+    )
 
 
 class PDFExtractor:
@@ -29,6 +49,25 @@ class PDFExtractor:
         """
         self.config = config or Settings()
         self.logger = logger.bind(name=__name__)
+        # Resolved once rather than per PDF
+        self.ocr_enabled = self.config.get('pdf_extraction.ocr.enabled', False)
+        if self.ocr_enabled and not OCR_AVAILABLE:
+            _warn_ocr_unavailable()
+            self.ocr_enabled = False
+        self._ocr_engine: Optional[OCREngine] = None
+
+    @property
+    def ocr_engine(self) -> OCREngine:
+        """OCR engine configured from ``pdf_extraction.ocr`` (created on first use)."""
+        if self._ocr_engine is None:
+            self._ocr_engine = OCREngine(
+                cache_dir=self.config.get_path('pdf_extraction.ocr.cache_dir'),
+                dpi=self.config.get('pdf_extraction.ocr.dpi', 300),
+                lang=self.config.get('pdf_extraction.ocr.lang', 'eng'),
+                psm=self.config.get('pdf_extraction.ocr.psm', 6),
+                workers=self.config.get('pdf_extraction.ocr.workers'),
+            )
+        return self._ocr_engine
 
     def extract_pdf(
         self,
@@ -62,7 +101,10 @@ class PDFExtractor:
                 pandas_options={'header': 0}
             )
 
-            if not dfs:
+            if not dfs or all(df.empty for df in dfs):
+                if self.ocr_enabled:
+                    self.logger.info(f"No text tables in {pdf_path.name}, falling back to OCR")
+                    return self.extract_pdf_ocr(pdf_path, output_path)
                 self.logger.warning(f"No tables found in {pdf_path.name}")
                 return None
 
@@ -86,11 +128,51 @@ class PDFExtractor:
             self.logger.error(f"Error extracting {pdf_path.name}: {e}")
             return None
 
+    def extract_pdf_ocr(
+        self,
+        pdf_path: Path,
+        output_path: Optional[Path] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Extract dedication rows from a scanned PDF with OCR.
+
+        Pages are rasterized and recognized in a process pool; rasters and
+        text are cached by content hash, so re-runs only parse cached text.
+        The result has the same columns as the tabula CSVs.
+
+        Args:
+            pdf_path: Path to PDF file
+            output_path: Optional path to save CSV output
+
+        Returns:
+            DataFrame with extracted data, or None if nothing was recognized
+        """
+        try:
+            pages = self.ocr_engine.ocr_pdf(pdf_path)
+        except Exception as e:
+            self.logger.error(f"OCR failed for {pdf_path.name}: {e}")
+            return None
+
+        df = parse_ocr_text(pages)
+        if df.empty:
+            self.logger.warning(f"OCR found no dedication rows in {pdf_path.name}")
+            return None
+
+        self.logger.info(f"OCR extracted {len(df)} rows from {len(pages)} pages in {pdf_path.name}")
+
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(output_path, index=False)
+            self.logger.debug(f"Saved to {output_path}")
+
+        return df
+
     def extract_directory(
         self,
         pdf_dir: Path,
         output_dir: Path,
         pattern: str = "*.pdf",
+        recursive: bool = False,
     ) -> dict[str, pd.DataFrame]:
         """
         Extract tables from all PDFs in a directory.
@@ -99,6 +181,7 @@ class PDFExtractor:
             pdf_dir: Directory containing PDF files
             output_dir: Directory for CSV output files
             pattern: Glob pattern for PDF files
+            recursive: Also extract PDFs in subdirectories (e.g. the scanned 2011 reports)
 
         Returns:
             Dictionary mapping filename to DataFrame
@@ -109,7 +192,7 @@ class PDFExtractor:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        pdf_files = sorted(pdf_dir.glob(pattern))
+        pdf_files = sorted(pdf_dir.rglob(pattern) if recursive else pdf_dir.glob(pattern))
         if not pdf_files:
             self.logger.warning(f"No PDF files found matching {pattern} in {pdf_dir}")
             return {}
@@ -119,7 +202,7 @@ class PDFExtractor:
         results = {}
         for pdf_path in pdf_files:
             # Skip files in subdirectories if we only want top-level
-            if pdf_path.parent != pdf_dir:
+            if pdf_path.parent != pdf_dir and not recursive:
                 continue
 
             output_path = output_dir / f"{pdf_path.stem}.csv"
@@ -157,6 +240,8 @@ class PDFExtractor:
         csv_dir: Path,
         output_path: Path,
         pattern: str = "*.csv",
+        tmk_col: str = 'Parcel ID (TMK)',
+        csv_files: Optional[list[Path]] = None,
     ) -> pd.DataFrame:
         """
         Merge multiple CSV files with year labeling.
@@ -165,11 +250,14 @@ class PDFExtractor:
             csv_dir: Directory containing CSV files
             output_path: Path for merged output CSV
             pattern: Glob pattern for CSV files
+            tmk_col: Name of TMK column to key on
+            csv_files: Explicit files to merge instead of globbing ``csv_dir``
 
         Returns:
-            Merged DataFrame with 'Year' column added
+            Merged DataFrame with 'Year' and integer 'tmk_key' columns added
         """
-        csv_files = sorted(csv_dir.glob(pattern))
+        if csv_files is None:
+            csv_files = sorted(csv_dir.glob(pattern))
 
         if not csv_files:
             self.logger.warning(f"No CSV files found in {csv_dir}")
@@ -208,6 +296,13 @@ class PDFExtractor:
         # Merge all dataframes
         merged_df = pd.concat(dfs, ignore_index=True)
 
+        # Canonical integer TMK key for downstream joins
+        if tmk_col in merged_df.columns:
+            merged_df['tmk_key'] = encode_tmks(merged_df[tmk_col])
+            invalid = int((merged_df['tmk_key'] == TMK_NULL).sum())
+            if invalid:
+                self.logger.warning(f"{invalid:,} rows have unparseable TMKs")
+
         # Save merged file
         output_path.parent.mkdir(parents=True, exist_ok=True)
         merged_df.to_csv(output_path, index=False)
@@ -270,13 +365,77 @@ class PDFExtractor:
 
         return df
 
+    def deduplicate(
+        self,
+        df: pd.DataFrame,
+        report_path: Optional[Path] = None,
+        mode: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Remove repeated rows (overlapping PDF pages, tabula splits) by fingerprint.
+
+        Args:
+            df: Merged DataFrame
+            report_path: Optional CSV path for the removal report
+            mode: 'exact' or 'near' (default from data_processing.duplicate_mode)
+
+        Returns:
+            Deduplicated DataFrame
+        """
+        mode = mode or self.config.get('data_processing.duplicate_mode', 'exact')
+
+        deduped, report = remove_duplicates(df, mode=mode, report_path=report_path)
+
+        self.logger.info(
+            f"Removed {len(report):,} {mode} duplicate rows, kept {len(deduped):,}"
+        )
+        if report_path is not None and len(report):
+            self.logger.info(f"Saved duplicate report to {report_path}")
+
+        return deduped
+
+    def decode_petition_numbers(
+        self,
+        df: pd.DataFrame,
+        petition_col: str = 'Petition Number',
+    ) -> pd.DataFrame:
+        """
+        Add decoded term, start year, sequence, and packed key columns.
+
+        Rows whose petition number doesn't match the expected pattern are
+        kept (with null decoded fields) and reported in the log.
+
+        Args:
+            df: DataFrame with a petition number column
+            petition_col: Name of petition number column
+
+        Returns:
+            DataFrame with term, start_year, sequence, suffix, and
+            petition_key columns added
+        """
+        if petition_col not in df.columns:
+            self.logger.error(f"Column '{petition_col}' not found in DataFrame")
+            return df
+
+        decoded = decode_petitions(df[petition_col])
+        unmatched = df.loc[~decoded['valid'], petition_col]
+
+        if len(unmatched):
+            examples = unmatched.astype(str).value_counts().head(10)
+            self.logger.warning(
+                f"{len(unmatched):,} petition numbers did not decode; most common:\n{examples}"
+            )
+
+        columns = ['term', 'start_year', 'sequence', 'suffix', 'petition_key']
+        return df.join(decoded[columns])
+
     def process_all(
         self,
         pdf_dir: Optional[Path] = None,
         output_dir: Optional[Path] = None,
     ) -> pd.DataFrame:
         """
-        Complete pipeline: extract PDFs, merge CSVs, and clean data.
+        Complete pipeline: extract PDFs, merge CSVs, dedupe, clean, and write Parquet.
 
         Args:
             pdf_dir: Directory with PDF files (uses config if not provided)
@@ -297,29 +456,61 @@ class PDFExtractor:
         self.logger.info("=" * 60)
 
         # Step 1: Extract PDFs to CSVs
-        self.logger.info("\n[Step 1/3] Extracting PDF files...")
-        extracted = self.extract_directory(pdf_dir, output_dir)
+        with stage('extract'):
+            self.logger.info("\n[Step 1/5] Extracting PDF files...")
+            extracted = self.extract_directory(
+                pdf_dir,
+                output_dir,
+                recursive=self.config.get('pdf_extraction.recursive', False),
+            )
 
         if not extracted:
             self.logger.error("No PDFs were successfully extracted. Aborting.")
             return pd.DataFrame()
 
         # Step 2: Merge all CSVs
-        self.logger.info("\n[Step 2/3] Merging CSV files...")
-        merged_path = output_dir / 'merged_output.csv'
-        merged_df = self.merge_csv_files(output_dir, merged_path)
+        with stage('merge'):
+            self.logger.info("\n[Step 2/5] Merging CSV files...")
+            # Only this run's per-PDF CSVs; output_dir also holds the merged,
+            # cleaned and duplicates report CSVs
+            merged_path = output_dir / 'merged_output.csv'
+            merged_df = self.merge_csv_files(
+                output_dir,
+                merged_path,
+                csv_files=[output_dir / f"{Path(name).stem}.csv" for name in sorted(extracted)],
+            )
 
         if merged_df.empty:
             self.logger.error("Merge resulted in empty DataFrame. Aborting.")
             return pd.DataFrame()
 
-        # Step 3: Clean petition numbers
-        self.logger.info("\n[Step 3/3] Cleaning petition numbers...")
-        cleaned_df = self.clean_petition_numbers(merged_df)
+        # Steps 3-5 match the pipeline's clean stage
+        with stage('clean'):
+            # Step 3: Remove duplicate rows
+            if self.config.get('data_processing.remove_duplicates', False):
+                self.logger.info("\n[Step 3/5] Removing duplicate rows...")
+                merged_df = self.deduplicate(
+                    merged_df,
+                    report_path=output_dir / 'duplicates_report.csv',
+                )
+
+            # Step 4: Clean and decode petition numbers
+            self.logger.info("\n[Step 4/5] Cleaning petition numbers...")
+            validation = self.config.get('data_processing.petition_number_validation')
+            cleaned_df = self.clean_petition_numbers(
+                merged_df,
+                numeric_only=validation == 'numeric_only',
+            )
+            cleaned_df = self.decode_petition_numbers(cleaned_df)
+
+            cleaned_path = output_dir / 'cleaned_output.csv'
+            cleaned_df.to_csv(cleaned_path, index=False)
+            self.logger.info(f"Saved cleaned data to {cleaned_path}")
 
-        cleaned_path = output_dir / 'cleaned_output.csv'
-        cleaned_df.to_csv(cleaned_path, index=False)
-        self.logger.info(f"Saved cleaned data to {cleaned_path}")
+            # Step 5: Typed, Year-partitioned Parquet dataset
+            if self.config.get('output.write_parquet', True):
+                self.logger.info("\n[Step 5/5] Writing Parquet dataset...")
+                write_dedications_parquet(cleaned_df, output_dir / 'parquet')
 
         self.logger.info("=" * 60)
         self.logger.info(f"Pipeline complete! Final dataset: {len(cleaned_df):,} rows")
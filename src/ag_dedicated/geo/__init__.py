@@ -0,0 +1,23 @@
+"""Parcel geometry and map data tools."""
+
+from ag_dedicated.utils.lazy import lazy_exports
+
+# Public name -> defining module, imported on first access (the raster,
+# index, layer and tile modules pull in their optional dependencies)
+__all__, __getattr__ = lazy_exports(__name__, {
+    "build_parcel_map": "ag_dedicated.geo.parcels",
+    "load_parcel_features": "ag_dedicated.geo.parcels",
+    "CDLLegend": "ag_dedicated.geo.zonal",
+    "attach_land_use": "ag_dedicated.geo.zonal",
+    "zonal_stats": "ag_dedicated.geo.zonal",
+    "ParcelPixels": "ag_dedicated.geo.panel",
+    "RasterStack": "ag_dedicated.geo.panel",
+    "land_use_panel": "ag_dedicated.geo.panel",
+    "petition_land_use": "ag_dedicated.geo.panel",
+    "ParcelIndex": "ag_dedicated.geo.index",
+    "load_parcel_layer": "ag_dedicated.geo.layers",
+    "stream_parcel_features": "ag_dedicated.geo.layers",
+    "build_tiles": "ag_dedicated.geo.tiles",
+    "read_packed_parcels": "ag_dedicated.geo.packed",
+    "write_packed_parcels": "ag_dedicated.geo.packed",
+})
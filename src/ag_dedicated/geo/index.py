@@ -0,0 +1,390 @@
+"""
+Spatial index over parcel geometries: point, bbox and nearest-parcel lookups.
+
+The index is a static packed R-tree. Parcels are ordered by the
+Sort-Tile-Recursive (STR) method, and each level of node bounding boxes is
+a flat NumPy array. Queries walk the levels with vectorized box tests for
+a whole batch at once, and exact geometry tests run only on the
+candidates. Geometries are stored as WKB and decoded lazily, so an index
+saved with ``save`` opens from memory-mapped arrays without rebuilding
+anything.
+
+Coordinates are stored in a local equirectangular projection (meters)
+centred on the data's mean latitude. Containment is exact under that
+projection, and distances are accurate to within a few percent across
+the state.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.geo.parcels import feature_keys
+
+# Optional geometry dependency (pip install ag-dedicated[geo])
+try:
+    import shapely
+
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+
+EARTH_RADIUS_M = 6_371_008.8
+NODE_SIZE = 16
+
+
+def _require_shapely() -> None:
+    if not SHAPELY_AVAILABLE:
+        raise ImportError("The parcel index requires shapely: pip install ag-dedicated[geo]")
+
+
+def _intersects(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise test of ``(minx, miny, maxx, maxy)`` boxes."""
+    return (
+        (a[:, 0] <= b[:, 2]) & (a[:, 2] >= b[:, 0])
+        & (a[:, 1] <= b[:, 3]) & (a[:, 3] >= b[:, 1])
+    )
+
+
+class ParcelIndex:
+    """
+    Packed R-tree over parcel geometries keyed by canonical TMK key.
+
+    Examples:
+        >>> index = ParcelIndex.from_features(load_parcel_features(path))
+        >>> index.save(index_dir)
+        >>> index = ParcelIndex.load(index_dir)
+        >>> index.locate([-157.80], [21.30])
+        >>> index.intersecting(-157.9, 21.2, -157.7, 21.4)
+        >>> index.nearest([-157.80], [21.30], k=3)
+    """
+
+    ARRAYS = ('keys', 'features', 'bounds', 'nodes', 'level_offsets', 'wkb', 'wkb_offsets')
+    META_FILE = 'index.json'
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        features: np.ndarray,
+        bounds: np.ndarray,
+        nodes: np.ndarray,
+        level_offsets: np.ndarray,
+        wkb: np.ndarray,
+        wkb_offsets: np.ndarray,
+        ref_lat: float,
+        node_size: int = NODE_SIZE,
+    ):
+        """
+        Wrap prebuilt index arrays (see ``build`` and ``load``).
+
+        Args:
+            keys: TMK key per parcel, in tree order
+            features: Original feature position per parcel
+            bounds: Projected ``(minx, miny, maxx, maxy)`` per parcel
+            nodes: Node boxes of every level above the parcels, bottom up
+            level_offsets: Start of each level in ``nodes`` (plus the end)
+            wkb: Concatenated projected WKB geometries (uint8)
+            wkb_offsets: Start of each geometry in ``wkb`` (plus the end)
+            ref_lat: Latitude of the projection's reference parallel
+            node_size: Children per node
+        """
+        _require_shapely()
+        self.keys = keys
+        self.features = features
+        self.bounds = bounds
+        self.nodes = nodes
+        self.level_offsets = level_offsets
+        self.wkb = wkb
+        self.wkb_offsets = wkb_offsets
+        self.ref_lat = float(ref_lat)
+        self.node_size = int(node_size)
+        self._geometries = np.full(len(keys), None, dtype=object)
+        self._scale = np.array([
+            math.radians(1) * EARTH_RADIUS_M * math.cos(math.radians(self.ref_lat)),
+            math.radians(1) * EARTH_RADIUS_M,
+        ])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def project(self, lon: Any, lat: Any) -> np.ndarray:
+        """Longitude/latitude to the index's planar coordinates, as ``(n, 2)``."""
+        lonlat = np.column_stack([np.atleast_1d(lon), np.atleast_1d(lat)]).astype(np.float64)
+        return lonlat * self._scale
+
+    @classmethod
+    def build(
+        cls, geometries: np.ndarray, keys: np.ndarray, node_size: int = NODE_SIZE,
+    ) -> 'ParcelIndex':
+        """
+        Build an index from lon/lat shapely geometries.
+
+        Args:
+            geometries: Shapely geometries (None or empty are left out)
+            keys: TMK key per geometry
+            node_size: Children per node
+
+        Returns:
+            ParcelIndex
+        """
+        _require_shapely()
+        geometries = np.asarray(geometries, dtype=object)
+        keep = np.flatnonzero(~(shapely.is_missing(geometries) | shapely.is_empty(geometries)))
+        geometries, keys = geometries[keep], np.asarray(keys, dtype=np.int64)[keep]
+
+        lonlat_bounds = shapely.bounds(geometries)
+        ref_lat = (
+            float(np.mean((lonlat_bounds[:, 1] + lonlat_bounds[:, 3]) / 2)) if len(keep) else 0.0
+        )
+        scale = np.array([
+            math.radians(1) * EARTH_RADIUS_M * math.cos(math.radians(ref_lat)),
+            math.radians(1) * EARTH_RADIUS_M,
+        ])
+        projected = shapely.transform(geometries, lambda coords: coords * scale)
+        bounds = shapely.bounds(projected)
+
+        # Sort-Tile-Recursive: slices by x center, then y center within slices
+        n = len(bounds)
+        leaves = max(1, math.ceil(n / node_size))
+        slice_items = math.ceil(leaves / math.ceil(math.sqrt(leaves))) * node_size
+        cx, cy = (bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2
+        by_x = np.argsort(cx, kind='stable')
+        order = np.lexsort((cy[by_x], np.arange(n) // slice_items))
+        order = by_x[order]
+
+        bounds = bounds[order]
+        levels = []
+        level = bounds
+        while len(level) > 1:
+            starts = np.arange(0, len(level), node_size)
+            level = np.column_stack([
+                np.minimum.reduceat(level[:, 0], starts), np.minimum.reduceat(level[:, 1], starts),
+                np.maximum.reduceat(level[:, 2], starts), np.maximum.reduceat(level[:, 3], starts),
+            ])
+            levels.append(level)
+
+        wkb = shapely.to_wkb(projected[order])
+        lengths = np.fromiter((len(b) for b in wkb), dtype=np.int64, count=len(wkb))
+        level_sizes = [len(level) for level in levels]
+
+        return cls(
+            keys=keys[order],
+            features=keep[order].astype(np.int64),
+            bounds=bounds,
+            nodes=np.concatenate(levels) if levels else np.zeros((0, 4)),
+            level_offsets=np.concatenate([[0], np.cumsum(level_sizes)]).astype(np.int64),
+            wkb=np.frombuffer(b''.join(wkb), dtype=np.uint8),
+            wkb_offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            ref_lat=ref_lat,
+            node_size=node_size,
+        )
+
+    @classmethod
+    def from_features(
+        cls, features: List[Dict[str, Any]], node_size: int = NODE_SIZE,
+    ) -> 'ParcelIndex':
+        """
+        Build an index from GeoJSON features keyed by ``feature_keys``.
+
+        Args:
+            features: GeoJSON parcel features (lon/lat)
+            node_size: Children per node
+
+        Returns:
+            ParcelIndex whose ``features`` map back to positions in ``features``
+        """
+        _require_shapely()
+        geometries = np.array([
+            shapely.geometry.shape(f['geometry']) if f.get('geometry') else None for f in features
+        ], dtype=object)
+        index = cls.build(geometries, feature_keys(features), node_size=node_size)
+        logger.info(f"Indexed {len(index):,} of {len(features):,} parcel geometries")
+        return index
+
+    def save(self, directory: Path) -> None:
+        """Write the index arrays as ``.npy`` files plus ``index.json``."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        (directory / self.META_FILE).write_text(json.dumps({
+            'ref_lat': self.ref_lat, 'node_size': self.node_size, 'parcels': len(self),
+        }))
+
+    @classmethod
+    def load(cls, directory: Path) -> 'ParcelIndex':
+        """Open a saved index; arrays are memory-mapped, geometries decoded on demand."""
+        directory = Path(directory)
+        meta = json.loads((directory / cls.META_FILE).read_text())
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode='r') for name in cls.ARRAYS}
+        return cls(**arrays, ref_lat=meta['ref_lat'], node_size=meta['node_size'])
+
+    def geometries(self, items: np.ndarray) -> np.ndarray:
+        """Projected geometries of parcels (tree positions), decoding each once."""
+        items = np.asarray(items, dtype=np.int64)
+        missing = np.unique(items[shapely.is_missing(self._geometries[items])])
+        if len(missing):
+            offsets = self.wkb_offsets
+            self._geometries[missing] = shapely.from_wkb([
+                self.wkb[offsets[i]:offsets[i + 1]].tobytes() for i in missing
+            ])
+        return self._geometries[items]
+
+    def _candidates(self, boxes: np.ndarray) -> tuple:
+        """(query, parcel) pairs whose bounding boxes intersect the query boxes."""
+        queries = np.arange(len(boxes))
+        n_levels = len(self.level_offsets) - 1
+        if n_levels == 0:
+            query = np.repeat(queries, len(self.bounds))
+            node = np.tile(np.arange(len(self.bounds)), len(boxes))
+        else:
+            top = self.nodes[self.level_offsets[-2]:self.level_offsets[-1]]
+            query, node = np.repeat(queries, len(top)), np.tile(np.arange(len(top)), len(boxes))
+            for level in range(n_levels - 1, -1, -1):
+                level_boxes = self.nodes[self.level_offsets[level]:self.level_offsets[level + 1]]
+                hit = _intersects(boxes[query], level_boxes[node])
+                query, node = query[hit], node[hit]
+                if level == 0:
+                    below = len(self.bounds)
+                else:
+                    below = self.level_offsets[level] - self.level_offsets[level - 1]
+                children = (node[:, None] * self.node_size + np.arange(self.node_size)).ravel()
+                query = np.repeat(query, self.node_size)
+                valid = children < below
+                query, node = query[valid], children[valid]
+
+        hit = _intersects(boxes[query], np.asarray(self.bounds)[node])
+        return query[hit], node[hit]
+
+    def contains(self, lon: Any, lat: Any) -> pd.DataFrame:
+        """
+        Batch point-in-polygon: every parcel containing each point.
+
+        Args:
+            lon: Point longitudes
+            lat: Point latitudes
+
+        Returns:
+            DataFrame with ``point`` (input position), ``tmk_key`` and
+            ``feature``; a point may match several parcels (e.g. CPR units
+            sharing a footprint) or none
+        """
+        xy = self.project(lon, lat)
+        query, item = self._candidates(np.hstack([xy, xy]))
+        inside = shapely.intersects_xy(self.geometries(item), xy[query, 0], xy[query, 1])
+        query, item = query[inside], item[inside]
+        return pd.DataFrame({
+            'point': query,
+            'tmk_key': np.asarray(self.keys)[item],
+            'feature': np.asarray(self.features)[item],
+        }).sort_values(['point', 'feature'], ignore_index=True)
+
+    def locate(self, lon: Any, lat: Any) -> np.ndarray:
+        """
+        One containing parcel's TMK key per point (TMK_NULL where none).
+
+        Where parcels overlap, the one earliest in the source features wins.
+        """
+        from ag_dedicated.utils.tmk import TMK_NULL
+
+        matches = self.contains(lon, lat).drop_duplicates('point')
+        keys = np.full(len(np.atleast_1d(lon)), TMK_NULL, dtype=np.int64)
+        keys[matches['point'].to_numpy()] = matches['tmk_key'].to_numpy()
+        return keys
+
+    def intersecting(self, min_lon: Any, min_lat: Any, max_lon: Any, max_lat: Any) -> pd.DataFrame:
+        """
+        Parcels intersecting each lon/lat bounding box.
+
+        Args:
+            min_lon, min_lat, max_lon, max_lat: Box edges (scalars or arrays)
+
+        Returns:
+            DataFrame with ``box`` (input position), ``tmk_key`` and ``feature``
+        """
+        lo = self.project(min_lon, min_lat)
+        hi = self.project(max_lon, max_lat)
+        boxes = np.hstack([lo, hi])
+        query, item = self._candidates(boxes)
+        exact = shapely.intersects(self.geometries(item), shapely.box(*boxes[query].T))
+        query, item = query[exact], item[exact]
+        return pd.DataFrame({
+            'box': query,
+            'tmk_key': np.asarray(self.keys)[item],
+            'feature': np.asarray(self.features)[item],
+        }).sort_values(['box', 'feature'], ignore_index=True)
+
+    def nearest(
+        self,
+        lon: Any,
+        lat: Any,
+        k: int = 1,
+        max_distance: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """
+        The ``k`` nearest parcels to each point.
+
+        Search boxes around unresolved points double in size until they hold
+        ``k`` parcels within the box's radius (any closer parcel must
+        intersect the box), so only nearby geometries are ever decoded.
+
+        Args:
+            lon: Point longitudes
+            lat: Point latitudes
+            k: Parcels per point
+            max_distance: Ignore parcels farther than this many meters
+
+        Returns:
+            DataFrame with ``point``, ``rank`` (1 = nearest), ``tmk_key``,
+            ``feature`` and ``distance`` (meters; 0 inside a parcel)
+        """
+        xy = self.project(lon, lat)
+        k = min(k, len(self))
+        limit = np.inf if max_distance is None else float(max_distance)
+        # Start from roughly the spacing between parcels
+        extent = np.asarray(self.bounds)
+        if len(self):
+            width = extent[:, 2].max() - extent[:, 0].min()
+            height = extent[:, 3].max() - extent[:, 1].min()
+            spacing = max(1.0, math.sqrt(width * height / len(self)))
+            corners = np.vstack([extent[:, :2], extent[:, 2:], xy])
+            max_radius = 2 * math.hypot(*np.ptp(corners, axis=0))
+        else:
+            spacing, max_radius = 1.0, 0.0
+        radius = np.full(len(xy), spacing)
+
+        results = []
+        pending = np.arange(len(xy)) if k else np.zeros(0, dtype=np.int64)
+        while len(pending):
+            r = np.minimum(radius[pending], limit)
+            boxes = np.column_stack([xy[pending] - r[:, None], xy[pending] + r[:, None]])
+            query, item = self._candidates(boxes)
+            distance = shapely.distance(self.geometries(item), shapely.points(xy[pending][query]))
+            within = distance <= r[query]
+            found = pd.DataFrame({
+                'point': pending[query[within]], 'item': item[within], 'distance': distance[within],
+            })
+            counts = found.groupby('point').size().reindex(pending, fill_value=0).to_numpy()
+            done = (counts >= k) | (r >= limit) | (r >= max_radius)
+            results.append(found[found['point'].isin(pending[done])])
+            radius[pending] *= 2
+            pending = pending[~done]
+
+        found = pd.concat(results, ignore_index=True) if results else pd.DataFrame(
+            {'point': [], 'item': [], 'distance': []})
+        found = found.sort_values(['point', 'distance', 'item'], ignore_index=True)
+        found = found[found.groupby('point').cumcount() < k]
+        items = found['item'].to_numpy(dtype=np.int64)
+        return pd.DataFrame({
+            'point': found['point'].to_numpy(dtype=np.int64),
+            'rank': found.groupby('point').cumcount().to_numpy() + 1,
+            'tmk_key': np.asarray(self.keys)[items],
+            'feature': np.asarray(self.features)[items],
+            'distance': found['distance'].to_numpy(),
+        })
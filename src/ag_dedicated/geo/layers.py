@@ -0,0 +1,188 @@
+"""
+Stream parcel geometries for dedicated TMKs out of a statewide parcel layer.
+
+A statewide layer holds hundreds of thousands of parcels, of which the map
+needs about a thousand. Features are read in batches (GeoPackage and
+shapefile through pyogrio's Arrow reader, GeoJSON-lines line by line).
+Each batch's TMK column is encoded and tested against a hash set of base
+parcel keys, and only matching rows have their geometry decoded. Peak
+memory therefore follows the matched parcels, not the layer.
+
+Dedications on CPR units (``ded_tmk`` with a non-zero CPR number) match
+their base parcel's geometry, and each matched parcel yields one feature
+per dedicated unit, like the features in ``website/parcels_cdl.json``.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.geo.zonal import GEOJSON_CRS, _require_rasterio
+from ag_dedicated.utils.tmk import TMK_NULL, base_parcel_keys, encode_tmks, format_tmks
+
+# Optional layer reader (pip install ag-dedicated[geo])
+try:
+    import pyogrio
+    import shapely
+
+    PYOGRIO_AVAILABLE = True
+except ImportError:
+    PYOGRIO_AVAILABLE = False
+
+
+GEOJSONL_SUFFIXES = ('.geojsonl', '.geojsons', '.geojsonseq', '.ndjson', '.jsonl')
+
+
+def _require_pyogrio() -> None:
+    if not PYOGRIO_AVAILABLE:
+        raise ImportError("Reading parcel layers requires pyogrio: pip install ag-dedicated[geo]")
+
+
+def dedicated_units(tmks: Iterable[Any]) -> Dict[int, List[int]]:
+    """
+    Map base parcel keys to the dedicated keys (parcels or CPR units) on them.
+
+    Args:
+        tmks: Dedication TMKs in any form ``encode_tmks`` accepts
+
+    Returns:
+        Base parcel key -> sorted unique dedicated keys
+    """
+    keys = np.unique(encode_tmks(tmks))
+    keys = keys[keys != TMK_NULL]
+    units: Dict[int, List[int]] = {}
+    for base, key in zip(base_parcel_keys(keys).tolist(), keys.tolist()):
+        units.setdefault(base, []).append(key)
+    return units
+
+
+def _layer_batches(
+    path: Path,
+    tmk_field: str,
+    layer: Optional[str],
+    batch_size: int,
+) -> Iterator[Tuple[List[Any], Any, Optional[str]]]:
+    """Yield ``(tmk values, geometries, crs)`` batches, geometries undecoded."""
+    if path.suffix.lower() in GEOJSONL_SUFFIXES:
+        with open(path, 'r') as f:
+            while True:
+                lines = [line for line in (f.readline() for _ in range(batch_size)) if line.strip()]
+                if not lines:
+                    break
+                # Strip RFC 8142 record separators
+                records = [json.loads(line.lstrip('\x1e')) for line in lines]
+                yield (
+                    [(r.get('properties') or {}).get(tmk_field) for r in records],
+                    [r.get('geometry') for r in records],
+                    None,
+                )
+        return
+
+    _require_pyogrio()
+    with pyogrio.open_arrow(
+        path, layer=layer, columns=[tmk_field], batch_size=batch_size, use_pyarrow=True,
+    ) as (meta, reader):
+        geometry_name = meta['geometry_name'] or 'wkb_geometry'
+        for batch in reader:
+            yield batch.column(tmk_field).to_pylist(), batch.column(geometry_name), meta['crs']
+
+
+def stream_parcel_features(
+    tmks: Iterable[Any],
+    path: Optional[Path] = None,
+    config: Optional[Settings] = None,
+    tmk_field: Optional[str] = None,
+    layer: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield GeoJSON features for the layer parcels that carry dedications.
+
+    Args:
+        tmks: Dedication TMKs (parcels or CPR units)
+        path: GeoPackage, shapefile, GeoJSON-lines, or any other OGR source
+            (default: ``paths.parcel_layer``)
+        config: Configuration (default: Settings())
+        tmk_field: Layer attribute holding the parcel TMK (default:
+            ``parcel_layer.tmk_field``)
+        layer: Layer name within a multi-layer source (default:
+            ``parcel_layer.layer``)
+        batch_size: Features read per batch (default: ``parcel_layer.batch_size``)
+
+    Yields:
+        One feature per dedicated unit with ``tmk`` (9-digit parcel),
+        ``tmk_fmt`` and ``ded_tmk`` (12-digit unit) properties and the
+        parcel's lon/lat geometry. A parcel listed more than once in the
+        layer is taken from its first occurrence.
+    """
+    config = config or Settings()
+    path = Path(path or config.get_path('paths.parcel_layer'))
+    tmk_field = tmk_field or config.get('parcel_layer.tmk_field', 'TMK')
+    layer = layer or config.get('parcel_layer.layer')
+    batch_size = batch_size or config.get('parcel_layer.batch_size', 50000)
+
+    units = dedicated_units(tmks)
+    wanted = np.fromiter(units, dtype=np.int64, count=len(units))
+    seen = set()
+    scanned = matched = 0
+
+    for values, geometries, crs in _layer_batches(path, tmk_field, layer, batch_size):
+        scanned += len(values)
+        bases = base_parcel_keys(encode_tmks(values))
+        rows = []
+        for row in np.flatnonzero(np.isin(bases, wanted)).tolist():
+            if bases[row] not in seen:
+                seen.add(bases[row])
+                rows.append(row)
+        if not rows:
+            continue
+
+        if crs is None:
+            shapes = [geometries[row] for row in rows]
+        else:
+            decoded = shapely.from_wkb(geometries.take(rows).to_pylist())
+            shapes = [json.loads(g) if g else None for g in shapely.to_geojson(decoded).tolist()]
+            present = [i for i, shape in enumerate(shapes) if shape]
+            if present and crs != GEOJSON_CRS:
+                _require_rasterio()
+                from rasterio.warp import transform_geom
+                projected = transform_geom(crs, GEOJSON_CRS, [shapes[i] for i in present])
+                for i, shape in zip(present, projected):
+                    shapes[i] = shape
+
+        base_keys = [int(bases[row]) for row in rows]
+        unit_keys = [key for base in base_keys for key in units[base]]
+        parcel_tmks = iter(zip(format_tmks(base_keys, 'parcel'), format_tmks(base_keys, 'dashed')))
+        ded_tmks = iter(format_tmks(unit_keys, 'qpublic'))
+        for base, shape in zip(base_keys, shapes):
+            tmk, tmk_fmt = next(parcel_tmks)
+            for _ in units[base]:
+                matched += 1
+                yield {
+                    'type': 'Feature',
+                    'properties': {'tmk': tmk, 'tmk_fmt': tmk_fmt, 'ded_tmk': next(ded_tmks)},
+                    'geometry': shape,
+                }
+
+    logger.info(
+        f"Matched {len(seen):,} of {len(units):,} dedicated parcels ({matched:,} features) "
+        f"in {scanned:,} layer features of {path.name}"
+    )
+
+
+def load_parcel_layer(
+    tmks: Iterable[Any], path: Optional[Path] = None, **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Collect ``stream_parcel_features`` into a list of map features.
+
+    Examples:
+        >>> features = load_parcel_layer(dedications['Parcel ID (TMK)'])
+        >>> attach_dedications(features, dedications)
+        >>> attach_land_use(features, zonal_stats(features))
+    """
+    return list(stream_parcel_features(tmks, path, **kwargs))
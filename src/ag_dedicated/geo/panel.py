@@ -0,0 +1,302 @@
+"""
+Parcel-by-year land use from a stack of yearly CDL rasters.
+
+The yearly rasters are resampled once onto a common grid and stored as a
+single memory-mapped ``(years, height, width)`` array. Each parcel's
+pixels are located once, as flat indices into that grid, and the same
+index lists are read from every year's band. The panel has one typed row
+per parcel and year and joins to petitions on ``tmk_key`` and year.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.geo.parcels import feature_keys
+from ag_dedicated.geo.zonal import (
+    CATEGORIES,
+    GEOJSON_CRS,
+    CDLLegend,
+    _require_rasterio,
+    class_shares,
+    parcel_mask,
+    pixel_windows,
+)
+
+
+class RasterStack:
+    """
+    Yearly rasters aligned to one grid, memory-mapped from ``stack.npy``.
+
+    ``stack.json`` alongside records the years (in band order), CRS,
+    affine transform, and nodata value.
+    """
+
+    DATA_FILE = 'stack.npy'
+    META_FILE = 'stack.json'
+
+    def __init__(self, directory: Path):
+        """
+        Open a stack written by ``RasterStack.build``.
+
+        Args:
+            directory: Stack directory
+        """
+        self.directory = Path(directory)
+        meta = json.loads((self.directory / self.META_FILE).read_text())
+        self.years: List[int] = meta['years']
+        self.crs: str = meta['crs']
+        self.transform_coefficients: List[float] = meta['transform']
+        self.nodata: Optional[float] = meta['nodata']
+        self.data = np.load(self.directory / self.DATA_FILE, mmap_mode='r')
+
+    @property
+    def shape(self) -> tuple:
+        """Grid (height, width)."""
+        return self.data.shape[1:]
+
+    @property
+    def transform(self) -> Any:
+        """Grid affine transform."""
+        from affine import Affine
+        return Affine(*self.transform_coefficients)
+
+    def band(self, year: int) -> np.ndarray:
+        """One year's memory-mapped ``(height, width)`` band."""
+        return self.data[self.years.index(year)]
+
+    @classmethod
+    def build(
+        cls,
+        rasters: Mapping[int, Path],
+        directory: Path,
+        reference_year: Optional[int] = None,
+    ) -> 'RasterStack':
+        """
+        Resample yearly rasters onto a common grid and write the stack.
+
+        Rasters already on the reference grid are copied block by block;
+        others are reprojected with nearest-neighbour resampling (class
+        codes must not be interpolated).
+
+        Args:
+            rasters: Year -> single-band GeoTIFF path
+            directory: Output directory
+            reference_year: Year whose grid the stack uses (default: latest)
+
+        Returns:
+            The opened stack
+        """
+        _require_rasterio()
+        import rasterio
+        from rasterio.warp import Resampling, reproject
+
+        years = sorted(rasters)
+        reference_year = years[-1] if reference_year is None else reference_year
+        with rasterio.open(rasters[reference_year]) as ref:
+            crs, transform, shape = ref.crs, ref.transform, ref.shape
+            dtype, nodata = ref.dtypes[0], ref.nodata
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        data = np.lib.format.open_memmap(
+            directory / cls.DATA_FILE, mode='w+', dtype=dtype, shape=(len(years),) + tuple(shape),
+        )
+        for i, year in enumerate(years):
+            with rasterio.open(rasters[year]) as src:
+                if src.crs == crs and src.transform == transform and src.shape == shape:
+                    for _, window in src.block_windows(1):
+                        rows, cols = window.toslices()
+                        data[i, rows, cols] = src.read(1, window=window)
+                else:
+                    data[i] = nodata if nodata is not None else 0
+                    reproject(
+                        rasterio.band(src, 1), data[i],
+                        dst_transform=transform, dst_crs=crs, dst_nodata=nodata,
+                        resampling=Resampling.nearest,
+                    )
+            logger.info(f"Stacked {year} from {Path(rasters[year]).name}")
+        data.flush()
+        del data
+
+        (directory / cls.META_FILE).write_text(json.dumps({
+            'years': years,
+            'crs': crs.to_string(),
+            'transform': list(transform)[:6],
+            'nodata': nodata,
+        }, indent=2))
+        return cls(directory)
+
+
+class ParcelPixels:
+    """
+    Flat pixel indices of each parcel on a grid, in CSR form.
+
+    Parcel ``i`` covers ``indices[offsets[i]:offsets[i + 1]]`` of the
+    row-major ``height * width`` grid. Built once (needs rasterio) and
+    reusable for every year of a stack; ``save``/``load`` need only NumPy.
+    """
+
+    def __init__(self, keys: np.ndarray, offsets: np.ndarray, indices: np.ndarray, shape: tuple):
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.shape = tuple(int(v) for v in shape)
+        # Reading in index order keeps memory-mapped access sequential
+        self._order = np.argsort(self.indices, kind='stable')
+        self._sorted = self.indices[self._order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def parcel_ids(self) -> np.ndarray:
+        """Parcel position of each entry in ``indices``."""
+        return np.repeat(np.arange(len(self.keys)), np.diff(self.offsets))
+
+    @classmethod
+    def from_features(
+        cls,
+        features: List[Dict[str, Any]],
+        stack: RasterStack,
+        crs: str = GEOJSON_CRS,
+    ) -> 'ParcelPixels':
+        """
+        Locate each parcel's pixels on a stack's grid.
+
+        Args:
+            features: GeoJSON parcel features
+            stack: Stack whose grid to use
+            crs: CRS of the feature geometries
+
+        Returns:
+            Pixel lists keyed by ``feature_keys(features)``
+        """
+        _require_rasterio()
+        from rasterio.warp import transform_geom
+
+        geometries = [f.get('geometry') for f in features]
+        present = [i for i, g in enumerate(geometries) if g]
+        if present:
+            projected = transform_geom(crs, stack.crs, [geometries[i] for i in present])
+            for i, geometry in zip(present, projected):
+                geometries[i] = geometry
+
+        transform, (height, width) = stack.transform, stack.shape
+        windows = pixel_windows(geometries, transform, (height, width))
+        chunks = []
+        counts = np.zeros(len(features), dtype=np.int64)
+        for i in present:
+            r0, _, c0, _ = windows[i]
+            rows, cols = np.nonzero(parcel_mask(geometries[i], windows[i], transform))
+            chunks.append((rows + r0) * width + (cols + c0))
+            counts[i] = len(rows)
+
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        indices = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+        return cls(feature_keys(features), offsets, indices, (height, width))
+
+    def save(self, path: Path) -> None:
+        """Write to an ``.npz`` file."""
+        np.savez(
+            path, keys=self.keys, offsets=self.offsets, indices=self.indices,
+            shape=np.array(self.shape),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'ParcelPixels':
+        """Read a file written by ``save``."""
+        with np.load(path) as data:
+            return cls(data['keys'], data['offsets'], data['indices'], tuple(data['shape']))
+
+    def read(self, band: np.ndarray) -> np.ndarray:
+        """Values of every parcel pixel in one band, aligned with ``indices``."""
+        if tuple(band.shape) != self.shape:
+            raise ValueError(f"Band shape {band.shape} does not match the pixel grid {self.shape}")
+        values = np.empty(len(self.indices), dtype=band.dtype)
+        values[self._order] = band.reshape(-1)[self._sorted]
+        return values
+
+
+def land_use_panel(
+    stack: RasterStack,
+    pixels: ParcelPixels,
+    legend: Optional[CDLLegend] = None,
+    years: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    """
+    Land-use percentages for every parcel and year of a stack.
+
+    Args:
+        stack: Yearly raster stack
+        pixels: Parcel pixel lists on the stack's grid
+        legend: Code lookup tables (default: from the ``cdl`` config)
+        years: Years to include (default: all in the stack)
+
+    Returns:
+        One row per parcel and year: ``tmk_key`` (int64), ``year`` (int16),
+        ``pixels`` (int32), the ``CATEGORIES`` (float32 percent),
+        ``top_crop`` (categorical) and ``top_crop_pct`` (float32)
+    """
+    legend = (legend or CDLLegend.from_config()).with_nodata(stack.nodata)
+    years = years or stack.years
+    n_parcels, n_classes = len(pixels), len(legend.names)
+    parcel_ids = pixels.parcel_ids
+
+    frames = []
+    for year in years:
+        classes = legend.class_lut[pixels.read(stack.band(year))]
+        counted = classes >= 0
+        counts = np.bincount(
+            parcel_ids[counted] * n_classes + classes[counted], minlength=n_parcels * n_classes,
+        ).reshape(n_parcels, n_classes)
+        shares = class_shares(counts, legend)
+        shares.insert(0, 'year', np.int16(year))
+        shares.insert(0, 'tmk_key', pixels.keys)
+        frames.append(shares)
+
+    panel = pd.concat(frames, ignore_index=True)
+    panel['pixels'] = panel['pixels'].astype(np.int32)
+    panel[CATEGORIES + ['top_crop_pct']] = panel[CATEGORIES + ['top_crop_pct']].astype(np.float32)
+    panel['top_crop'] = pd.Categorical(panel['top_crop'], categories=legend.names)
+    logger.info(f"Land-use panel: {n_parcels:,} parcels x {len(years)} years")
+    return panel
+
+
+def petition_land_use(
+    panel: pd.DataFrame,
+    petitions: pd.DataFrame,
+    start_col: str = 'start_year',
+    end_col: str = 'end_year',
+) -> pd.DataFrame:
+    """
+    Summarize each petition's land use over the panel years within its term.
+
+    Args:
+        panel: ``land_use_panel`` output
+        petitions: Rows with ``tmk_key`` and start/end year columns (e.g.
+            ``build_lifecycle`` output with a start year column added)
+        start_col: First year of the term
+        end_col: Last year of the term (inclusive)
+
+    Returns:
+        ``petitions`` plus ``years_observed`` and, for each category, its
+        mean and minimum percentage over the observed years
+    """
+    terms = petitions[['tmk_key', start_col, end_col]].copy()
+    terms['row'] = np.arange(len(petitions))
+    joined = terms.merge(panel[panel['pixels'] > 0], on='tmk_key', how='inner')
+    joined = joined[(joined['year'] >= joined[start_col]) & (joined['year'] <= joined[end_col])]
+
+    grouped = joined.groupby('row')
+    summary = grouped[CATEGORIES].agg(['mean', 'min'])
+    summary.columns = [f"{category}_{stat}" for category, stat in summary.columns]
+    summary.insert(0, 'years_observed', grouped.size())
+
+    result = petitions.reset_index(drop=True).join(summary.reindex(range(len(petitions))))
+    result['years_observed'] = result['years_observed'].fillna(0).astype(np.int16)
+    return result
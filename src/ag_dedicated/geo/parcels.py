@@ -0,0 +1,202 @@
+"""Build the parcel map data (``website/parcels_cdl.json``) from parcel geometries."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.utils.tmk import TMK_NULL, base_parcel_keys, encode_tmks
+from ag_dedicated.utils.validation import decode_petitions
+
+
+def load_parcel_features(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load parcel features from a GeoJSON FeatureCollection.
+
+    Args:
+        path: Path to GeoJSON file
+
+    Returns:
+        List of GeoJSON feature dictionaries
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    features = data.get('features', [])
+    logger.info(f"Loaded {len(features):,} parcel features from {path.name}")
+    return features
+
+
+def feature_keys(features: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Get the TMK key of the dedicated unit each feature represents.
+
+    Features carry the dedicated TMK (including CPR unit) in ``ded_tmk`` and
+    the base parcel in ``tmk``; the base parcel is used when ``ded_tmk`` is
+    missing.
+
+    Args:
+        features: GeoJSON features
+
+    Returns:
+        int64 array of keys aligned with ``features``
+    """
+    props = [f.get('properties', {}) for f in features]
+    ded_keys = encode_tmks([p.get('ded_tmk') for p in props])
+    base_keys = base_parcel_keys(encode_tmks([p.get('tmk') for p in props]))
+    return np.where(ded_keys != TMK_NULL, ded_keys, base_keys)
+
+
+def attach_dedications(
+    features: List[Dict[str, Any]],
+    dedications: pd.DataFrame,
+    tmk_col: str = 'Parcel ID (TMK)',
+    petition_col: str = 'Petition Number',
+    end_year_col: str = 'End Year',
+) -> List[Dict[str, Any]]:
+    """
+    Set each feature's ``petitions`` list from a dedication table.
+
+    The join is on the integer TMK key, so the TMK formats on each side
+    don't matter.
+
+    Args:
+        features: GeoJSON features (modified in place)
+        dedications: Dedication rows to attach (e.g. one snapshot year)
+        tmk_col: TMK column in ``dedications``
+        petition_col: Petition number column in ``dedications``
+        end_year_col: End year column in ``dedications``
+
+    Returns:
+        The same list of features
+    """
+    ded = pd.DataFrame({
+        'key': encode_tmks(dedications[tmk_col]),
+        'number': dedications[petition_col].astype('string').to_numpy(),
+        'end_year': pd.to_numeric(dedications[end_year_col], errors='coerce').astype('Int64'),
+        'term': decode_petitions(dedications[petition_col])['term'].to_numpy(),
+    })
+    ded = ded[(ded['key'] != TMK_NULL) & ded['number'].notna()]
+    ded = ded.drop_duplicates(['key', 'number'])
+
+    parcels = pd.DataFrame({'idx': np.arange(len(features)), 'key': feature_keys(features)})
+    joined = parcels.merge(ded, on='key', how='inner')
+
+    petitions: Dict[int, List[Dict[str, Any]]] = {}
+    for idx, group in joined.groupby('idx', sort=False):
+        petitions[idx] = [
+            {
+                'number': str(number),
+                'end_year': None if pd.isna(end_year) else int(end_year),
+                'type': 'unknown' if pd.isna(term) else f"{int(term)}-year",
+            }
+            for number, end_year, term in zip(group['number'], group['end_year'], group['term'])
+        ]
+
+    for idx, feature in enumerate(features):
+        feature.setdefault('properties', {})['petitions'] = petitions.get(idx, [])
+
+    logger.info(
+        f"Attached {len(joined):,} petitions to {len(petitions):,} of "
+        f"{len(features):,} parcels"
+    )
+    return features
+
+
+def attach_properties(
+    features: List[Dict[str, Any]],
+    table: pd.DataFrame,
+    tmk_col: str,
+    columns: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    """
+    Copy columns from a per-parcel table (scrape results, CDL stats) onto features.
+
+    Args:
+        features: GeoJSON features (modified in place)
+        table: Table with one row per parcel or CPR unit
+        tmk_col: TMK column in ``table``
+        columns: Mapping of table column to feature property name
+
+    Returns:
+        The same list of features
+    """
+    values = table[list(columns)].rename(columns=columns)
+    values['key'] = encode_tmks(table[tmk_col])
+    values = values[values['key'] != TMK_NULL].drop_duplicates('key')
+
+    parcels = pd.DataFrame({'idx': np.arange(len(features)), 'key': feature_keys(features)})
+    joined = parcels.merge(values, on='key', how='inner')
+
+    props = list(columns.values())
+    for row in joined.itertuples(index=False):
+        record = row._asdict()
+        target = features[record['idx']].setdefault('properties', {})
+        for prop in props:
+            value = record[prop]
+            target[prop] = None if pd.isna(value) else value
+
+    logger.info(f"Attached {len(props)} properties to {len(joined):,} parcels")
+    return features
+
+
+def write_parcel_map(
+    features: List[Dict[str, Any]],
+    output_path: Path,
+    js_path: Optional[Path] = None,
+    packed_path: Optional[Path] = None,
+) -> None:
+    """
+    Write features as a GeoJSON FeatureCollection for the website.
+
+    Args:
+        features: GeoJSON features
+        output_path: Path for the ``.json`` file
+        js_path: Optional path for the ``window.__parcelData`` script fallback
+        packed_path: Optional path for the packed binary export the site
+            loads first (see ``ag_dedicated.geo.packed``)
+    """
+    payload = json.dumps({'type': 'FeatureCollection', 'features': features})
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(payload)
+    logger.info(f"Saved {len(features):,} parcels to {output_path}")
+
+    if js_path:
+        js_path.write_text(f"window.__parcelData = {payload};\n")
+        logger.debug(f"Saved script fallback to {js_path}")
+
+    if packed_path:
+        from ag_dedicated.geo.packed import write_packed_parcels
+        write_packed_parcels(features, packed_path)
+
+
+def build_parcel_map(
+    parcels_path: Path,
+    dedications: pd.DataFrame,
+    output_path: Path,
+    js_path: Optional[Path] = None,
+    tmk_col: str = 'Parcel ID (TMK)',
+    packed_path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Rebuild the parcel map data with current dedications attached.
+
+    Args:
+        parcels_path: GeoJSON with parcel geometries and CDL properties
+        dedications: Dedication rows to attach
+        output_path: Output GeoJSON path
+        js_path: Optional script fallback path
+        tmk_col: TMK column in ``dedications``
+        packed_path: Optional packed binary export path
+
+    Returns:
+        List of output features
+    """
+    features = load_parcel_features(parcels_path)
+    attach_dedications(features, dedications, tmk_col=tmk_col)
+    write_parcel_map(features, output_path, js_path=js_path, packed_path=packed_path)
+    return features
@@ -0,0 +1,200 @@
+"""
+Static Mapbox Vector Tile pyramid for the parcel map.
+
+Parcels are projected to Web Mercator once. For each zoom level they are
+simplified with a tolerance of a few tile units, split over the tiles
+their bounds touch, clipped to each tile (plus a small buffer so strokes
+don't show seams), and quantized to the tile extent. Tiles are written
+as ``{z}/{x}/{y}.pbf`` with a TileJSON ``tiles.json`` alongside, so the
+site can fetch only the tiles in view from static hosting.
+"""
+
+import json
+import math
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+
+# Optional tile encoder (pip install ag-dedicated[geo])
+try:
+    import mapbox_vector_tile
+    import shapely
+    from mapbox_vector_tile.encoder import on_invalid_geometry_ignore
+
+    MVT_AVAILABLE = True
+except ImportError:
+    MVT_AVAILABLE = False
+
+
+EARTH_RADIUS_M = 6_378_137.0
+WORLD_HALF = math.pi * EARTH_RADIUS_M
+LAYER_NAME = 'parcels'
+TILEJSON_FILE = 'tiles.json'
+
+
+def _require_mvt() -> None:
+    if not MVT_AVAILABLE:
+        raise ImportError(
+            "Building vector tiles requires mapbox-vector-tile: pip install ag-dedicated[geo]"
+        )
+
+
+def web_mercator(coords: np.ndarray) -> np.ndarray:
+    """Lon/lat ``(n, 2)`` coordinates to Web Mercator meters."""
+    lon = np.radians(coords[:, 0])
+    lat = np.radians(np.clip(coords[:, 1], -85.05112878, 85.05112878))
+    y = np.log(np.tan(math.pi / 4 + lat / 2))
+    return np.column_stack([EARTH_RADIUS_M * lon, EARTH_RADIUS_M * y])
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple:
+    """Web Mercator ``(minx, miny, maxx, maxy)`` of tile ``z/x/y``."""
+    size = 2 * WORLD_HALF / 2 ** z
+    return (
+        -WORLD_HALF + x * size, WORLD_HALF - (y + 1) * size,
+        -WORLD_HALF + (x + 1) * size, WORLD_HALF - y * size,
+    )
+
+
+def _tile_ranges(bounds: np.ndarray, z: int, pad: float) -> np.ndarray:
+    """First and last tile column and row ``(x0, y0, x1, y1)`` each box touches."""
+    size = 2 * WORLD_HALF / 2 ** z
+    x0 = np.floor((bounds[:, 0] - pad + WORLD_HALF) / size)
+    x1 = np.floor((bounds[:, 2] + pad + WORLD_HALF) / size)
+    y0 = np.floor((WORLD_HALF - bounds[:, 3] - pad) / size)
+    y1 = np.floor((WORLD_HALF - bounds[:, 1] + pad) / size)
+    return np.clip(np.column_stack([x0, y0, x1, y1]), 0, 2 ** z - 1).astype(np.int64)
+
+
+def _tile_pairs(ranges: np.ndarray) -> tuple:
+    """Expand per-geometry tile ranges into (geometry, x, y) rows, sorted by tile."""
+    width = ranges[:, 2] - ranges[:, 0] + 1
+    counts = width * (ranges[:, 3] - ranges[:, 1] + 1)
+    geometry = np.repeat(np.arange(len(ranges)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    x = ranges[geometry, 0] + within % width[geometry]
+    y = ranges[geometry, 1] + within // width[geometry]
+    order = np.lexsort((geometry, y, x))
+    return geometry[order], x[order], y[order]
+
+
+def build_tiles(
+    features: List[Dict[str, Any]],
+    output_dir: Optional[Path] = None,
+    config: Optional[Settings] = None,
+    min_zoom: Optional[int] = None,
+    max_zoom: Optional[int] = None,
+    properties: Optional[Sequence[str]] = None,
+) -> Dict[int, int]:
+    """
+    Write a vector tile pyramid of parcel features.
+
+    Args:
+        features: GeoJSON parcel features (lon/lat)
+        output_dir: Pyramid directory, replaced if it holds an earlier
+            pyramid (default: ``paths.tiles``)
+        config: Configuration (default: Settings())
+        min_zoom: Lowest zoom written (default: ``tiles.min_zoom``)
+        max_zoom: Highest zoom written; the map overzooms beyond it
+            (default: ``tiles.max_zoom``)
+        properties: Feature properties kept in the tiles (default:
+            ``tiles.properties``). Every tile feature also carries ``id``,
+            its position in ``features``, for looking up the full record.
+
+    Returns:
+        Number of tiles written per zoom level
+
+    Examples:
+        >>> build_tiles(load_parcel_features(Path('website/parcels_cdl.json')))
+    """
+    _require_mvt()
+    config = config or Settings()
+    output_dir = Path(output_dir or config.get_path('paths.tiles'))
+    min_zoom = config.get('tiles.min_zoom', 7) if min_zoom is None else min_zoom
+    max_zoom = config.get('tiles.max_zoom', 15) if max_zoom is None else max_zoom
+    properties = list(properties or config.get('tiles.properties', ('active_ag',)))
+    extent = config.get('tiles.extent', 4096)
+    buffer = config.get('tiles.buffer', 64)
+    tolerance = config.get('tiles.tolerance', 8)
+
+    present = [i for i, f in enumerate(features) if f.get('geometry')]
+    lonlat = np.array(
+        [shapely.geometry.shape(features[i]['geometry']) for i in present], dtype=object,
+    )
+    geometries = shapely.transform(lonlat, web_mercator)
+    attributes = []
+    for i in present:
+        props = features[i].get('properties') or {}
+        values = {name: props[name] for name in properties if props.get(name) is not None}
+        values['id'] = i
+        attributes.append(values)
+
+    if (output_dir / TILEJSON_FILE).exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written: Dict[int, int] = {}
+    for z in range(min_zoom, max_zoom + 1):
+        unit = 2 * WORLD_HALF / 2 ** z / extent
+        simplified = shapely.simplify(geometries, tolerance * unit, preserve_topology=True)
+        geometry, xs, ys = _tile_pairs(_tile_ranges(shapely.bounds(simplified), z, buffer * unit))
+        starts = np.flatnonzero(np.r_[True, (np.diff(xs) != 0) | (np.diff(ys) != 0)])
+
+        written[z] = 0
+        for members, x, y in zip(np.split(geometry, starts[1:]), xs[starts], ys[starts]):
+            bounds = tile_bounds(z, int(x), int(y))
+            pad = buffer * unit
+            padded = (bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad)
+            clipped = shapely.clip_by_rect(simplified[members], *padded)
+            origin = np.array([bounds[0], bounds[3]])
+            quantized = shapely.transform(
+                clipped, lambda coords: np.rint((coords - origin) / unit * [1, -1]),
+            )
+            layer = [
+                {'geometry': shape, 'properties': attributes[m], 'id': int(attributes[m]['id'])}
+                for m, shape in zip(members, quantized) if not shape.is_empty
+            ]
+            if not layer:
+                continue
+            tile = mapbox_vector_tile.encode(
+                [{'name': LAYER_NAME, 'features': layer}],
+                default_options={
+                    'extents': extent,
+                    'y_coord_down': True,
+                    'on_invalid_geometry': on_invalid_geometry_ignore,
+                },
+            )
+            path = output_dir / str(z) / str(int(x)) / f"{int(y)}.pbf"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(tile)
+            written[z] += 1
+        logger.debug(f"Zoom {z}: {written[z]:,} tiles")
+
+    fields = {name: 'String' for name in properties}
+    for values in attributes:
+        fields.update({
+            name: 'Number' for name, value in values.items() if isinstance(value, (int, float))
+        })
+    west, south, east, north = (
+        shapely.total_bounds(lonlat) if present else (-180.0, -85.0, 180.0, 85.0)
+    )
+    (output_dir / TILEJSON_FILE).write_text(json.dumps({
+        'tilejson': '3.0.0',
+        'tiles': ['{z}/{x}/{y}.pbf'],
+        'minzoom': min_zoom,
+        'maxzoom': max_zoom,
+        'bounds': [west, south, east, north],
+        'vector_layers': [{
+            'id': LAYER_NAME, 'minzoom': min_zoom, 'maxzoom': max_zoom,
+            'fields': fields,
+        }],
+    }, indent=2))
+    logger.info(
+        f"Wrote {sum(written.values()):,} tiles for {len(present):,} parcels to {output_dir}"
+    )
+    return written
@@ -0,0 +1,332 @@
+"""
+Land-use percentages per parcel from the Cropland Data Layer (CDL) raster.
+
+For each parcel only the raster window under its bounding box is read, the
+polygon is rasterized to a pixel mask, and the masked pixels are counted
+with ``np.bincount``. Lookup tables map CDL codes to class names and class
+names to the four map categories (``active_ag``, ``pasture``, ``other_ag``,
+``non_ag``). Parcels are grouped into spatial tiles of the raster, and
+each tile (one read covering its parcels) is a task in a process pool.
+"""
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ag_dedicated.config.settings import Settings
+
+# Optional raster dependencies (pip install ag-dedicated[geo])
+try:
+    import rasterio
+    from rasterio.features import bounds as geometry_bounds
+    from rasterio.features import geometry_mask
+    from rasterio.warp import transform_geom
+    from rasterio.windows import Window
+    from rasterio.windows import transform as window_transform
+
+    RASTERIO_AVAILABLE = True
+except ImportError:
+    RASTERIO_AVAILABLE = False
+
+
+CATEGORIES = ['active_ag', 'pasture', 'other_ag', 'non_ag']
+
+UNCLASSIFIED = 'Unclassified'
+"""Class name for raster codes missing from the legend (counted as non_ag)."""
+
+# Geographic coordinates, as in GeoJSON
+GEOJSON_CRS = 'EPSG:4326'
+
+
+def _require_rasterio() -> None:
+    if not RASTERIO_AVAILABLE:
+        raise ImportError("Raster statistics require rasterio: pip install ag-dedicated[geo]")
+
+
+class CDLLegend:
+    """
+    Lookup tables from raster codes to class names and categories.
+
+    ``class_lut[code]`` is the class index of a code (-1 for ignored codes),
+    and ``class_category[class]`` the index into ``CATEGORIES``.
+    """
+
+    def __init__(
+        self,
+        classes: Mapping[str, Sequence[int]],
+        categories: Mapping[str, Sequence[str]],
+        ignore: Sequence[int] = (0,),
+        size: int = 256,
+    ):
+        """
+        Compile a legend.
+
+        Args:
+            classes: Class name -> raster codes
+            categories: Category -> class names; unlisted classes are non_ag
+            ignore: Codes excluded from the pixel counts (background, no data)
+            size: Number of possible codes (256 for 8-bit rasters)
+        """
+        unknown = set(categories) - set(CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown CDL categories {sorted(unknown)}; expected {CATEGORIES}")
+
+        self.names = list(classes) + [UNCLASSIFIED]
+        self.class_lut = np.full(size, len(self.names) - 1, dtype=np.int32)
+        for index, codes in enumerate(classes.values()):
+            self.class_lut[list(codes)] = index
+        self.class_lut[[code for code in ignore if 0 <= code < size]] = -1
+
+        self.class_category = np.full(len(self.names), CATEGORIES.index('non_ag'), dtype=np.int32)
+        position = {name: i for i, name in enumerate(self.names)}
+        for category, names in categories.items():
+            for name in names:
+                if name in position:
+                    self.class_category[position[name]] = CATEGORIES.index(category)
+
+    @classmethod
+    def from_config(cls, config: Optional[Settings] = None) -> 'CDLLegend':
+        """Compile the legend from the ``cdl`` config section."""
+        config = config or Settings()
+        return cls(
+            config.get('cdl.classes', {}),
+            config.get('cdl.categories', {}),
+            ignore=config.get('cdl.ignore', (0,)),
+        )
+
+    def with_nodata(self, nodata: Optional[float]) -> 'CDLLegend':
+        """This legend, also ignoring a raster's nodata value."""
+        if nodata is None or not 0 <= nodata < len(self.class_lut) or nodata != int(nodata):
+            return self
+        legend = object.__new__(CDLLegend)
+        legend.names = self.names
+        legend.class_lut = self.class_lut.copy()
+        legend.class_lut[int(nodata)] = -1
+        legend.class_category = self.class_category
+        return legend
+
+
+def pixel_windows(
+    geometries: Sequence[Optional[Dict[str, Any]]],
+    transform: Any,
+    shape: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Pixel extent of each geometry's bounding box, clipped to the raster.
+
+    Args:
+        geometries: GeoJSON-like geometries in the raster's CRS (None allowed)
+        transform: Raster affine transform (north-up)
+        shape: Raster (height, width)
+
+    Returns:
+        int64 array of ``(row_start, row_stop, col_start, col_stop)`` per
+        geometry; empty (start == stop) outside the raster or for None
+    """
+    if transform.b != 0 or transform.d != 0:
+        raise ValueError("Rotated rasters are not supported")
+
+    bounds = np.array([
+        geometry_bounds(g) if g else (np.nan,) * 4 for g in geometries
+    ], dtype=np.float64).reshape(-1, 4)
+    minx, miny, maxx, maxy = bounds.T
+    with np.errstate(invalid='ignore'):
+        cols = np.stack([(minx - transform.c) / transform.a, (maxx - transform.c) / transform.a])
+        rows = np.stack([(maxy - transform.f) / transform.e, (miny - transform.f) / transform.e])
+        rows.sort(axis=0)
+        cols.sort(axis=0)
+
+    height, width = shape
+    windows = np.zeros((len(bounds), 4), dtype=np.int64)
+    valid = ~np.isnan(bounds).any(axis=1)
+    windows[valid, 0] = np.clip(np.floor(rows[0, valid]), 0, height)
+    windows[valid, 1] = np.clip(np.ceil(rows[1, valid]), 0, height)
+    windows[valid, 2] = np.clip(np.floor(cols[0, valid]), 0, width)
+    windows[valid, 3] = np.clip(np.ceil(cols[1, valid]), 0, width)
+    return windows
+
+
+def parcel_mask(geometry: Dict[str, Any], window: Sequence[int], transform: Any) -> np.ndarray:
+    """
+    Boolean mask of the pixels within a geometry's window that it covers.
+
+    Pixels are included when their centers fall inside the polygon; a
+    parcel smaller than one pixel falls back to every pixel it touches.
+    """
+    r0, r1, c0, c1 = (int(v) for v in window)
+    shape = (r1 - r0, c1 - c0)
+    if not shape[0] or not shape[1]:
+        return np.zeros(shape, dtype=bool)
+    win_transform = window_transform(Window(c0, r0, shape[1], shape[0]), transform)
+    mask = geometry_mask([geometry], out_shape=shape, transform=win_transform, invert=True)
+    if not mask.any():
+        mask = geometry_mask(
+            [geometry], out_shape=shape, transform=win_transform, invert=True, all_touched=True,
+        )
+    return mask
+
+
+def _zonal_tile(
+    raster_path: str,
+    items: List[Tuple[int, Dict[str, Any], np.ndarray]],
+    legend: CDLLegend,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Class counts for the parcels of one tile (runs in a worker process).
+
+    Returns:
+        Parcel indices and their ``(parcels, classes)`` pixel counts
+    """
+    windows = np.array([window for _, _, window in items])
+    r0, c0 = windows[:, 0].min(), windows[:, 2].min()
+    r1, c1 = windows[:, 1].max(), windows[:, 3].max()
+
+    with rasterio.open(raster_path) as src:
+        data = src.read(1, window=Window(c0, r0, c1 - c0, r1 - r0))
+        transform = src.transform
+
+    n_classes = len(legend.names)
+    counts = np.zeros((len(items), n_classes), dtype=np.int64)
+    for i, (_, geometry, (pr0, pr1, pc0, pc1)) in enumerate(items):
+        sub = data[pr0 - r0:pr1 - r0, pc0 - c0:pc1 - c0]
+        classes = legend.class_lut[sub[parcel_mask(geometry, (pr0, pr1, pc0, pc1), transform)]]
+        counts[i] = np.bincount(classes[classes >= 0], minlength=n_classes)
+    return np.array([index for index, _, _ in items]), counts
+
+
+def zonal_stats(
+    features: List[Dict[str, Any]],
+    raster_path: Optional[Path] = None,
+    legend: Optional[CDLLegend] = None,
+    config: Optional[Settings] = None,
+    tile_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    crs: str = GEOJSON_CRS,
+) -> pd.DataFrame:
+    """
+    Land-use percentages for each parcel feature.
+
+    Args:
+        features: GeoJSON features (e.g. from ``load_parcel_features``)
+        raster_path: CDL GeoTIFF (default: ``paths.cdl_raster``)
+        legend: Code lookup tables (default: from the ``cdl`` config)
+        config: Configuration (default: Settings())
+        tile_size: Raster pixels per side of a work tile (default: ``cdl.tile_size``)
+        workers: Worker processes (default: ``cdl.workers``, or CPU count); 1
+            runs in this process
+        crs: CRS of the feature geometries
+
+    Returns:
+        One row per feature, in order: ``tmk``, ``pixels`` (counted pixels),
+        the ``CATEGORIES`` as percentages, ``top_crop`` (most common class)
+        and ``top_crop_pct``. Parcels with no counted pixels get NaN
+        percentages and no top class.
+
+    Examples:
+        >>> stats = zonal_stats(load_parcel_features(path))
+        >>> attach_land_use(features, stats)
+    """
+    _require_rasterio()
+    config = config or Settings()
+    raster_path = Path(raster_path or config.get_path('paths.cdl_raster'))
+    legend = legend or CDLLegend.from_config(config)
+    tile_size = tile_size or config.get('cdl.tile_size', 2048)
+    workers = workers or config.get('cdl.workers') or os.cpu_count() or 1
+
+    with rasterio.open(raster_path) as src:
+        raster_crs, transform, shape, nodata = src.crs, src.transform, src.shape, src.nodata
+    legend = legend.with_nodata(nodata)
+
+    geometries = [f.get('geometry') for f in features]
+    present = [i for i, g in enumerate(geometries) if g]
+    if present:
+        projected = transform_geom(crs, raster_crs, [geometries[i] for i in present])
+        for i, geometry in zip(present, projected):
+            geometries[i] = geometry
+    windows = pixel_windows(geometries, transform, shape)
+
+    tiles: Dict[Tuple[int, int], List[Tuple[int, Dict[str, Any], np.ndarray]]] = defaultdict(list)
+    for i in present:
+        window = windows[i]
+        if window[1] > window[0] and window[3] > window[2]:
+            tile = (window[0] // tile_size, window[2] // tile_size)
+            tiles[tile].append((i, geometries[i], window))
+
+    logger.info(
+        f"Zonal stats for {len(features):,} parcels over {len(tiles):,} tiles of {raster_path.name}"
+    )
+    counts = np.zeros((len(features), len(legend.names)), dtype=np.int64)
+    tasks = [tiles[key] for key in sorted(tiles)]
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        results = [_zonal_tile(str(raster_path), items, legend) for items in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_zonal_tile, str(raster_path), items, legend) for items in tasks]
+            results = [future.result() for future in futures]
+    for indices, tile_counts in results:
+        counts[indices] = tile_counts
+
+    stats = class_shares(counts, legend)
+    stats.insert(0, 'tmk', [f.get('properties', {}).get('tmk') for f in features])
+    return stats
+
+
+def class_shares(counts: np.ndarray, legend: CDLLegend) -> pd.DataFrame:
+    """
+    Category percentages and top class from per-parcel class counts.
+
+    Args:
+        counts: ``(parcels, classes)`` pixel counts, classes as in ``legend.names``
+        legend: Legend the counts were made with
+
+    Returns:
+        DataFrame with ``pixels``, the ``CATEGORIES`` (percent, 1 decimal),
+        ``top_crop`` and ``top_crop_pct``
+    """
+    pixels = counts.sum(axis=1)
+    category_counts = np.zeros((len(counts), len(CATEGORIES)), dtype=np.int64)
+    for c in range(len(CATEGORIES)):
+        category_counts[:, c] = counts[:, legend.class_category == c].sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shares = np.round(100 * category_counts / pixels[:, None], 1)
+        top = counts.argmax(axis=1)
+        top_pct = np.round(100 * counts[np.arange(len(counts)), top] / pixels, 1)
+
+    names = np.array(legend.names, dtype=object)
+    stats = pd.DataFrame({'pixels': pixels})
+    for c, category in enumerate(CATEGORIES):
+        stats[category] = shares[:, c]
+    stats['top_crop'] = np.where(pixels > 0, names[top], None)
+    stats['top_crop_pct'] = top_pct
+    return stats
+
+
+def attach_land_use(features: List[Dict[str, Any]], stats: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Set each feature's land-use properties from aligned ``zonal_stats`` output.
+
+    Args:
+        features: GeoJSON features (modified in place)
+        stats: ``zonal_stats`` result for the same features
+
+    Returns:
+        The same list of features
+    """
+    columns = CATEGORIES + ['top_crop', 'top_crop_pct']
+    for feature, row in zip(features, stats[columns].itertuples(index=False)):
+        props = feature.setdefault('properties', {})
+        for name, value in zip(columns, row):
+            if pd.isna(value):
+                value = None
+            elif name != 'top_crop':
+                value = float(value)
+            props[name] = value
+    return features
@@ -0,0 +1,6 @@
+"""Pipeline DAG runner with content-hash stage caching."""
+
+from ag_dedicated.pipeline.dag import Pipeline, Stage
+from ag_dedicated.pipeline.stages import build_pipeline
+
+__all__ = ["Pipeline", "Stage", "build_pipeline"]
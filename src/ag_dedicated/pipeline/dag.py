@@ -0,0 +1,355 @@
+"""Small DAG engine with content-hash stage caching and parallel execution."""
+
+import hashlib
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from loguru import logger
+
+from ag_dedicated.utils.profiling import stage as profile_stage
+
+
+STAGE_STATUSES = ['ran', 'skipped', 'failed', 'blocked', 'planned']
+
+
+def _files(path: Path) -> List[Path]:
+    """A file, or every file under a directory, in a stable order."""
+    if path.is_dir():
+        return sorted(p for p in path.rglob('*') if p.is_file())
+    return [path] if path.exists() else []
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write ``text`` to ``path`` unless the file already holds exactly that.
+
+    Unchanged outputs keep their mtime, so ``HashCache`` reuses their
+    memoized hashes and downstream stages see nothing to redo.
+
+    Returns:
+        True if the file was written
+    """
+    if path.exists() and path.read_text() == text:
+        return False
+    path.write_text(text)
+    return True
+
+
+class HashCache:
+    """
+    Content hashes of files, memoized by (size, mtime) so unchanged files are
+    not re-read on every run.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, list]] = None):
+        self.entries = entries or {}
+
+    def file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        cached = self.entries.get(str(path))
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        value = digest.hexdigest()
+        self.entries[str(path)] = [stat.st_size, stat.st_mtime_ns, value]
+        return value
+
+    def paths_hash(self, paths: Iterable[Path]) -> str:
+        """Hash of the names and contents of all files under ``paths``."""
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(str(path).encode())
+            for f in _files(path):
+                digest.update(f.relative_to(path).as_posix().encode() if f != path else b'')
+                digest.update(self.file_hash(f).encode())
+        return digest.hexdigest()
+
+
+class Stage:
+    """
+    One pipeline step with declared file inputs and outputs.
+
+    A stage's cache key covers its name, parameters, and the contents of its
+    inputs. It is skipped when that key matches the last successful run and
+    its outputs are unchanged since then.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        inputs: Sequence[Path] = (),
+        outputs: Sequence[Path] = (),
+        after: Sequence[str] = (),
+        params: Optional[Dict[str, Any]] = None,
+        description: str = '',
+    ):
+        """
+        Initialize stage.
+
+        Args:
+            name: Unique stage name
+            func: Callable doing the work
+            inputs: Files or directories the stage reads
+            outputs: Files or directories the stage writes
+            after: Extra stages to run after, beyond those implied by inputs
+            params: Settings that affect the outputs (part of the cache key)
+            description: One-line description for listings
+        """
+        self.name = name
+        self.func = func
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.after = list(after)
+        self.params = params or {}
+        self.description = description
+
+    def input_key(self, hashes: HashCache) -> str:
+        """Cache key from name, parameters, and input contents."""
+        # A file updated in place is tracked as an output, not an input
+        inputs = [p for p in self.inputs if p not in self.outputs]
+        digest = hashlib.sha256()
+        digest.update(self.name.encode())
+        digest.update(json.dumps(self.params, sort_keys=True, default=str).encode())
+        digest.update(hashes.paths_hash(inputs).encode())
+        return digest.hexdigest()
+
+    def output_key(self, hashes: HashCache) -> Optional[str]:
+        """Hash of the outputs, or None if any output is missing."""
+        if not all(p.exists() for p in self.outputs):
+            return None
+        return hashes.paths_hash(self.outputs)
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r})"
+
+
+def _within(path: Path, other: Path) -> bool:
+    return path == other or other in path.parents
+
+
+class Pipeline:
+    """
+    Run stages in dependency order, in parallel where the graph allows.
+
+    Dependencies are inferred from paths: a stage depends on every stage
+    that writes one of its inputs (or a directory containing it). Cache
+    state is kept in a JSON file between runs.
+
+    Examples:
+        >>> pipeline = Pipeline(state_path)
+        >>> pipeline.add(Stage('merge', merge, inputs=[csv_dir], outputs=[merged]))
+        >>> pipeline.add(Stage('clean', clean, inputs=[merged], outputs=[cleaned]))
+        >>> results = pipeline.run(workers=4)
+    """
+
+    def __init__(self, state_path: Path):
+        """
+        Initialize pipeline.
+
+        Args:
+            state_path: JSON file for stage cache keys and file hashes
+        """
+        self.state_path = state_path
+        self.stages: Dict[str, Stage] = {}
+        self.logger = logger.bind(name=__name__)
+
+    def add(self, stage: Stage) -> Stage:
+        """Register a stage."""
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        self.stages[stage.name] = stage
+        return stage
+
+    def dependencies(self, name: str) -> List[str]:
+        """Stages that must finish before ``name``."""
+        stage = self.stages[name]
+        deps = set(stage.after)
+        for other in self.stages.values():
+            if other.name == name:
+                continue
+            if any(_within(i, o) for i in stage.inputs for o in other.outputs):
+                deps.add(other.name)
+
+        unknown = deps - set(self.stages)
+        if unknown:
+            raise ValueError(f"Stage {name} depends on unknown stages: {sorted(unknown)}")
+        return sorted(deps)
+
+    def order(self, targets: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Topological order of the targets and everything they depend on.
+
+        Args:
+            targets: Stage names (default: all stages)
+
+        Returns:
+            Stage names, dependencies first
+        """
+        wanted = list(targets) if targets else list(self.stages)
+        for name in wanted:
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name} (available: {', '.join(self.stages)})")
+
+        ordered: List[str] = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in ordered:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage {name}")
+            visiting.add(name)
+            for dep in self.dependencies(name):
+                visit(dep)
+            visiting.discard(name)
+            ordered.append(name)
+
+        for name in wanted:
+            visit(name)
+        return ordered
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self.state_path.exists():
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        return {'stages': {}, 'files': {}}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        tmp.replace(self.state_path)
+
+    def run(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        force: bool = False,
+        workers: int = 4,
+        dry_run: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run stages whose inputs, parameters, or outputs changed.
+
+        Args:
+            targets: Stages to bring up to date (default: all)
+            force: Run every selected stage regardless of cache state
+            workers: Maximum stages running at once
+            dry_run: Only report which stages would run
+
+        Returns:
+            Mapping of stage name to ``{'status', 'seconds', 'error'}``
+        """
+        names = self.order(targets)
+        deps = {name: self.dependencies(name) for name in names}
+        state = self._load_state()
+        hashes = HashCache(state.get('files'))
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def up_to_date(
+            stage: Stage, recorded: Optional[Dict[str, Any]], hashes: HashCache,
+        ) -> bool:
+            return (
+                not force
+                and recorded is not None
+                and recorded.get('input_key') == stage.input_key(hashes)
+                and recorded.get('output_key') == stage.output_key(hashes)
+            )
+
+        if dry_run:
+            # Upstream changes are only known after upstream runs, so a stage
+            # whose dependency would run is reported as planned too
+            for name in names:
+                stage = self.stages[name]
+                upstream = any(results[d]['status'] == 'planned' for d in deps[name])
+                recorded = state['stages'].get(name)
+                stale = upstream or not up_to_date(stage, recorded, hashes)
+                status = 'planned' if stale else 'skipped'
+                results[name] = {'status': status, 'seconds': 0.0, 'error': None}
+            return results
+
+        # Workers never touch ``state`` or ``hashes``: each stage gets its own
+        # copy of the recorded entry and file hashes, and returns its updates
+        # for the main thread to apply before saving state
+        def execute(
+            stage: Stage, recorded: Optional[Dict[str, Any]], files: Dict[str, list],
+        ) -> tuple:
+            # Tag log records (and --profile timings) with the stage name;
+            # worker threads start with an empty context, so this is per stage
+            with profile_stage(stage.name):
+                return run_stage(stage, recorded, HashCache(files))
+
+        def run_stage(
+            stage: Stage, recorded: Optional[Dict[str, Any]], hashes: HashCache,
+        ) -> tuple:
+            if up_to_date(stage, recorded, hashes):
+                self.logger.info(f"[{stage.name}] up to date, skipping")
+                skipped = {'status': 'skipped', 'seconds': 0.0, 'error': None}
+                return skipped, recorded, hashes.entries
+
+            self.logger.info(f"[{stage.name}] running")
+            start = time.perf_counter()
+            stage.func()
+            seconds = time.perf_counter() - start
+
+            output_key = stage.output_key(hashes)
+            entry = None
+            if output_key is None:
+                missing = [str(p) for p in stage.outputs if not p.exists()]
+                self.logger.warning(f"[{stage.name}] did not produce: {missing}")
+            else:
+                entry = {
+                    'input_key': stage.input_key(hashes),
+                    'output_key': output_key,
+                    'finished': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                }
+            self.logger.info(f"[{stage.name}] finished in {seconds:.1f}s")
+            return {'status': 'ran', 'seconds': seconds, 'error': None}, entry, hashes.entries
+
+        pending = list(names)
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            while pending or running:
+                for name in list(pending):
+                    statuses = [results.get(d, {}).get('status') for d in deps[name]]
+                    if any(s in ('failed', 'blocked') for s in statuses):
+                        results[name] = {'status': 'blocked', 'seconds': 0.0, 'error': None}
+                        pending.remove(name)
+                    elif all(s in ('ran', 'skipped') for s in statuses):
+                        recorded = state['stages'].get(name)
+                        future = pool.submit(
+                            execute, self.stages[name], recorded, dict(hashes.entries),
+                        )
+                        running[future] = name
+                        pending.remove(name)
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name], entry, files = future.result()
+                    except Exception as e:
+                        self.logger.error(f"[{name}] failed: {e}")
+                        results[name] = {'status': 'failed', 'seconds': 0.0, 'error': str(e)}
+                    else:
+                        hashes.entries.update(files)
+                        if entry is None:
+                            state['stages'].pop(name, None)
+                        else:
+                            state['stages'][name] = entry
+                    state['files'] = hashes.entries
+                    self._save_state(state)
+
+        return {name: results[name] for name in names}
@@ -0,0 +1,182 @@
+"""Stage definitions for the full ag-dedicated pipeline."""
+
+from typing import Optional
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.pipeline.dag import Pipeline, Stage
+
+
+def build_pipeline(
+    config: Optional[Settings] = None,
+    scrape: Optional[bool] = None,
+    max_parcels: Optional[int] = None,
+) -> Pipeline:
+    """
+    Assemble the standard pipeline from config.
+
+    Stages: extract -> merge -> clean -> (scrape) -> map -> enrich, plus
+    reports, which depends on nothing and runs alongside the rest.
+
+    Args:
+        config: Settings instance
+        scrape: Include the county scrape stage (default: ``pipeline.scrape.enabled``)
+        max_parcels: Scrape limit (default: ``pipeline.scrape.max_parcels``)
+
+    Returns:
+        Pipeline ready to run
+    """
+    # Heavy modules are imported inside stage functions so listing the
+    # pipeline stays cheap
+    config = config or Settings()
+    pipeline = Pipeline(config.get_path('pipeline.state_file'))
+
+    pdf_dir = config.dedication_history_dir
+    output_dir = config.get_path('paths.output')
+    processed_dir = config.get_path('paths.data.processed')
+    recursive = config.get('pdf_extraction.recursive', False)
+
+    pdfs = sorted(pdf_dir.rglob('*.pdf') if recursive else pdf_dir.glob('*.pdf'))
+    csvs = [output_dir / f"{pdf.stem}.csv" for pdf in pdfs]
+    merged_path = output_dir / 'merged_output.csv'
+    cleaned_path = output_dir / 'cleaned_output.csv'
+    duplicates_path = output_dir / 'duplicates_report.csv'
+    parquet_dir = output_dir / 'parquet'
+    write_parquet = config.get('output.write_parquet', True)
+    map_path = config.get_path('paths.parcel_map')
+    map_js_path = map_path.with_suffix('.js')
+    map_packed_path = config.get_path('paths.parcel_map_packed')
+    warehouse_path = config.get_path('paths.warehouse')
+    report_dir = config.get_path('paths.policy_report')
+
+    if scrape is None:
+        scrape = config.get('pipeline.scrape.enabled', False)
+    county = config.get('pipeline.scrape.county', 'honolulu')
+    if max_parcels is None:
+        max_parcels = config.get('pipeline.scrape.max_parcels')
+    scrape_path = processed_dir / f"{county}_enriched.csv"
+
+    def extractor():
+        from ag_dedicated.extractors.pdf_extractor import PDFExtractor
+        return PDFExtractor(config)
+
+    def extract() -> None:
+        extractor().extract_directory(pdf_dir, output_dir, recursive=recursive)
+
+    def merge() -> None:
+        extractor().merge_csv_files(
+            output_dir,
+            merged_path,
+            csv_files=[p for p in csvs if p.exists()],
+        )
+
+    def clean() -> None:
+        import pandas as pd
+        ext = extractor()
+        df = pd.read_csv(merged_path)
+        if config.get('data_processing.remove_duplicates', False):
+            df = ext.deduplicate(df, report_path=duplicates_path)
+        cleaned = ext.clean_petition_numbers(
+            df,
+            numeric_only=config.get('data_processing.petition_number_validation') == 'numeric_only',
+        )
+        cleaned = ext.decode_petition_numbers(cleaned)
+        cleaned.to_csv(cleaned_path, index=False)
+        if write_parquet:
+            from ag_dedicated.extractors.parquet import write_dedications_parquet
+            write_dedications_parquet(cleaned, parquet_dir)
+
+    def scrape_parcels() -> None:
+        import pandas as pd
+
+        from ag_dedicated.scrapers import SCRAPERS
+        dedications = pd.read_csv(cleaned_path)
+        with SCRAPERS[county](config) as scraper:
+            result = scraper.scrape_from_dedication_list(
+                dedications,
+                tmk_column='Parcel ID (TMK)',
+                max_parcels=max_parcels,
+            )
+        scrape_path.parent.mkdir(parents=True, exist_ok=True)
+        result.to_csv(scrape_path, index=False)
+
+    def build_map() -> None:
+        import pandas as pd
+
+        from ag_dedicated.geo.parcels import build_parcel_map
+        dedications = pd.read_csv(cleaned_path)
+        # The map shows current dedications: the latest snapshot's rows only
+        years = pd.to_numeric(dedications['Year'], errors='coerce')
+        build_parcel_map(
+            map_path, dedications[years == years.max()], map_path,
+            js_path=map_js_path, packed_path=map_packed_path,
+        )
+
+    def enrich() -> None:
+        from ag_dedicated.analysis.warehouse import Warehouse
+        with Warehouse(config, db_path=warehouse_path) as wh:
+            wh.build(
+                dedications_path=parquet_dir if write_parquet else cleaned_path,
+                scrape_paths=[scrape_path] if scrape else [],
+                parcels_path=map_path,
+            )
+
+    def reports() -> None:
+        from ag_dedicated.analysis.policy_report import PolicyReport
+        PolicyReport(config, output_dir=report_dir).build()
+
+    clean_outputs = [cleaned_path] + ([parquet_dir] if write_parquet else [])
+    if config.get('data_processing.remove_duplicates', False):
+        clean_outputs.append(duplicates_path)
+
+    pipeline.add(Stage(
+        'extract', extract,
+        inputs=pdfs,
+        outputs=csvs,
+        params={'recursive': recursive, 'pdf_extraction': config.get('pdf_extraction')},
+        description='Extract PDF tables (OCR for scanned reports) to CSV',
+    ))
+    pipeline.add(Stage(
+        'merge', merge,
+        inputs=csvs,
+        outputs=[merged_path],
+        description='Merge yearly CSVs with Year and tmk_key columns',
+    ))
+    pipeline.add(Stage(
+        'clean', clean,
+        inputs=[merged_path],
+        outputs=clean_outputs,
+        params={'data_processing': config.get('data_processing')},
+        description='Dedupe, clean petition numbers, write CSV and Parquet',
+    ))
+    if scrape:
+        pipeline.add(Stage(
+            'scrape', scrape_parcels,
+            inputs=[cleaned_path],
+            outputs=[scrape_path],
+            params={'county': county, 'max_parcels': max_parcels},
+            description=f'Scrape {county.title()} parcel records',
+        ))
+    pipeline.add(Stage(
+        'map', build_map,
+        inputs=[cleaned_path, map_path],
+        outputs=[map_path, map_js_path, map_packed_path],
+        description='Attach dedications to the parcel map data',
+    ))
+    pipeline.add(Stage(
+        'enrich', enrich,
+        inputs=(
+            [parquet_dir if write_parquet else cleaned_path, map_path]
+            + ([scrape_path] if scrape else [])
+        ),
+        outputs=[warehouse_path],
+        description='Load dedications, scrapes, and land use into the warehouse',
+    ))
+    pipeline.add(Stage(
+        'reports', reports,
+        inputs=[config.project_root / 'config' / 'config.yaml'],
+        outputs=[report_dir],
+        params={'policy_report': config.get('policy_report')},
+        description='County policy comparison report (CSVs, figures, text)',
+    ))
+
+    return pipeline
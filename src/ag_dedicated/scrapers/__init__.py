@@ -1,5 +1,24 @@
 """Web scrapers for county parcel and tax data."""
 
 from ag_dedicated.scrapers.base import BaseScraper
+from ag_dedicated.scrapers.hawaii import HawaiiScraper
+from ag_dedicated.scrapers.honolulu import HonoluluScraper
+from ag_dedicated.scrapers.kauai import KauaiScraper
+from ag_dedicated.scrapers.maui import MauiScraper
 
-__all__ = ["BaseScraper"]
+# County name -> scraper class
+SCRAPERS = {
+    'honolulu': HonoluluScraper,
+    'hawaii': HawaiiScraper,
+    'maui': MauiScraper,
+    'kauai': KauaiScraper,
+}
+
+__all__ = [
+    "BaseScraper",
+    "HawaiiScraper",
+    "HonoluluScraper",
+    "KauaiScraper",
+    "MauiScraper",
+    "SCRAPERS",
+]
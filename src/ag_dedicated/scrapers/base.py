@@ -2,6 +2,7 @@
 
 import time
 from abc import ABC, abstractmethod
+from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -11,6 +12,9 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ag_dedicated.utils.logging import LogSampler
+from ag_dedicated.utils.profiling import stage
+
 
 class BaseScraper(ABC):
     """
@@ -47,6 +51,11 @@ class BaseScraper(ABC):
         self._request_count = 0
         self._last_request_time = 0
 
+        # Per-parcel debug events are sampled to keep large runs cheap; they
+        # carry the parcel as a structured field rather than via
+        # logger.contextualize, which costs more than the event itself
+        self.sample = LogSampler(config.get('logging.sample_every', 100))
+
     def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
         current_time = time.time()
@@ -54,7 +63,7 @@ class BaseScraper(ABC):
 
         if time_since_last < self.delay:
             sleep_time = self.delay - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+            self.logger.debug("Rate limiting: sleeping {sleep:.2f}s", sleep=sleep_time)
             time.sleep(sleep_time)
 
         self._last_request_time = time.time()
@@ -80,7 +89,7 @@ class BaseScraper(ABC):
         """
         self._rate_limit()
 
-        self.logger.debug(f"Fetching: {url}")
+        self.logger.debug("Fetching: {url}", url=url)
         response = self.session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
 
@@ -127,7 +136,7 @@ class BaseScraper(ABC):
             return pd.DataFrame()
 
         # Convert HTML table to DataFrame
-        df = pd.read_html(str(tables[table_index]))[0]
+        df = pd.read_html(StringIO(str(tables[table_index])))[0]
 
         # Remove rows if requested
         if remove_first_row and len(df) > 0:
@@ -181,21 +190,29 @@ class BaseScraper(ABC):
         """
         self.logger.info(f"Scraping {len(identifiers)} parcels for {self.county_name}")
 
-        results = []
-        for i, identifier in enumerate(identifiers, 1):
-            try:
-                self.logger.debug(f"[{i}/{len(identifiers)}] Scraping {identifier}")
-                data = self.scrape_parcel(identifier)
-                if data:
-                    results.append(data)
-
-            except Exception as e:
-                self.logger.error(f"Error scraping {identifier}: {e}")
-                continue
-
-            # Progress update every 10 parcels
-            if i % 10 == 0:
-                self.logger.info(f"Progress: {i}/{len(identifiers)} parcels processed")
+        with stage('scrape'):
+            results = []
+            total = len(identifiers)
+            progress_every = max(10, total // 100)
+            for i, identifier in enumerate(identifiers, 1):
+                try:
+                    if self.sample('scrape'):
+                        self.logger.debug(
+                            "[{i}/{total}] Scraping {parcel}", i=i, total=total, parcel=identifier,
+                        )
+                    data = self.scrape_parcel(identifier)
+                    if data:
+                        results.append(data)
+
+                except Exception as e:
+                    self.logger.error(
+                        "Error scraping {parcel}: {error}", parcel=identifier, error=e,
+                    )
+                    continue
+
+                # Progress update every 10 parcels (at most ~100 updates per run)
+                if i % progress_every == 0:
+                    self.logger.info("Progress: {i}/{total} parcels processed", i=i, total=total)
 
         df = pd.DataFrame(results)
 
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 import pandas as pd
 
 from ag_dedicated.scrapers.base import BaseScraper
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks, format_tmks
 
 
 class HonoluluScraper(BaseScraper):
@@ -104,10 +105,11 @@ class HonoluluScraper(BaseScraper):
             tax_info = self._extract_tax_info(history_soup)
             data.update(tax_info)
 
-            self.logger.debug(f"Successfully scraped {tmk}")
+            if self.sample('scraped'):
+                self.logger.debug("Successfully scraped {parcel}", parcel=tmk)
 
         except Exception as e:
-            self.logger.error(f"Error scraping {tmk}: {e}")
+            self.logger.error("Error scraping {parcel}: {error}", parcel=tmk, error=e)
             data['scrape_error'] = str(e)
 
         return data
@@ -142,7 +144,7 @@ class HonoluluScraper(BaseScraper):
                             result['Zone'] = value
 
         except Exception as e:
-            self.logger.debug(f"Error extracting ownership: {e}")
+            self.logger.debug("Error extracting ownership: {error}", error=e)
 
         return result
 
@@ -173,7 +175,7 @@ class HonoluluScraper(BaseScraper):
                     result['Total_Value'] = recent.iloc[3] if len(recent) > 3 else None
 
         except Exception as e:
-            self.logger.debug(f"Error extracting assessment: {e}")
+            self.logger.debug("Error extracting assessment: {error}", error=e)
 
         return result
 
@@ -192,7 +194,7 @@ class HonoluluScraper(BaseScraper):
                 result['Land_Info_Table'] = df.to_dict('records')
 
         except Exception as e:
-            self.logger.debug(f"Error extracting land info: {e}")
+            self.logger.debug("Error extracting land info: {error}", error=e)
 
         return result
 
@@ -223,7 +225,7 @@ class HonoluluScraper(BaseScraper):
                                 result['Dedication_End_Year'] = value
 
         except Exception as e:
-            self.logger.debug(f"Error extracting ag assessment: {e}")
+            self.logger.debug("Error extracting ag assessment: {error}", error=e)
 
         return result
 
@@ -247,7 +249,7 @@ class HonoluluScraper(BaseScraper):
                     result['Tax_Status'] = recent.iloc[2] if len(recent) > 2 else None
 
         except Exception as e:
-            self.logger.debug(f"Error extracting tax info: {e}")
+            self.logger.debug("Error extracting tax info: {error}", error=e)
 
         return result
 
@@ -271,24 +273,34 @@ class HonoluluScraper(BaseScraper):
         if tmk_column not in dedications_df.columns:
             raise ValueError(f"Column '{tmk_column}' not found in DataFrame")
 
-        tmks = dedications_df[tmk_column].dropna().unique()
+        # Deduplicate on the canonical key so differently formatted TMKs
+        # for the same parcel are scraped once
+        keys = encode_tmks(dedications_df[tmk_column])
+        unique_keys = pd.unique(keys[keys != TMK_NULL])
+
+        invalid = int((keys == TMK_NULL).sum())
+        if invalid:
+            self.logger.warning(f"Skipping {invalid} rows with unparseable TMKs")
 
         if max_parcels:
-            tmks = tmks[:max_parcels]
+            unique_keys = unique_keys[:max_parcels]
 
         self.logger.info(
-            f"Scraping {len(tmks)} unique parcels from dedication list"
+            f"Scraping {len(unique_keys)} unique parcels from dedication list"
         )
 
-        # Scrape all parcels
+        # QPublic expects the 12-digit key
+        tmks = format_tmks(unique_keys, style='qpublic')
         scraped_df = self.scrape_parcels(tmks.tolist())
 
-        # Merge with original dedication data
+        # Merge with original dedication data on the integer TMK key
         if not scraped_df.empty:
-            result = dedications_df.merge(
+            scraped_df['tmk_key'] = encode_tmks(scraped_df['TMK'])
+            if tmk_column == 'TMK':
+                scraped_df = scraped_df.drop(columns='TMK')
+            result = dedications_df.assign(tmk_key=keys).merge(
                 scraped_df,
-                left_on=tmk_column,
-                right_on='TMK',
+                on='tmk_key',
                 how='left',
             )
             return result
@@ -1,6 +1,18 @@
 """Utility functions and helpers."""
 
-from ag_dedicated.utils.logging import setup_logging, get_logger
-from ag_dedicated.utils.validation import validate_petition_number, validate_tmk
+from ag_dedicated.utils.lazy import lazy_exports
 
-__all__ = ["setup_logging", "get_logger", "validate_petition_number", "validate_tmk"]
+# Public name -> defining module, imported on first access (tmk and
+# validation pull in numpy and pandas)
+__all__, __getattr__ = lazy_exports(__name__, {
+    "setup_logging": "ag_dedicated.utils.logging",
+    "get_logger": "ag_dedicated.utils.logging",
+    "LogSampler": "ag_dedicated.utils.logging",
+    "validate_petition_number": "ag_dedicated.utils.validation",
+    "validate_tmk": "ag_dedicated.utils.validation",
+    "decode_petitions": "ag_dedicated.utils.validation",
+    "encode_tmk": "ag_dedicated.utils.tmk",
+    "encode_tmks": "ag_dedicated.utils.tmk",
+    "decode_tmks": "ag_dedicated.utils.tmk",
+    "format_tmks": "ag_dedicated.utils.tmk",
+})
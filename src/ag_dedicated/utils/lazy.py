@@ -0,0 +1,30 @@
+"""Lazy package exports, so importing a package doesn't import its modules."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[List[str], Callable[[str], Any]]:
+    """
+    Build a package's ``__all__`` and a module ``__getattr__`` that imports
+    each export's defining module on first access.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> defining module
+
+    Returns:
+        Tuple of (``__all__``, ``__getattr__``)
+
+    Examples:
+        >>> __all__, __getattr__ = lazy_exports(__name__, {
+        ...     "encode_tmks": "ag_dedicated.utils.tmk",
+        ... })
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(module), name)
+
+    return list(exports), __getattr__
@@ -1,6 +1,7 @@
 """Logging configuration and utilities."""
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
@@ -16,16 +17,25 @@ def setup_logging(
     rotation: str = "10 MB",
     retention: str = "1 month",
     format_string: Optional[str] = None,
+    enqueue: bool = True,
+    serialize: bool = False,
 ) -> None:
     """
     Configure application-wide logging.
 
+    The file sink is written from a background thread when ``enqueue`` is
+    set, so formatting, file I/O and rotation stay off the calling thread.
+    With ``serialize`` it writes one JSON record per line, including bound
+    context such as ``parcel`` and ``stage``.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
         rotation: When to rotate log files
         retention: How long to keep old log files
         format_string: Custom format string for logs
+        enqueue: Write the file sink from a background queue
+        serialize: Write JSON records to the file sink
     """
     global _logger_configured
 
@@ -62,6 +72,10 @@ def setup_logging(
             rotation=rotation,
             retention=retention,
             compression="zip",
+            enqueue=enqueue,
+            serialize=serialize,
+            backtrace=False,
+            diagnose=False,
         )
 
     _logger_configured = True
@@ -81,6 +95,35 @@ def get_logger(name: str):
     return logger.bind(name=name)
 
 
+class LogSampler:
+    """
+    Thin out high-volume events: the first and then every ``every``-th
+    occurrence of each key is let through.
+
+    Examples:
+        >>> sample = LogSampler(every=100)
+        >>> for tmk in tmks:
+        ...     if sample('scrape'):
+        ...         logger.debug("Scraping {tmk}", tmk=tmk)
+    """
+
+    def __init__(self, every: int = 100):
+        """
+        Initialize sampler.
+
+        Args:
+            every: Keep one event in this many per key (1 keeps all)
+        """
+        self.every = max(1, int(every))
+        self._counts: dict[str, int] = defaultdict(int)
+
+    def __call__(self, key: str) -> bool:
+        """Count an event under ``key`` and return whether to log it."""
+        count = self._counts[key]
+        self._counts[key] = count + 1
+        return count % self.every == 0
+
+
 # Convenience function for quick logging setup from config
 def setup_logging_from_config(config) -> None:
     """
@@ -94,6 +137,8 @@ def setup_logging_from_config(config) -> None:
     format_string = config.get('logging.format')
     rotation = config.get('logging.rotation', '10 MB')
     retention = config.get('logging.retention', '1 month')
+    enqueue = config.get('logging.enqueue', True)
+    serialize = config.get('logging.json', False)
 
     log_file = None
     if log_to_file:
@@ -106,4 +151,6 @@ def setup_logging_from_config(config) -> None:
         rotation=rotation,
         retention=retention,
         format_string=format_string,
+        enqueue=enqueue,
+        serialize=serialize,
     )
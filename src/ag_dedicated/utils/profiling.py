@@ -0,0 +1,200 @@
+"""
+Opt-in profiling for CLI commands (``ag-dedicated --profile ...``).
+
+Code marks its phases with ``stage(name)``. The stage name is also bound to
+log records, so profile rows and log lines use the same names. When no
+profiler is active a stage only binds the log context.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+
+_active: Optional['Profiler'] = None
+_local = threading.local()
+
+
+def _short_path(filename: str) -> str:
+    """File name relative to the longest matching sys.path entry."""
+    for root in sorted((p for p in sys.path if p), key=len, reverse=True):
+        if filename.startswith(root.rstrip('/\\') + ('/' if '/' in filename else '\\')):
+            return filename[len(root.rstrip('/\\')) + 1:]
+    return filename
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Profiler:
+    """
+    Record wall and CPU time per stage, peak RSS, and the top tracemalloc
+    allocators for one command, optionally with a cProfile dump.
+
+    Stage CPU time is thread CPU time, so stages running in parallel worker
+    threads are measured separately. Work done in child processes (OCR)
+    shows up in wall time only.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        cprofile_dir: Optional[Path] = None,
+        top_allocations: int = 10,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            command: Command name (used for the cProfile file name)
+            cprofile_dir: Directory for ``<command>.prof`` (no dump if None)
+            top_allocations: Number of allocation sites to report
+        """
+        self.command = command
+        self.cprofile_dir = cprofile_dir
+        self.top_allocations = top_allocations
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._profile: Optional[cProfile.Profile] = None
+
+    def start(self) -> 'Profiler':
+        """Start measuring and make this the active profiler."""
+        global _active
+        tracemalloc.start()
+        if self.cprofile_dir is not None:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        _active = self
+        return self
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        """Add one run of a stage."""
+        with self._lock:
+            entry = self.stages.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0})
+            entry['calls'] += 1
+            entry['wall'] += wall
+            entry['cpu'] += cpu
+
+    def thread_profile(self) -> Optional[cProfile.Profile]:
+        """
+        A cProfile profiler for a stage running outside the main thread
+        (cProfile only sees the thread that enabled it), or None.
+        """
+        if self._profile is None or threading.current_thread() is threading.main_thread():
+            return None
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        return profile
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop measuring.
+
+        Returns:
+            Report with ``command``, ``wall``, ``cpu``, ``peak_rss``,
+            ``peak_traced``, ``stages``, ``allocations`` (location, bytes,
+            count) and ``cprofile_path``
+        """
+        global _active
+        _active = None
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+
+        if self._profile is not None:
+            self._profile.disable()
+
+        # Snapshot before building the cProfile stats so they don't show up
+        _, peak_traced = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        tracemalloc.stop()
+        allocations = []
+        for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+            frame = stat.traceback[0]
+            location = f"{_short_path(frame.filename)}:{frame.lineno}"
+            allocations.append((location, stat.size, stat.count))
+
+        cprofile_path = None
+        if self._profile is not None:
+            stats = pstats.Stats(self._profile)
+            for profile in self._thread_profiles:
+                stats.add(profile)
+            self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+            cprofile_path = self.cprofile_dir / f"{self.command}.prof"
+            stats.dump_stats(str(cprofile_path))
+
+        return {
+            'command': self.command,
+            'wall': wall,
+            'cpu': cpu,
+            'peak_rss': peak_rss_bytes(),
+            'peak_traced': peak_traced,
+            'stages': dict(self.stages),
+            'allocations': allocations,
+            'cprofile_path': cprofile_path,
+        }
+
+
+def get_profiler() -> Optional[Profiler]:
+    """The active profiler, if ``--profile`` is on."""
+    return _active
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Mark a named phase of work for logs and the profiler.
+
+    A stage nested inside another of the same name (e.g. the scraper's own
+    ``scrape`` stage within the pipeline's) is not counted twice.
+
+    Examples:
+        >>> with stage('merge'):
+        ...     merged = extractor.merge_csv_files(output_dir, merged_path)
+    """
+    active = getattr(_local, 'stages', None)
+    if active is None:
+        active = _local.stages = set()
+    if name in active:
+        yield
+        return
+
+    active.add(name)
+    profiler = _active
+    profile = profiler.thread_profile() if profiler else None
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    if profile:
+        profile.enable()
+    try:
+        with logger.contextualize(stage=name):
+            yield
+    finally:
+        if profile:
+            profile.disable()
+        if profiler:
+            profiler.record(name, time.perf_counter() - wall, time.thread_time() - cpu)
+        active.discard(name)
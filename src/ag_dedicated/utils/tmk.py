@@ -0,0 +1,315 @@
+"""Canonical integer encoding for Hawaii Tax Map Keys (TMKs).
+
+Every TMK shape found in the project data is parsed into a single packed
+int64 key laid out as decimal digit fields::
+
+    I Z S PPP PPP CCCC
+    | | |  |   |   +-- CPR unit (4 digits, 0000 for the base parcel)
+    | | |  |   +------ parcel (3 digits)
+    | | |  +---------- plat (3 digits)
+    | | +------------- section (1 digit)
+    | +--------------- zone (1 digit)
+    +----------------- island / county code (1 = Oahu, 2 = Maui, 3 = Hawaii, 4 = Kauai)
+
+Because the most significant digits hold the coarsest fields, every TMK
+prefix (island, zone, section, plat, parcel) maps to one contiguous key range,
+so prefix lookups become range comparisons on a sorted integer column.
+
+Supported input forms:
+
+- ``220270390000`` - 12-digit QPublic key (zone..CPR, island implied)
+- ``1220270390000`` - 13-digit key with island
+- ``134021001`` - 9-digit parcel key (island..parcel)
+- ``22027039`` - 8-digit parcel key (zone..parcel, island implied)
+- ``1-3-4-021-001`` - dashed, optionally with a 6th CPR component
+- ``3-4-021-001`` - dashed without island
+"""
+
+from typing import Any, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+TMK_NULL = -1
+"""Key assigned to values that cannot be parsed as a TMK."""
+
+DEFAULT_ISLAND = 1
+"""Island code assumed when a TMK form does not carry one (Oahu)."""
+
+ISLAND_MULT = 10**12
+ZONE_MULT = 10**11
+SECTION_MULT = 10**10
+PLAT_MULT = 10**7
+PARCEL_MULT = 10**4
+CPR_MULT = 1
+
+_FIELDS = (
+    ('island', ISLAND_MULT, 10),
+    ('zone', ZONE_MULT, 10),
+    ('section', SECTION_MULT, 10),
+    ('plat', PLAT_MULT, 1000),
+    ('parcel', PARCEL_MULT, 1000),
+    ('cpr', CPR_MULT, 10000),
+)
+
+TMK_FIELDS = {name: (mult, limit) for name, mult, limit in _FIELDS}
+"""TMK field name -> (multiplier, radix) in the packed key, island first."""
+
+# Unicode hyphens and dashes that show up in PDF extractions
+_DASHES = '[‐‑‒–—―−]'
+
+
+def encode_tmks(values: Iterable[Any], default_island: int = DEFAULT_ISLAND) -> np.ndarray:
+    """
+    Parse a column of TMKs in any supported form into packed int64 keys.
+
+    Args:
+        values: Sequence, Series, or array of TMK values (str or int)
+        default_island: Island code for forms that do not include one
+
+    Returns:
+        int64 array of keys, with ``TMK_NULL`` where a value could not be parsed
+
+    Examples:
+        >>> encode_tmks(["220270390000", "134021001", "1-3-4-021-001"]).tolist()
+        [1220270390000, 1340210010000, 1340210010000]
+    """
+    s = pd.Series(values, copy=False)
+    s = s.astype('string').str.strip().str.replace(_DASHES, '-', regex=True)
+    # Numeric columns with missing values are read as floats ("220270390000.0")
+    s = s.str.replace(r'\.0+$', '', regex=True)
+
+    keys = np.full(len(s), TMK_NULL, dtype=np.int64)
+    dashed = s.str.contains('-', regex=False).fillna(False).to_numpy(dtype=bool)
+
+    # Condensed digit forms: the length decides where the fields sit
+    digits = s.str.replace(r'\s+', '', regex=True)
+    is_digits = (~dashed) & digits.str.fullmatch(r'\d{8,13}').fillna(False).to_numpy(dtype=bool)
+    if is_digits.any():
+        d = digits[is_digits]
+        n = d.astype('int64').to_numpy()
+        length = d.str.len().to_numpy()
+        island = np.int64(default_island) * ISLAND_MULT
+        parsed = np.select(
+            [length == 13, length == 12, length == 9, length == 8],
+            [n, island + n, n * PARCEL_MULT, island + n * PARCEL_MULT],
+            default=TMK_NULL,
+        )
+        keys[is_digits] = parsed
+
+    # Dashed forms: 4 (no island), 5 (island..parcel) or 6 (with CPR) parts
+    if dashed.any():
+        parts = s[dashed].str.replace(r'\s+', '', regex=True).str.split('-', expand=True)
+        parts = parts.apply(pd.to_numeric, errors='coerce')
+        nparts = parts.notna().sum(axis=1).to_numpy()
+        if nparts.max() == 0:
+            # No digits between the dashes anywhere ('-', 'N/A-N/A'): nothing to parse
+            return keys
+        complete = ~parts.iloc[:, :nparts.max()].isna().to_numpy()
+
+        fields = np.zeros((len(parts), 6), dtype=np.int64)
+        valid = np.zeros(len(parts), dtype=bool)
+        for count, offset in ((4, 1), (5, 0), (6, 0)):
+            rows = (nparts == count) & complete[:, :count].all(axis=1)
+            if parts.shape[1] > count:
+                rows &= parts.iloc[:, count:].isna().all(axis=1).to_numpy()
+            if not rows.any():
+                continue
+            block = parts.to_numpy()[rows, :count].astype(np.int64)
+            fields[rows, offset:offset + count] = block
+            if offset:
+                fields[rows, 0] = default_island
+            valid |= rows
+
+        limits = np.array([limit for _, _, limit in _FIELDS])
+        valid &= ((fields >= 0) & (fields < limits)).all(axis=1)
+        mults = np.array([mult for _, mult, _ in _FIELDS], dtype=np.int64)
+        packed = np.where(valid, fields @ mults, TMK_NULL)
+        keys[dashed] = packed
+
+    return keys
+
+
+def encode_tmk(value: Any, default_island: int = DEFAULT_ISLAND) -> int:
+    """
+    Parse a single TMK into its packed integer key.
+
+    Args:
+        value: TMK in any supported form
+        default_island: Island code for forms that do not include one
+
+    Returns:
+        Packed key, or ``TMK_NULL`` if the value is not a TMK
+
+    Examples:
+        >>> encode_tmk("1-3-4-021-001")
+        1340210010000
+        >>> encode_tmk("invalid")
+        -1
+    """
+    return int(encode_tmks([value], default_island=default_island)[0])
+
+
+def decode_tmks(keys: Iterable[int]) -> pd.DataFrame:
+    """
+    Split packed keys back into their TMK fields.
+
+    Args:
+        keys: Packed TMK keys
+
+    Returns:
+        DataFrame with island, zone, section, plat, parcel, and cpr columns.
+        Rows for ``TMK_NULL`` keys are all -1.
+    """
+    k = np.asarray(keys, dtype=np.int64)
+    null = k < 0
+    columns = {}
+    for name, mult, limit in _FIELDS:
+        values = (k // mult) % limit
+        dtype = np.int16 if limit > 10 else np.int8
+        columns[name] = np.where(null, -1, values).astype(dtype)
+    return pd.DataFrame(columns)
+
+
+def format_tmks(keys: Iterable[int], style: str = 'dashed') -> pd.Series:
+    """
+    Render packed keys in one of the textual TMK forms.
+
+    Args:
+        keys: Packed TMK keys
+        style: ``'dashed'`` (1-3-4-021-001, CPR appended when non-zero),
+            ``'qpublic'`` (12-digit 340210010000), ``'parcel'`` (9-digit
+            134021001), or ``'full'`` (13-digit)
+
+    Returns:
+        Series of strings, with <NA> for ``TMK_NULL`` keys
+    """
+    k = np.asarray(keys, dtype=np.int64)
+    null = k < 0
+
+    if style == 'full':
+        text = pd.Series(k).astype(str).str.zfill(13)
+    elif style == 'qpublic':
+        text = pd.Series(k % ISLAND_MULT).astype(str).str.zfill(12)
+    elif style == 'parcel':
+        text = pd.Series(k // PARCEL_MULT).astype(str).str.zfill(9)
+    elif style == 'dashed':
+        f = decode_tmks(k)
+        text = (
+            f['island'].astype(str) + '-' + f['zone'].astype(str) + '-'
+            + f['section'].astype(str) + '-' + f['plat'].astype(str).str.zfill(3) + '-'
+            + f['parcel'].astype(str).str.zfill(3)
+        )
+        cpr = f['cpr'] > 0
+        text = text.where(~cpr, text + '-' + f['cpr'].astype(str).str.zfill(4))
+    else:
+        raise ValueError(f"Unknown TMK format style: {style}")
+
+    return text.astype('string').mask(null)
+
+
+def base_parcel_keys(keys: Iterable[int]) -> np.ndarray:
+    """
+    Drop the CPR unit from packed keys, mapping units to their base parcel.
+
+    Args:
+        keys: Packed TMK keys
+
+    Returns:
+        int64 array of base parcel keys (``TMK_NULL`` is preserved)
+    """
+    k = np.asarray(keys, dtype=np.int64)
+    return np.where(k < 0, TMK_NULL, k - k % PARCEL_MULT)
+
+
+def tmk_prefix_range(
+    island: int,
+    zone: Optional[int] = None,
+    section: Optional[int] = None,
+    plat: Optional[int] = None,
+    parcel: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Get the half-open key range covering every TMK under a prefix.
+
+    Fields must be given from the most significant down; a field may only
+    be set if all fields above it are set.
+
+    Args:
+        island: Island code
+        zone: Optional zone
+        section: Optional section (requires zone)
+        plat: Optional plat (requires section)
+        parcel: Optional parcel (requires plat)
+
+    Returns:
+        Tuple ``(low, high)`` such that matching keys satisfy ``low <= key < high``
+
+    Examples:
+        >>> tmk_prefix_range(1, 4)
+        (1400000000000, 1500000000000)
+    """
+    low = 0
+    width = ISLAND_MULT * 10
+    gap = False
+    for (name, mult, limit), value in zip(_FIELDS, [island, zone, section, plat, parcel]):
+        if value is None:
+            gap = True
+            continue
+        if gap:
+            raise ValueError("TMK prefix fields must be given from island downward")
+        if not 0 <= value < limit:
+            raise ValueError(f"TMK {name} out of range: {value}")
+        low += value * mult
+        width = mult
+    return low, low + width
+
+
+def tmk_prefix_mask(
+    keys: Union[np.ndarray, pd.Series],
+    island: int,
+    zone: Optional[int] = None,
+    section: Optional[int] = None,
+    plat: Optional[int] = None,
+    parcel: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Boolean mask of keys falling under a TMK prefix.
+
+    Args:
+        keys: Packed TMK keys
+        island, zone, section, plat, parcel: Prefix fields (see ``tmk_prefix_range``)
+
+    Returns:
+        Boolean array aligned with ``keys``
+    """
+    low, high = tmk_prefix_range(island, zone, section, plat, parcel)
+    k = np.asarray(keys, dtype=np.int64)
+    return (k >= low) & (k < high)
+
+
+def add_tmk_key(
+    df: pd.DataFrame,
+    column: str,
+    key_column: str = 'tmk_key',
+    default_island: int = DEFAULT_ISLAND,
+) -> pd.DataFrame:
+    """
+    Return a copy of a DataFrame with a packed TMK key column added.
+
+    Args:
+        df: DataFrame with a TMK column
+        column: Name of the TMK column to parse
+        key_column: Name of the key column to add
+        default_island: Island code for forms that do not include one
+
+    Returns:
+        DataFrame with ``key_column`` as int64
+    """
+    if column not in df.columns:
+        raise ValueError(f"Column '{column}' not found in DataFrame")
+
+    result = df.copy()
+    result[key_column] = encode_tmks(df[column], default_island=default_island)
+    return result
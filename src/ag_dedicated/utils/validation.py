@@ -170,8 +170,85 @@ def clean_tmk(tmk: Any) -> Optional[str]:
     return None
 
 
+PETITION_PREFIXES = {'A': 1, 'AV': 2, 'AD': 3}
+"""Petition prefixes and their codes in the packed petition key."""
+
+PETITION_PATTERN = r'^(A|AV|AD)(\d{2})(\d{2})(\d{4})([A-Z]?)$'
+"""Prefix, term, two-digit start year, sequence, optional split-parcel suffix."""
+
+PETITION_NULL = -1
+"""Petition key assigned to values that don't match ``PETITION_PATTERN``."""
+
+
+def decode_petitions(values, century_pivot: int = 70) -> "pd.DataFrame":
+    """
+    Decode petition numbers into typed term, start year, and sequence columns.
+
+    Petition numbers such as ``A10140066`` encode the prefix (``A``, ``AV``,
+    ``AD``), dedication term in years (``10``), two-digit start year
+    (``14``), a sequence number (``0066``), and an optional letter suffix
+    for split parcels (``A10070316B``).
+
+    The packed ``petition_key`` lays these out as decimal digit fields
+    (prefix code, term, four-digit start year, sequence, suffix), so within
+    a prefix and term it sorts by start year (1990s before 2000s), and it
+    can be used for joins and grouping.
+
+    Args:
+        values: Sequence or Series of petition numbers
+        century_pivot: Two-digit years at or above this are 19xx, below are 20xx
+
+    Returns:
+        DataFrame aligned with ``values`` with columns petition_prefix
+        (category), term (Int8), start_year (Int16), sequence (Int16),
+        suffix (string), petition_key (int64), and valid (bool). Rows that
+        don't match are kept with nulls, ``valid=False``, and
+        ``petition_key == PETITION_NULL``.
+
+    Examples:
+        >>> decode_petitions(["A10140066", "bad"])[["term", "start_year", "valid"]]
+           term  start_year  valid
+        0    10        2014   True
+        1  <NA>        <NA>  False
+    """
+    s = pd.Series(values, copy=False).astype('string').str.strip().str.upper()
+    parts = s.str.extract(PETITION_PATTERN)
+    valid = parts[0].notna().to_numpy(dtype=bool)
+
+    prefix_code = parts[0].map(PETITION_PREFIXES).fillna(0).astype('int64').to_numpy()
+    term = pd.to_numeric(parts[1], errors='coerce')
+    yy = pd.to_numeric(parts[2], errors='coerce')
+    sequence = pd.to_numeric(parts[3], errors='coerce')
+    suffix = parts[4].fillna('')
+    # Suffix letter A-Z -> 1-26, no suffix -> 0 ('@' is the code point before 'A')
+    letters = np.array(suffix.mask(suffix == '', '@').tolist(), dtype='<U1')
+    suffix_code = letters.view(np.int32).astype('int64') - ord('@')
+
+    start_year = yy + np.where((yy >= century_pivot).fillna(False), 1900, 2000)
+
+    packed = (
+        prefix_code * 10**12
+        + term.fillna(0).astype('int64').to_numpy() * 10**10
+        + start_year.fillna(0).astype('int64').to_numpy() * 10**6
+        + sequence.fillna(0).astype('int64').to_numpy() * 10**2
+        + suffix_code
+    )
+
+    return pd.DataFrame({
+        'petition_prefix': parts[0].astype('category'),
+        'term': term.astype('Int8'),
+        'start_year': start_year.astype('Int16'),
+        'sequence': sequence.astype('Int16'),
+        'suffix': suffix.where(valid).astype('string'),
+        'petition_key': np.where(valid, packed, PETITION_NULL),
+        'valid': valid,
+    }, index=s.index)
+
+
 # Import pandas here to avoid circular imports
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
+    np = None
     pd = None
@@ -0,0 +1,167 @@
+"""
+Benchmark fixtures: synthetic data scaled up from the committed data.
+
+The yearly dedication CSVs and the parcel map are replicated 1x, 10x, 100x
+or 1000x. Each replica shifts the TMK's CPR field, so the copies are
+distinct dedicated units. Parcel features get the same shift, which keeps
+them joinable with the scaled dedications.
+
+By default (``--benchmark-disable`` in pyproject.toml) each benchmark runs
+once as a smoke test at the 1x and 10x scales. Timings only compare within
+one machine, so regressions are gated by timing two commits back to back
+(the Benchmarks workflow does this for pull requests):
+
+    git checkout main
+    pytest tests/benchmarks --no-cov --benchmark-enable --benchmark-save=base
+    git checkout my-branch
+    pytest tests/benchmarks --no-cov --benchmark-enable \\
+        --benchmark-compare=0001 --benchmark-compare-fail=min:30%
+
+Choose scales with ``--bench-scales=1,10,100,1000``. The larger scales
+write several GB of temporary data.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+from loguru import logger
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+YEARLY_CSV_DIR = PROJECT_ROOT / 'Dedication History' / 'output'
+PARCEL_MAP = PROJECT_ROOT / 'website' / 'parcels_cdl.json'
+TMK_COL = 'Parcel ID (TMK)'
+
+SCALES = (1, 10, 100, 1000)
+DEFAULT_SCALES = '1,10'
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--bench-scales',
+        default=DEFAULT_SCALES,
+        help=(
+            f"Comma-separated data scales to benchmark "
+            f"(any of {SCALES}; default {DEFAULT_SCALES})"
+        ),
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if 'scale' in metafunc.fixturenames:
+        scales = [int(s) for s in metafunc.config.getoption('bench_scales').split(',')]
+        unknown = set(scales) - set(SCALES)
+        if unknown:
+            raise pytest.UsageError(
+                f"Unsupported --bench-scales {sorted(unknown)}; choose from {SCALES}"
+            )
+        metafunc.parametrize('scale', scales, ids=[f"{s}x" for s in scales], scope='session')
+
+
+def yearly_csv_paths() -> List[Path]:
+    """The committed per-year extraction CSVs (not the merged/cleaned outputs)."""
+    return [
+        path for path in sorted(YEARLY_CSV_DIR.glob('*.csv'))
+        if path.stem not in ('merged_output', 'cleaned_output')
+    ]
+
+
+def shift_tmks(tmks: pd.Series, replica: int) -> pd.Series:
+    """Shift the 4-digit CPR field of 12- or 13-digit TMKs by ``replica``."""
+    if replica == 0:
+        return tmks
+    tmks = tmks.astype('string')
+    digits = tmks.str.fullmatch(r'\d{12,13}').fillna(False)
+    cpr = (pd.to_numeric(tmks.where(digits).str[-4:]) + replica) % 10_000
+    shifted = tmks.where(digits).str[:-4] + cpr.astype('Int64').astype('string').str.zfill(4)
+    return shifted.where(digits, tmks)
+
+
+def scale_dedications(df: pd.DataFrame, scale: int, tmk_col: str = TMK_COL) -> pd.DataFrame:
+    """Concatenate ``scale`` replicas of a dedication table with shifted TMKs."""
+    replicas = []
+    for replica in range(scale):
+        copy = df.copy()
+        copy[tmk_col] = shift_tmks(df[tmk_col], replica)
+        replicas.append(copy)
+    return pd.concat(replicas, ignore_index=True)
+
+
+def scale_parcel_features(features: List[Dict[str, Any]], scale: int) -> List[Dict[str, Any]]:
+    """Replicate parcel features, shifting ``ded_tmk`` to match ``scale_dedications``."""
+    ded_tmks = pd.Series([f['properties'].get('ded_tmk') for f in features], dtype='string')
+    scaled = []
+    for replica in range(scale):
+        shifted = shift_tmks(ded_tmks, replica)
+        for feature, ded_tmk in zip(features, shifted):
+            scaled.append({
+                **feature,
+                'properties': {
+                    **feature['properties'],
+                    'ded_tmk': None if pd.isna(ded_tmk) else ded_tmk,
+                },
+            })
+    return scaled
+
+
+@pytest.fixture(scope='session')
+def tmk_col() -> str:
+    """TMK column of the dedication CSVs."""
+    return TMK_COL
+
+
+@pytest.fixture(scope='session', autouse=True)
+def quiet_logs():
+    """Benchmark the code, not console logging."""
+    logger.remove()
+    yield
+    logger.add(sys.stderr)
+
+
+@pytest.fixture(scope='session')
+def yearly_csvs(scale, tmp_path_factory) -> List[Path]:
+    """Yearly CSVs scaled ``scale`` times, keeping the original file names."""
+    out_dir = tmp_path_factory.mktemp(f'yearly_{scale}x')
+    paths = []
+    for path in yearly_csv_paths():
+        df = pd.read_csv(path, dtype={TMK_COL: 'string'})
+        scaled_path = out_dir / path.name
+        scale_dedications(df, scale).to_csv(scaled_path, index=False)
+        paths.append(scaled_path)
+    return paths
+
+
+@pytest.fixture(scope='session')
+def merged_dedications(scale) -> pd.DataFrame:
+    """The committed merged output scaled ``scale`` times."""
+    df = pd.read_csv(YEARLY_CSV_DIR / 'merged_output.csv', dtype={TMK_COL: 'string'})
+    return scale_dedications(df, scale)
+
+
+@pytest.fixture(scope='session')
+def parcel_assessments(parcel_geojson) -> pd.DataFrame:
+    """Scraper-shaped assessments for the scaled map (synthetic values by area)."""
+    with open(parcel_geojson, 'r') as f:
+        props = [feature['properties'] for feature in json.load(f)['features']]
+    acres = pd.Series([p.get('acres') for p in props], dtype='float64')
+    return pd.DataFrame({
+        'TMK': [p.get('ded_tmk') for p in props],
+        'Land_Value': (acres * 100_000).round(),
+    })
+
+
+@pytest.fixture(scope='session')
+def parcel_geojson(scale, tmp_path_factory) -> Path:
+    """The committed parcel map scaled ``scale`` times."""
+    with open(PARCEL_MAP, 'r') as f:
+        features = json.load(f)['features']
+    path = tmp_path_factory.mktemp(f'parcels_{scale}x') / 'parcels.json'
+    path.write_text(json.dumps({
+        'type': 'FeatureCollection',
+        'features': scale_parcel_features(features, scale),
+    }))
+    return path
@@ -0,0 +1,116 @@
+"""Benchmarks for the extraction, scraping, comparison, TMK and map hot paths."""
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from ag_dedicated.analysis.scenarios import PolicySimulator, scenario_grid
+from ag_dedicated.analysis.statute_comparison import StatuteComparison
+from ag_dedicated.analysis.tax_benefit import TaxRules, estimate_tax_benefit, parcels_from_map
+from ag_dedicated.config import Settings
+from ag_dedicated.extractors.pdf_extractor import PDFExtractor
+from ag_dedicated.geo.parcels import build_parcel_map, load_parcel_features
+from ag_dedicated.scrapers.honolulu import HonoluluScraper
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+
+
+ROUNDS = 5
+
+
+@pytest.fixture(scope='module')
+def extractor() -> PDFExtractor:
+    return PDFExtractor(Settings())
+
+
+def test_extract_table(benchmark, scale, yearly_csvs):
+    """Parse an HTML table the size of one year's dedications."""
+    rows = pd.read_csv(yearly_csvs[-1], dtype=str)
+    soup = BeautifulSoup(rows.to_html(index=False), 'lxml')
+
+    with HonoluluScraper(Settings()) as scraper:
+        table = benchmark(scraper.extract_table, soup, 0)
+
+    assert len(table) == len(rows)
+
+
+def test_clean_petition_numbers(benchmark, scale, merged_dedications, extractor):
+    """Clean and validate petition numbers across all years."""
+    # clean_petition_numbers assigns into its input, so each round gets a copy
+    cleaned = benchmark.pedantic(
+        extractor.clean_petition_numbers,
+        setup=lambda: ((merged_dedications.copy(),), {'numeric_only': False}),
+        rounds=ROUNDS,
+    )
+
+    assert 0 < len(cleaned) <= len(merged_dedications)
+
+
+def test_merge_csv_files(benchmark, scale, yearly_csvs, extractor, tmp_path):
+    """Read, year-label, key and write the yearly CSVs."""
+    merged = benchmark.pedantic(
+        extractor.merge_csv_files,
+        args=(yearly_csvs[0].parent, tmp_path / 'merged_output.csv'),
+        kwargs={'csv_files': yearly_csvs},
+        rounds=ROUNDS,
+    )
+
+    assert merged['Year'].nunique() == len(yearly_csvs)
+
+
+def test_encode_tmks(benchmark, scale, merged_dedications, tmk_col):
+    """Normalize TMK strings to packed integer keys."""
+    keys = benchmark(encode_tmks, merged_dedications[tmk_col])
+
+    assert len(keys) == len(merged_dedications)
+    # The only unparseable values are header rows repeated inside the PDFs
+    assert (keys != TMK_NULL).mean() > 0.95
+
+
+def test_build_parcel_map(benchmark, scale, parcel_geojson, merged_dedications, tmp_path):
+    """Load parcel GeoJSON, attach the latest dedications, and write the map."""
+    latest = merged_dedications[merged_dedications['Year'] == merged_dedications['Year'].max()]
+    output = tmp_path / 'parcels_cdl.json'
+
+    features = benchmark.pedantic(
+        build_parcel_map,
+        args=(parcel_geojson, latest, output),
+        kwargs={'js_path': output.with_suffix('.js')},
+        rounds=ROUNDS,
+    )
+
+    assert any(f['properties']['petitions'] for f in features)
+
+
+def test_estimate_tax_benefit(benchmark, scale, parcel_geojson, parcel_assessments):
+    """Dedicated value and tax foregone for every mapped parcel."""
+    parcels = parcels_from_map(load_parcel_features(parcel_geojson), parcel_assessments)
+    rules = TaxRules.from_config(Settings())
+
+    result = benchmark(estimate_tax_benefit, parcels, rules)
+
+    assert result['eligible'].any()
+    assert (result['tax_foregone'].dropna() >= 0).all()
+
+
+def test_policy_scenarios(benchmark, scale, parcel_geojson, parcel_assessments):
+    """Monte Carlo revenue and enrollment over a small grid of rate scenarios."""
+    parcels = parcels_from_map(load_parcel_features(parcel_geojson), parcel_assessments)
+    simulator = PolicySimulator(parcels, draws=100, workers=1)
+    scenarios = scenario_grid({'honolulu.assessment_rates.10_year': [0.01, 0.02, 0.05]})
+
+    summary = benchmark.pedantic(simulator.run, args=(scenarios,), rounds=ROUNDS)
+
+    total = summary[summary['county'] == 'total'].set_index('scenario')
+    assert total['revenue_change'].is_monotonic_increasing
+    assert total['enrollment_change'].is_monotonic_decreasing
+
+
+def test_statute_comparison_exports(benchmark, tmp_path):
+    """County summary, period and requirement CSV exports (config-driven, not scaled)."""
+    comparison = StatuteComparison(Settings())
+
+    benchmark(comparison.export_to_csv, tmp_path)
+
+    assert {p.name for p in tmp_path.iterdir()} == {
+        'county_summary.csv', 'dedication_periods.csv', 'requirements.csv',
+    }
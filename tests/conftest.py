@@ -0,0 +1,112 @@
+"""Shared fixtures: synthetic Cropland Data Layer rasters with known parcels."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+
+# 10 m pixels in UTM zone 4N (Oahu), like the Hawaii CDL
+CDL_CRS = 'EPSG:32604'
+CDL_ORIGIN = (600_000.0, 2_380_000.0)
+CDL_PIXEL = 10.0
+CDL_SHAPE = (400, 600)
+
+
+def synthetic_cdl_classes(year_offset: int = 0) -> np.ndarray:
+    """
+    Class codes laid out in column bands: Other Crops (44) in columns
+    0-199, Grassland/Pasture (176) in 200-299, Fallow/Idle Cropland (61)
+    in 300-399, Forest (141) in 400-599, with background (0) in rows
+    300-399. ``year_offset`` years later the crop band has shrunk by
+    50 columns per year, turned to pasture.
+    """
+    classes = np.empty(CDL_SHAPE, dtype=np.uint8)
+    crop_stop = 200 - 50 * year_offset
+    classes[:, :crop_stop] = 44
+    classes[:, crop_stop:300] = 176
+    classes[:, 300:400] = 61
+    classes[:, 400:] = 141
+    classes[300:, :] = 0
+    return classes
+
+
+def write_cdl_raster(path: Path, classes: np.ndarray) -> Path:
+    """Write class codes as a single-band GeoTIFF on the synthetic grid."""
+    rasterio = pytest.importorskip('rasterio')
+    from rasterio.transform import from_origin
+
+    with rasterio.open(
+        path, 'w', driver='GTiff', height=classes.shape[0], width=classes.shape[1],
+        count=1, dtype=classes.dtype, crs=CDL_CRS,
+        transform=from_origin(*CDL_ORIGIN, CDL_PIXEL, CDL_PIXEL),
+        tiled=True, blockxsize=128, blockysize=128,
+    ) as dst:
+        dst.write(classes, 1)
+    return path
+
+
+def pixel_rectangle(rows: Tuple[float, float], cols: Tuple[float, float]) -> Dict[str, Any]:
+    """A lon/lat GeoJSON polygon covering raster rows and columns [start, stop)."""
+    from rasterio.warp import transform_geom
+
+    x0, y0 = CDL_ORIGIN
+    left, right = x0 + cols[0] * CDL_PIXEL, x0 + cols[1] * CDL_PIXEL
+    top, bottom = y0 - rows[0] * CDL_PIXEL, y0 - rows[1] * CDL_PIXEL
+    ring = [[left, top], [right, top], [right, bottom], [left, bottom], [left, top]]
+    return transform_geom(CDL_CRS, 'EPSG:4326', {'type': 'Polygon', 'coordinates': [ring]})
+
+
+@pytest.fixture(scope='session')
+def synthetic_cdl(tmp_path_factory) -> Tuple[Path, List[Dict[str, Any]]]:
+    """
+    A synthetic CDL raster and parcel features over it.
+
+    Parcels (by ``tmk``): ``crops`` inside the crop band, ``split`` half
+    crops half pasture, ``forest``, ``background`` half over ignored pixels,
+    ``tiny`` smaller than a pixel, ``outside`` the raster, and ``empty``
+    with no geometry.
+    """
+    pytest.importorskip('rasterio')
+    path = write_cdl_raster(tmp_path_factory.mktemp('cdl') / 'cdl.tif', synthetic_cdl_classes())
+    parcels = {
+        'crops': pixel_rectangle((10, 50), (10, 50)),
+        'split': pixel_rectangle((10, 50), (180, 220)),
+        'forest': pixel_rectangle((100, 150), (450, 500)),
+        'background': pixel_rectangle((280, 320), (10, 50)),
+        'tiny': pixel_rectangle((60.2, 60.6), (360.2, 360.6)),
+        'outside': pixel_rectangle((-100, -50), (10, 50)),
+        'empty': None,
+    }
+    features = [
+        {'type': 'Feature', 'properties': {'tmk': tmk}, 'geometry': geometry}
+        for tmk, geometry in parcels.items()
+    ]
+    return path, features
+
+
+@pytest.fixture(scope='session')
+def synthetic_cdl_years(tmp_path_factory) -> Dict[int, Path]:
+    """
+    Yearly rasters: 2022-2024 with the crop band shrinking each year, and
+    2021 with the 2022 classes on a coarser 20 m grid (so stacking it
+    needs resampling).
+    """
+    rasterio = pytest.importorskip('rasterio')
+    from rasterio.transform import from_origin
+
+    tmp = tmp_path_factory.mktemp('cdl_years')
+    rasters = {
+        2022 + offset: write_cdl_raster(tmp / f'{2022 + offset}.tif', synthetic_cdl_classes(offset))
+        for offset in range(3)
+    }
+    coarse = synthetic_cdl_classes()[::2, ::2]
+    rasters[2021] = tmp / '2021.tif'
+    with rasterio.open(
+        rasters[2021], 'w', driver='GTiff', height=coarse.shape[0], width=coarse.shape[1], count=1,
+        dtype=coarse.dtype, crs=CDL_CRS,
+        transform=from_origin(*CDL_ORIGIN, 2 * CDL_PIXEL, 2 * CDL_PIXEL),
+    ) as dst:
+        dst.write(coarse, 1)
+    return rasters
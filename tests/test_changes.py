@@ -0,0 +1,71 @@
+"""Change feed classification between dedication snapshots."""
+
+import pandas as pd
+
+from ag_dedicated.analysis.changes import diff_snapshots
+from ag_dedicated.utils.tmk import encode_tmks
+
+
+def snapshot(rows):
+    return pd.DataFrame(rows, columns=['Parcel ID (TMK)', 'Petition Number', 'End Year'])
+
+
+def changes_by_petition(changes):
+    return {
+        (row.previous_petition if pd.isna(row.petition) else row.petition): row.change
+        for row in changes.itertuples()
+    }
+
+
+def test_several_petitions_gone_from_one_tmk():
+    before = snapshot([
+        ('130010010000', 'A10140066', 2020),
+        ('130010010000', 'A05140001', 2015),
+    ])
+    after = snapshot([('130010010000', 'A10240001', 2030)])
+
+    changes = diff_snapshots(before, after, 2020, 2021)
+
+    assert len(changes) == 2
+    assert changes['tmk_key'].eq(encode_tmks(['130010010000'])[0]).all()
+    renewed = changes[changes['change'] == 'renewed'].iloc[0]
+    assert renewed['petition'] == 'A10240001'
+    assert renewed['previous_petition'] == 'A05140001'
+    removed = changes[changes['change'] == 'removed'].iloc[0]
+    assert pd.isna(removed['petition'])
+    assert removed['previous_petition'] == 'A10140066'
+    assert removed['previous_end_year'] == 2020
+
+
+def test_several_petitions_new_on_one_tmk():
+    before = snapshot([('130010010000', 'A05140001', 2015)])
+    after = snapshot([
+        ('130010010000', 'A10240001', 2030),
+        ('130010010000', 'A10240002', 2031),
+        ('130010020000', 'A10240003', 2031),
+    ])
+
+    changes = diff_snapshots(before, after)
+
+    assert changes_by_petition(changes) == {
+        'A10240001': 'renewed',
+        'A10240002': 'added',
+        'A10240003': 'added',
+    }
+
+
+def test_unchanged_and_end_year_changes():
+    before = snapshot([
+        ('130010010000', 'A05140001', 2015),
+        ('130010020000', 'A05140002', 2015),
+    ])
+    after = snapshot([
+        ('130010010000', 'A05140001', 2015),
+        ('130010020000', 'A05140002', 2020),
+    ])
+
+    changes = diff_snapshots(before, after)
+
+    assert changes_by_petition(changes) == {'A05140002': 'end_year_changed'}
+    assert changes['previous_end_year'].tolist() == [2015]
+    assert changes['end_year'].tolist() == [2020]
@@ -0,0 +1,104 @@
+"""Lazy dedication dataset: pushdown, projection, and the result cache."""
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from ag_dedicated.data import DedicationDataset, col
+from ag_dedicated.data.dataset import ResultCache
+from ag_dedicated.extractors.parquet import write_dedications_parquet
+
+
+ROWS = pd.DataFrame({
+    'Parcel ID (TMK)': ['410010010000', '410020020000', '230010010000', '410010010000'],
+    'Petition Number': ['A10140066', 'A05150001', 'AV05160002', 'A10200003'],
+    'Site Address': ['1 A ST', '2 B ST', '3 C ST', '1 A ST'],
+    'End Year': [2024, 2020, 2021, 2030],
+    'Year': [2019, 2019, 2020, 2021],
+})
+
+
+@pytest.fixture
+def dataset(tmp_path) -> DedicationDataset:
+    write_dedications_parquet(ROWS, tmp_path / 'parquet')
+    return DedicationDataset(tmp_path / 'parquet', cache=ResultCache())
+
+
+def test_year_filter_prunes_partitions(dataset):
+    # An unreadable partition outside the filter is never opened
+    for part in (dataset.source / 'year=2019').glob('*.parquet'):
+        part.write_bytes(b'not parquet')
+
+    df = dataset.filter(col('year') >= 2020).select('petition', 'year').to_pandas()
+
+    assert df.columns.tolist() == ['petition', 'year']
+    assert sorted(df['petition']) == ['A10200003', 'AV05160002']
+    with pytest.raises(pa.ArrowInvalid):
+        dataset.filter(col('year') == 2019).to_pandas()
+
+
+def test_tmk_field_filters_and_projection(dataset):
+    query = dataset.filter(island=1, zone=4, section=1, plat=1)
+
+    df = query.select('petition', 'zone', 'plat').to_pandas()
+
+    assert sorted(df['petition']) == ['A10140066', 'A10200003']
+    assert df['zone'].tolist() == [4, 4]
+    assert str(df['plat'].dtype) == 'Int16'
+    assert dataset.filter(zone=[2, 4]).count() == 4
+    assert dataset.filter(col('zone') == 2).count() == 1
+
+
+def test_unknown_column_rejected(dataset):
+    with pytest.raises(KeyError):
+        dataset.select('nope')
+
+
+def test_results_are_cached_until_the_data_changes(dataset):
+    query = dataset.filter(col('year') == 2019)
+
+    first = query.to_pandas()
+    query.to_pandas()
+    assert dataset.cache.info()['hits'] == 1
+
+    write_dedications_parquet(ROWS.assign(**{'End Year': 2040}), dataset.source)
+    assert query.to_pandas()['end_year'].tolist() == [2040, 2040]
+    assert first['end_year'].tolist() != [2040, 2040]
+
+
+def test_lru_evicts_by_entries():
+    cache = ResultCache(max_entries=2, max_bytes=100)
+    cache.put(('a',), 'A', 10)
+    cache.put(('b',), 'B', 10)
+    assert cache.get(('a',)) == 'A'  # now most recently used
+
+    cache.put(('c',), 'C', 10)
+
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) == 'A'
+    assert cache.info() == {'entries': 2, 'bytes': 20, 'hits': 2, 'misses': 1}
+
+
+def test_lru_evicts_by_bytes():
+    cache = ResultCache(max_entries=10, max_bytes=100)
+    cache.put(('a',), 'A', 60)
+    cache.put(('b',), 'B', 30)
+    cache.put(('a',), 'A2', 50)  # replacing an entry frees its old size
+    assert cache.info()['bytes'] == 80
+
+    cache.put(('c',), 'C', 40)
+
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) == 'A2'
+    assert cache.info()['bytes'] == 90
+
+
+def test_lru_skips_values_over_the_byte_bound():
+    cache = ResultCache(max_entries=10, max_bytes=100)
+    cache.put(('a',), 'A', 10)
+
+    cache.put(('big',), 'BIG', 101)
+
+    assert cache.get(('big',)) is None
+    assert cache.info()['entries'] == 1
+    assert ResultCache(max_entries=0).info()['entries'] == 0
@@ -0,0 +1,95 @@
+"""
+Import-time regression tests for the CLI.
+
+Each command runs under ``python -X importtime``. The tests check two things:
+heavy dependencies stay out of commands that don't need them, and the import
+cost the package adds on top of bare interpreter startup stays within a
+budget. Set AG_DEDICATED_IMPORT_BUDGET_SCALE to loosen the budgets on slow
+machines.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = {'pandas', 'numpy', 'pyarrow', 'tabula', 'requests', 'bs4', 'loguru'}
+
+# (command args, import budget in ms, heavy modules allowed)
+COMMANDS = [
+    (['--help'], 100, set()),
+    (['info'], 150, set()),
+    (['extract', '--help'], 100, set()),
+    (['scrape', '--help'], 100, set()),
+    (['run', '--help'], 100, set()),
+    (['compare', '--help'], 100, set()),
+    (['diff', '--help'], 100, set()),
+    (['warehouse', 'build', '--help'], 100, set()),
+    (['query', '--help'], 100, set()),
+    (['county-info', 'honolulu'], 250, {'loguru'}),
+]
+
+BUDGET_SCALE = float(os.environ.get('AG_DEDICATED_IMPORT_BUDGET_SCALE', '1'))
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def _profile(args: list[str]) -> tuple[dict[str, int], set[str]]:
+    """
+    Run a Python command under -X importtime.
+
+    Returns:
+        Tuple of (cumulative microseconds per top-level import, all imported modules)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        # Commands that set up logging would otherwise write logs/ag_dedicated.log
+        env={**os.environ, 'AG_DEDICATED__LOGGING__LOG_TO_FILE': 'false'},
+    )
+    top_level: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if not indent:
+            top_level[name] = int(cumulative)
+    return top_level, modules
+
+
+@pytest.fixture(scope='module')
+def startup_modules() -> set[str]:
+    """Modules bare interpreter startup imports (site, encodings, ...)."""
+    return _profile(['-c', 'pass'])[1]
+
+
+@pytest.mark.parametrize(
+    'args, budget_ms, allowed',
+    COMMANDS,
+    ids=[' '.join(args) for args, _, _ in COMMANDS],
+)
+def test_command_import_cost(args, budget_ms, allowed, startup_modules):
+    """Cheap commands avoid heavy dependencies and stay within their import budget."""
+    runs = [_profile(['-m', 'ag_dedicated.cli', *args]) for _ in range(3)]
+
+    roots = {name.split('.')[0] for name in runs[0][1]}
+    unexpected = (HEAVY_MODULES - allowed) & roots
+    assert not unexpected, f"{' '.join(args)} imports {sorted(unexpected)}"
+
+    # Best of three to damp scheduler noise
+    cost_ms = min(
+        sum(us for name, us in top_level.items() if name not in startup_modules)
+        for top_level, _ in runs
+    ) / 1000
+    limit_ms = budget_ms * BUDGET_SCALE
+    assert cost_ms <= limit_ms, (
+        f"{' '.join(args)} spends {cost_ms:.0f} ms importing (budget {limit_ms:.0f} ms)"
+    )
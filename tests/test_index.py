@@ -0,0 +1,95 @@
+"""Parcel spatial index against brute-force shapely queries."""
+
+import numpy as np
+import pytest
+
+shapely = pytest.importorskip('shapely')
+
+from ag_dedicated.geo.index import ParcelIndex
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmks
+
+
+def square(lon: float, lat: float, size: float = 0.001) -> dict:
+    ring = [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+@pytest.fixture(scope='module')
+def features():
+    """A 30 x 30 grid of small parcels near Honolulu, plus one without geometry."""
+    features = [
+        {
+            'type': 'Feature',
+            'properties': {'tmk': f'1300{row:02d}{col:03d}'},
+            'geometry': square(-157.9 + col * 0.002, 21.3 + row * 0.002),
+        }
+        for row in range(30) for col in range(30)
+    ]
+    features.append({'type': 'Feature', 'properties': {'tmk': '130099999'}, 'geometry': None})
+    return features
+
+
+@pytest.fixture(scope='module')
+def index(features) -> ParcelIndex:
+    return ParcelIndex.from_features(features, node_size=4)
+
+
+@pytest.fixture(scope='module')
+def points():
+    rng = np.random.default_rng(0)
+    return rng.uniform([-157.905, 21.295], [-157.835, 21.365], size=(500, 2))
+
+
+def brute_force_tree(features):
+    geometries = [shapely.geometry.shape(f['geometry']) for f in features if f['geometry']]
+    return shapely.STRtree(geometries)
+
+
+def test_contains_matches_brute_force(features, index, points):
+    result = index.contains(points[:, 0], points[:, 1])
+    query, item = brute_force_tree(features).query(shapely.points(points), predicate='intersects')
+
+    assert set(zip(result['point'], result['feature'])) == set(zip(query, item))
+    assert len(result) > 50
+
+
+def test_locate(features, index):
+    keys = index.locate([-157.8995, -157.0], [21.3005, 21.0])
+
+    assert keys[0] == encode_tmks([features[0]['properties']['tmk']])[0]
+    assert keys[1] == TMK_NULL
+
+
+def test_intersecting_matches_brute_force(features, index, points):
+    lo, hi = points[:20], points[:20] + 0.005
+    result = index.intersecting(lo[:, 0], lo[:, 1], hi[:, 0], hi[:, 1])
+    boxes = shapely.box(lo[:, 0], lo[:, 1], hi[:, 0], hi[:, 1])
+    query, item = brute_force_tree(features).query(boxes, predicate='intersects')
+
+    assert set(zip(result['box'], result['feature'])) == set(zip(query, item))
+
+
+def test_nearest_matches_brute_force(index, points):
+    result = index.nearest(points[:25, 0], points[:25, 1], k=3)
+    projected = index.geometries(np.arange(len(index)))
+
+    assert (result.groupby('point').size() == 3).all()
+    for point, group in result.groupby('point'):
+        distances = shapely.distance(projected, shapely.points(index.project(*points[point])[0]))
+        np.testing.assert_allclose(group['distance'], np.sort(distances)[:3])
+        assert group['rank'].tolist() == [1, 2, 3]
+
+    # About 33 km south of the grid
+    far = index.nearest([-157.9], [21.0], max_distance=1000)
+    assert far.empty
+
+
+def test_save_and_load(index, points, tmp_path):
+    index.save(tmp_path / 'index')
+    loaded = ParcelIndex.load(tmp_path / 'index')
+
+    assert isinstance(loaded.bounds, np.memmap)
+    assert len(loaded) == 900
+    np.testing.assert_array_equal(
+        loaded.locate(points[:, 0], points[:, 1]), index.locate(points[:, 0], points[:, 1]),
+    )
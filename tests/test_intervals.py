@@ -0,0 +1,71 @@
+"""Dedication interval index against brute force."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ag_dedicated.analysis.intervals import DedicationIntervals
+
+
+@pytest.fixture(scope='module')
+def intervals():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(1990, 2030, 500)
+    ends = starts + rng.integers(0, 20, 500)
+    return starts, ends
+
+
+def test_overlapping_matches_brute_force(intervals):
+    starts, ends = intervals
+    index = DedicationIntervals(starts, ends)
+
+    for low in range(1985, 2055, 3):
+        for high in (low, low + 1, low + 7, low + 40):
+            expected = np.flatnonzero((starts <= high) & (ends >= low))
+            np.testing.assert_array_equal(index.overlapping(low, high), expected)
+
+
+def test_active_in_and_counts_match_brute_force(intervals):
+    starts, ends = intervals
+    index = DedicationIntervals(starts, ends)
+    years = np.arange(1985, 2055)
+
+    expected = np.array([((starts <= y) & (ends >= y)).sum() for y in years])
+    np.testing.assert_array_equal(index.count_active(years), expected)
+    np.testing.assert_array_equal(index.active_counts(1985, 2054).to_numpy(), expected)
+    for year in years:
+        assert len(index.active_in(year)) == expected[year - 1985]
+
+
+def test_disjoint_intervals_leave_empty_nodes():
+    # The root's center (1.5) falls between the two intervals
+    index = DedicationIntervals([0, 2], [1, 3])
+
+    assert index.overlapping(1, 2).tolist() == [0, 1]
+    assert index.active_in(1).tolist() == [0]
+    assert len(index.overlapping(4, 5)) == 0
+
+
+def test_from_frame_labels_and_skips_incomplete_rows():
+    df = pd.DataFrame(
+        {'start_year': [2010, None, 2015, 2020], 'end_year': [2020, 2020, 2014, 2025]},
+        index=['a', 'b', 'c', 'd'],
+    )
+
+    index = DedicationIntervals.from_frame(df)
+
+    assert len(index) == 2
+    assert index.overlapping(2018, 2021).tolist() == ['a', 'd']
+
+
+def test_rejects_reversed_intervals():
+    with pytest.raises(ValueError):
+        DedicationIntervals([2020], [2019])
+    with pytest.raises(ValueError):
+        DedicationIntervals([2020], [2021]).overlapping(2022, 2021)
+    with pytest.raises(ValueError, match='Range end'):
+        DedicationIntervals([2020], [2021]).active_counts(2022, 2021)
+    # A start after every interval's end is reversed against the default end
+    with pytest.raises(ValueError, match='Range end'):
+        DedicationIntervals([2020], [2021]).active_counts(first_year=2030)
+    assert DedicationIntervals([2020], [2021]).active_counts(2021, 2021).tolist() == [1]
@@ -0,0 +1,69 @@
+"""Streaming TMK-filtered reads of statewide parcel layers."""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pyogrio')
+shapely = pytest.importorskip('shapely')
+from pyogrio.raw import write
+
+from ag_dedicated.config import Settings
+from ag_dedicated.geo.layers import dedicated_units, load_parcel_layer
+from ag_dedicated.utils.tmk import encode_tmks
+
+# 1,000 parcels on plat 1-3-4-021, TMK stored 9-digit, in UTM zone 4N
+PARCELS = np.arange(1000)
+LAYER_TMKS = np.array([f'134021{p:03d}' for p in PARCELS], dtype=object)
+
+# Two CPR units on parcel 5, a whole parcel 12, and a parcel not in the layer
+DEDICATED = ['340210050001', '1-3-4-021-005-0002', '134021012', '134099001']
+
+
+def boxes():
+    return shapely.box(600_000 + PARCELS * 100, 2_380_000, 600_050 + PARCELS * 100, 2_380_050)
+
+
+@pytest.fixture(scope='module', params=['gpkg', 'shp', 'geojsonl'])
+def layer(request, tmp_path_factory):
+    path = tmp_path_factory.mktemp('layer') / f'parcels.{request.param}'
+    if request.param == 'geojsonl':
+        lonlat = shapely.box(-157.9 + PARCELS * 0.001, 21.3, -157.8995 + PARCELS * 0.001, 21.3005)
+        with open(path, 'w') as f:
+            for tmk, geometry in zip(LAYER_TMKS, shapely.to_geojson(lonlat)):
+                feature = {
+                    'type': 'Feature', 'properties': {'TMK': tmk}, 'geometry': json.loads(geometry),
+                }
+                f.write(json.dumps(feature) + '\n')
+    else:
+        write(
+            path, shapely.to_wkb(boxes()), geometry_type='Polygon', field_data=[LAYER_TMKS],
+            fields=['TMK'], crs='EPSG:32604',
+            driver='GPKG' if request.param == 'gpkg' else 'ESRI Shapefile',
+        )
+    return path
+
+
+def test_dedicated_units():
+    units = dedicated_units(DEDICATED + [None, 'not a tmk'])
+
+    cprs = encode_tmks(['340210050001', '340210050002']).tolist()
+    assert units[encode_tmks(['134021005'])[0]] == cprs
+    assert len(units) == 3
+
+
+def test_layer_matches_dedicated_units(layer):
+    features = load_parcel_layer(DEDICATED, layer, config=Settings(), batch_size=64)
+
+    props = [f['properties'] for f in features]
+    assert [p['ded_tmk'] for p in props] == ['340210050001', '340210050002', '340210120000']
+    assert [p['tmk'] for p in props] == ['134021005', '134021005', '134021012']
+    assert props[0]['tmk_fmt'] == '1-3-4-021-005'
+
+    # Geometries come back in lon/lat, each on its own parcel
+    geometries = shapely.from_geojson([json.dumps(f['geometry']) for f in features])
+    centroids = shapely.centroid(geometries)
+    lon, lat = shapely.get_x(centroids), shapely.get_y(centroids)
+    assert np.all((lon > -158.5) & (lon < -157.5) & (lat > 21) & (lat < 22))
+    assert lon[0] == pytest.approx(lon[1]) and lon[2] > lon[0]
@@ -0,0 +1,83 @@
+"""Petition lifecycles across yearly snapshots."""
+
+import pandas as pd
+import pytest
+
+from ag_dedicated.analysis.lifecycle import build_lifecycle
+
+
+# (TMK, petition, end year, snapshot years seen)
+HISTORY = [
+    # Renewed: a new petition takes over the parcel the year after
+    ('130010010000', 'A10100001', 2020, [2016, 2017]),
+    ('130010010000', 'A10180002', 2028, [2018, 2019, 2020]),
+    # Expired in its end year; a petition two snapshots later is not a renewal
+    ('130010020000', 'A05140003', 2019, [2016, 2017, 2018]),
+    ('130010020000', 'A10200006', 2030, [2020]),
+    # Missing from 2017, then gone years before its end year
+    ('130010030000', 'A10150004', 2025, [2016, 2018]),
+]
+
+
+@pytest.fixture
+def lifecycle() -> pd.DataFrame:
+    rows = [
+        {'Parcel ID (TMK)': tmk, 'Petition Number': petition, 'End Year': end, 'Year': year}
+        for tmk, petition, end, years in HISTORY
+        for year in years
+    ]
+    # End year extended in 2019, and a row repeated on overlapping pages
+    rows += [
+        {'Parcel ID (TMK)': '1-3-001-004', 'Petition Number': 'A10170005',
+         'End Year': 2027 if year < 2019 else 2028, 'Year': year}
+        for year in [2017, 2018, 2019, 2020, 2020]
+    ]
+    return build_lifecycle(pd.DataFrame(rows)).set_index('petition')
+
+
+def test_sightings_and_gaps(lifecycle):
+    assert lifecycle.loc['A10150004', ['first_seen', 'last_seen']].tolist() == [2016, 2018]
+    assert lifecycle.loc['A10150004', 'n_snapshots'] == 2
+    assert lifecycle.loc['A10150004', 'gaps'] == 1
+    assert lifecycle.loc['A10170005', 'n_snapshots'] == 4
+    assert lifecycle['gaps'].drop('A10150004').eq(0).all()
+    assert lifecycle['left_censored'].tolist() == [True, False, True, False, True, False]
+
+
+def test_end_year_changes(lifecycle):
+    assert lifecycle.loc['A10170005', 'end_year'] == 2028
+    assert lifecycle.loc['A10170005', 'end_year_changes'] == 1
+    assert lifecycle['end_year_changes'].drop('A10170005').eq(0).all()
+
+
+def test_renewal_links(lifecycle):
+    assert lifecycle.loc['A10100001', 'renewed_by'] == 'A10180002'
+    assert lifecycle.loc['A10180002', 'renews'] == 'A10100001'
+    assert pd.isna(lifecycle.loc['A05140003', 'renewed_by'])
+    assert pd.isna(lifecycle.loc['A10200006', 'renews'])
+
+
+def test_statuses(lifecycle):
+    assert lifecycle['status'].to_dict() == {
+        'A10100001': 'renewed',
+        'A10180002': 'active',
+        'A05140003': 'expired',
+        'A10200006': 'active',
+        'A10150004': 'terminated',
+        'A10170005': 'active',
+    }
+    assert lifecycle['term'].tolist() == [10, 10, 5, 10, 10, 10]
+
+
+def test_gaps_count_snapshots_missing_from_the_data(lifecycle):
+    rows = pd.DataFrame({
+        'Parcel ID (TMK)': ['130010010000'] * 2,
+        'Petition Number': ['A10100001'] * 2,
+        'End Year': [2030] * 2,
+        'Year': [2016, 2020],
+    })
+
+    life = build_lifecycle(rows, snapshot_years=[2016, 2018, 2020])
+
+    assert life['gaps'].tolist() == [1]
+    assert life['status'].tolist() == ['active']
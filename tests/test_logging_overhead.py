@@ -0,0 +1,86 @@
+"""
+Logging overhead on the scraper's per-parcel hot path.
+
+A 100k-parcel scrape is run against a stub scraper twice: once with no log
+sinks and once with the configured INFO console and enqueued JSON file
+sinks. The difference is the cost logging adds. Set
+AG_DEDICATED_LOG_BUDGET_SCALE to loosen the budget on slow machines.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+from loguru import logger
+
+from ag_dedicated.config import Settings
+from ag_dedicated.scrapers.base import BaseScraper
+from ag_dedicated.utils import logging as log_utils
+
+
+N_PARCELS = 100_000
+
+# Added logging cost per parcel, in microseconds
+BUDGET_US = 10 * float(os.environ.get('AG_DEDICATED_LOG_BUDGET_SCALE', '1'))
+
+
+class StubScraper(BaseScraper):
+    """Scraper that never touches the network."""
+
+    def __init__(self, config):
+        super().__init__(config, 'honolulu')
+
+    def get_parcel_url(self, identifier: str) -> str:
+        return identifier
+
+    def scrape_parcel(self, identifier: str) -> dict:
+        self.logger.debug("Fetching: {url}", url=self.get_parcel_url(identifier))
+        return {'tmk': identifier}
+
+
+@pytest.fixture
+def restore_logger():
+    """Leave loguru with its default stderr sink after the test."""
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+    log_utils._logger_configured = False
+
+
+def _scrape_seconds(scraper: StubScraper, identifiers: list[str]) -> float:
+    start = time.perf_counter()
+    scraper.scrape_parcels(identifiers)
+    return time.perf_counter() - start
+
+
+def test_log_sampler_keeps_first_and_every_nth():
+    sample = log_utils.LogSampler(every=3)
+    assert [sample('a') for _ in range(7)] == [True, False, False, True, False, False, True]
+    assert sample('b')
+
+
+def test_scrape_logging_overhead(tmp_path, restore_logger, capfd):
+    """Logging adds a negligible per-parcel cost to a 100k-parcel run."""
+    scraper = StubScraper(Settings())
+    identifiers = [f"1{i:011d}" for i in range(N_PARCELS)]
+
+    logger.remove()
+    baseline = min(_scrape_seconds(scraper, identifiers) for _ in range(2))
+
+    log_utils._logger_configured = False
+    log_utils.setup_logging(level='INFO', log_file=tmp_path / 'run.log', serialize=True)
+    logged = min(_scrape_seconds(scraper, identifiers) for _ in range(2))
+    logger.complete()
+
+    overhead_us = max(0.0, logged - baseline) / N_PARCELS * 1e6
+    assert overhead_us <= BUDGET_US, (
+        f"logging adds {overhead_us:.2f} us/parcel (budget {BUDGET_US:.0f} us)"
+    )
+
+    lines = (tmp_path / 'run.log').read_text().splitlines()
+    records = [json.loads(line)['record'] for line in lines]
+    assert all(r['level']['no'] >= 20 for r in records)
+    progress = [r for r in records if r['message'].startswith('Progress')]
+    assert progress[-1]['extra']['i'] == N_PARCELS
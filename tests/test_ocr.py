@@ -0,0 +1,50 @@
+"""Parsing OCR'd dedication report text."""
+
+from loguru import logger
+
+from ag_dedicated.config import Settings
+from ag_dedicated.extractors import pdf_extractor
+from ag_dedicated.extractors.ocr import parse_ocr_text
+from ag_dedicated.extractors.pdf_extractor import PDFExtractor
+
+
+def test_parse_rows():
+    pages = [
+        "PARCEL ID  PETITION  SITE ADDRESS  END YEAR\n"
+        "220270390000 A10140066 2854 BOOTH RD 2023\n"
+        "Page 1 of 3\n",
+        "27035O75OOOO AV05l40353 2842 DATE ST\n",
+    ]
+
+    df = parse_ocr_text(pages)
+
+    assert df.values.tolist()[0] == ['220270390000', 'A10140066', '2854 BOOTH RD', 2023]
+    assert df.values.tolist()[1][:3] == ['270350750000', 'AV05140353', '2842 DATE ST']
+    assert df['End Year'].isna().tolist() == [False, True]
+
+
+def test_parse_dashed_and_spaced_tmks():
+    pages = ["2-2-027-039-0000 A10140066 2854 BOOTH RD 2023\n2 7035 075 0000 A05140001 2021\n"]
+
+    df = parse_ocr_text(pages)
+
+    assert df['Parcel ID (TMK)'].tolist() == ['220270390000', '270350750000']
+    assert df['Site Address'].iloc[0] == '2854 BOOTH RD'
+    assert df['Site Address'].isna().iloc[1]
+
+
+def test_missing_ocr_extra_warns_once(monkeypatch):
+    monkeypatch.setattr(pdf_extractor, 'OCR_AVAILABLE', False)
+    pdf_extractor._warn_ocr_unavailable.cache_clear()
+    messages = []
+    sink = logger.add(messages.append, level='WARNING')
+    try:
+        extractors = [PDFExtractor(Settings()) for _ in range(3)]
+    finally:
+        logger.remove(sink)
+        pdf_extractor._warn_ocr_unavailable.cache_clear()
+
+    assert Settings().get('pdf_extraction.ocr.enabled')
+    assert not any(e.ocr_enabled for e in extractors)
+    assert len(messages) == 1
+    assert 'ag-dedicated[ocr]' in messages[0]
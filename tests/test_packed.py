@@ -0,0 +1,101 @@
+"""Packed binary export of parcel features."""
+
+import json
+
+import numpy as np
+import pytest
+
+from ag_dedicated.geo.packed import _unvarints, _varints, read_packed_parcels, write_packed_parcels
+
+
+def square(lon: float, lat: float, size: float = 0.01) -> list:
+    return [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+
+
+@pytest.fixture
+def features():
+    return [
+        {
+            'type': 'Feature',
+            'properties': {
+                'tmk': '134021001', 'acres': 9.21, 'active_ag': 0.0, 'top_crop': 'Forest',
+                'qpub_link': 'https://example.org/parcel?KeyValue=340210010000',
+                'petitions': [{'number': 'A10150017', 'end_year': 2024, 'type': '10-year'}],
+                'flags': {'cpr': True},
+            },
+            'geometry': {'type': 'Polygon', 'coordinates': [square(-157.812345678, 21.30123456)]},
+        },
+        {
+            'type': 'Feature',
+            'properties': {
+                'tmk': '134021002', 'acres': 120.5, 'active_ag': None, 'top_crop': 'Forest',
+                'qpub_link': 'https://example.org/parcel?KeyValue=340210020000',
+                'petitions': [],
+                'owner': 'SMITH,JANE',
+            },
+            'geometry': {
+                'type': 'MultiPolygon',
+                'coordinates': [
+                    [square(-157.9, 21.4, 0.1), square(-157.88, 21.42, 0.02)],
+                    [square(-158.0, 21.5)],
+                ],
+            },
+        },
+        {
+            'type': 'Feature',
+            'properties': {'tmk': '134021003', 'acres': 1.0, 'petitions': None},
+            'geometry': None,
+        },
+    ]
+
+
+def test_varint_round_trip():
+    values = np.array([0, 1, -1, 63, -64, 64, 300, -300, 2 ** 40, -(2 ** 40), -15_800_000])
+
+    np.testing.assert_array_equal(_unvarints(_varints(values)), values)
+    assert len(_varints(np.array([63, -64]))) == 2
+
+
+def coordinates(geometry: dict) -> np.ndarray:
+    polygons = geometry['coordinates']
+    if geometry['type'] == 'Polygon':
+        polygons = [polygons]
+    return np.array([point for polygon in polygons for ring in polygon for point in ring])
+
+
+def test_round_trip(features, tmp_path):
+    path = tmp_path / 'parcels.bin'
+    write_packed_parcels(features, path)
+    decoded = read_packed_parcels(path)
+
+    assert decoded[0]['properties'] == {**features[0]['properties'], 'owner': None}
+    assert decoded[1]['properties'] == {**features[1]['properties'], 'flags': None}
+    # Missing properties come back as None, a missing record list as empty
+    assert decoded[2]['properties'] == {
+        'tmk': '134021003', 'acres': 1.0, 'active_ag': None, 'top_crop': None,
+        'qpub_link': None, 'petitions': [], 'flags': None, 'owner': None,
+    }
+
+    assert decoded[2]['geometry'] is None
+    for original, packed in zip(features[:2], decoded[:2]):
+        assert packed['geometry']['type'] == original['geometry']['type']
+        # Within half a quantization step, rings closed again
+        np.testing.assert_allclose(
+            coordinates(packed['geometry']), coordinates(original['geometry']), atol=0.5e-5,
+        )
+
+
+def test_precision_and_size(features, tmp_path):
+    path = tmp_path / 'parcels.bin'
+    size = write_packed_parcels(features * 200, path)
+
+    assert size * 5 < len(json.dumps({'type': 'FeatureCollection', 'features': features * 200}))
+    assert read_packed_parcels(path)[0]['geometry']['coordinates'][0][0] == [-157.81235, 21.30123]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'parcels.bin'
+    path.write_bytes(b'{"type": "FeatureCollection"}')
+
+    with pytest.raises(ValueError):
+        read_packed_parcels(path)
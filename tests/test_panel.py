@@ -0,0 +1,86 @@
+"""Multi-year land-use panel on synthetic yearly rasters."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('rasterio')
+
+from ag_dedicated.config import Settings
+from ag_dedicated.geo.panel import ParcelPixels, RasterStack, land_use_panel, petition_land_use
+from ag_dedicated.geo.zonal import CDLLegend
+from ag_dedicated.utils.tmk import encode_tmks
+
+
+TMKS = {'crops': '130010010000', 'split': '130010020000', 'forest': '130010030000'}
+
+
+@pytest.fixture(scope='module')
+def stack(synthetic_cdl_years, tmp_path_factory) -> RasterStack:
+    return RasterStack.build(
+        synthetic_cdl_years, tmp_path_factory.mktemp('stack'), reference_year=2022,
+    )
+
+
+@pytest.fixture(scope='module')
+def features(synthetic_cdl):
+    _, features = synthetic_cdl
+    return [
+        {**f, 'properties': {'tmk': TMKS.get(f['properties']['tmk'])}}
+        for f in features
+    ]
+
+
+@pytest.fixture(scope='module')
+def panel(stack, features) -> pd.DataFrame:
+    pixels = ParcelPixels.from_features(features, stack)
+    return land_use_panel(stack, pixels, legend=CDLLegend.from_config(Settings()))
+
+
+def test_stack_aligns_years(stack):
+    assert stack.years == [2021, 2022, 2023, 2024]
+    assert isinstance(stack.data, np.memmap)
+    np.testing.assert_array_equal(stack.band(2021), stack.band(2022))
+
+
+def test_panel_tracks_land_use_change(panel):
+    split = panel[panel['tmk_key'] == encode_tmks([TMKS['split']])[0]].set_index('year')
+    assert split.loc[2022, ['active_ag', 'pasture']].tolist() == [50, 50]
+    assert split.loc[2023, ['active_ag', 'pasture']].tolist() == [0, 100]
+
+    crops = panel[panel['tmk_key'] == encode_tmks([TMKS['crops']])[0]]
+    assert (crops['active_ag'] == 100).all()
+    assert len(panel) == 7 * 4
+
+
+def test_panel_dtypes(panel):
+    assert panel['tmk_key'].dtype == np.int64
+    assert panel['year'].dtype == np.int16
+    assert panel['pixels'].dtype == np.int32
+    assert panel['active_ag'].dtype == np.float32
+    assert isinstance(panel['top_crop'].dtype, pd.CategoricalDtype)
+
+
+def test_pixels_round_trip(stack, features, panel, tmp_path):
+    ParcelPixels.from_features(features, stack).save(tmp_path / 'pixels.npz')
+    loaded = ParcelPixels.load(tmp_path / 'pixels.npz')
+
+    pd.testing.assert_frame_equal(
+        land_use_panel(stack, loaded, legend=CDLLegend.from_config(Settings())), panel,
+    )
+
+
+def test_petition_land_use(panel):
+    petitions = pd.DataFrame({
+        'tmk_key': encode_tmks([TMKS['split'], TMKS['crops'], TMKS['forest']]),
+        'start_year': [2022, 2010, 2030],
+        'end_year': [2023, 2021, 2035],
+    })
+
+    result = petition_land_use(panel, petitions)
+
+    assert result['years_observed'].tolist() == [2, 1, 0]
+    assert result.loc[0, 'active_ag_mean'] == 25
+    assert result.loc[0, 'active_ag_min'] == 0
+    assert result.loc[1, 'active_ag_mean'] == 100
+    assert np.isnan(result.loc[2, 'active_ag_mean'])
@@ -0,0 +1,55 @@
+"""PDF extraction pipeline steps that don't need tabula or Java."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ag_dedicated.config import Settings
+from ag_dedicated.extractors.pdf_extractor import PDFExtractor
+
+
+ROWS = {
+    '2019': [
+        ('130010010000', 'A10140066', 2024),
+        ('130010010000', 'A10140066', 2024),  # repeated on overlapping pages
+        ('130010020000', 'A05140001', 2019),
+    ],
+    '2020': [('130010010000', 'A10140066', 2024)],
+}
+
+
+@pytest.fixture
+def extractor(monkeypatch) -> PDFExtractor:
+    """Extractor whose PDF parsing writes ``ROWS`` for the PDF's year."""
+    extractor = PDFExtractor(Settings())
+
+    def extract_pdf(pdf_path: Path, output_path=None, pages='all'):
+        df = pd.DataFrame(
+            ROWS[pdf_path.stem[-4:]],
+            columns=['Parcel ID (TMK)', 'Petition Number', 'End Year'],
+        )
+        df.to_csv(output_path, index=False)
+        return df
+
+    monkeypatch.setattr(extractor, 'extract_pdf', extract_pdf)
+    return extractor
+
+
+def test_process_all_reruns_merge_only_extracted_csvs(extractor, tmp_path):
+    pdf_dir, output_dir = tmp_path / 'pdfs', tmp_path / 'output'
+    pdf_dir.mkdir()
+    for year in ROWS:
+        (pdf_dir / f"ag_1yr {year}.pdf").write_bytes(b'%PDF-1.4')
+
+    first = extractor.process_all(pdf_dir, output_dir)
+    second = extractor.process_all(pdf_dir, output_dir)
+
+    assert (output_dir / 'duplicates_report.csv').exists()
+    assert len(first) == 3
+    assert second.to_dict('records') == first.to_dict('records')
+    assert first['petition_key'].tolist() == [
+        1_10_2014_0066_00, 1_05_2014_0001_00, 1_10_2014_0066_00,
+    ]
+    merged = pd.read_csv(output_dir / 'merged_output.csv')
+    assert sorted(merged['Year'].unique().tolist()) == [2019, 2020]
@@ -0,0 +1,188 @@
+"""Pipeline DAG: dependency order, stage caching, and failure propagation."""
+
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from ag_dedicated.config.settings import Settings
+from ag_dedicated.pipeline import Pipeline, Stage, build_pipeline
+
+
+@pytest.fixture
+def chain(tmp_path):
+    """source -> a.txt -> b.txt, with a log of stage calls."""
+    source = tmp_path / 'source.txt'
+    source.write_text('1')
+    a, b = tmp_path / 'a.txt', tmp_path / 'b.txt'
+    calls = []
+
+    def make_a():
+        calls.append('a')
+        a.write_text(source.read_text() + 'a')
+
+    def make_b():
+        calls.append('b')
+        b.write_text(a.read_text() + 'b')
+
+    def build():
+        pipeline = Pipeline(tmp_path / 'state.json')
+        # Registered out of order; the order comes from the paths
+        pipeline.add(Stage('b', make_b, inputs=[a], outputs=[b]))
+        pipeline.add(Stage('a', make_a, inputs=[source], outputs=[a]))
+        return pipeline
+
+    return build, source, b, calls
+
+
+def statuses(results):
+    return {name: result['status'] for name, result in results.items()}
+
+
+def test_order_follows_paths(chain):
+    build, _, _, _ = chain
+    pipeline = build()
+
+    assert pipeline.dependencies('b') == ['a']
+    assert pipeline.order() == ['a', 'b']
+    assert pipeline.order(['a']) == ['a']
+
+
+def test_unchanged_inputs_skip(chain):
+    build, _, b, calls = chain
+
+    assert statuses(build().run(workers=2)) == {'a': 'ran', 'b': 'ran'}
+    assert statuses(build().run(workers=2)) == {'a': 'skipped', 'b': 'skipped'}
+    assert calls == ['a', 'b']
+    assert b.read_text() == '1ab'
+
+
+def test_changed_input_reruns(chain):
+    build, source, b, calls = chain
+    build().run()
+
+    source.write_text('2')
+    assert statuses(build().run(dry_run=True)) == {'a': 'planned', 'b': 'planned'}
+    assert statuses(build().run()) == {'a': 'ran', 'b': 'ran'}
+    assert calls == ['a', 'b', 'a', 'b']
+    assert b.read_text() == '2ab'
+
+
+def test_changed_output_reruns(chain):
+    build, _, b, calls = chain
+    build().run()
+
+    b.write_text('edited')
+    assert statuses(build().run()) == {'a': 'skipped', 'b': 'ran'}
+    assert calls == ['a', 'b', 'b']
+
+
+def test_state_records_stages_and_files(chain, tmp_path):
+    build, _, _, _ = chain
+    build().run(workers=4)
+
+    state = json.loads((tmp_path / 'state.json').read_text())
+    assert set(state['stages']) == {'a', 'b'}
+    assert str(tmp_path / 'source.txt') in state['files']
+
+
+def test_failure_blocks_downstream(tmp_path):
+    out = tmp_path / 'out.txt'
+
+    def fail():
+        raise RuntimeError('boom')
+
+    pipeline = Pipeline(tmp_path / 'state.json')
+    pipeline.add(Stage('fail', fail, outputs=[out]))
+    pipeline.add(Stage('after', lambda: None, inputs=[out], outputs=[tmp_path / 'after.txt']))
+    pipeline.add(Stage('other', lambda: (tmp_path / 'other.txt').write_text('x'),
+                       outputs=[tmp_path / 'other.txt']))
+
+    results = pipeline.run(workers=2)
+
+    assert statuses(results) == {'fail': 'failed', 'after': 'blocked', 'other': 'ran'}
+    assert results['fail']['error'] == 'boom'
+    state = json.loads((tmp_path / 'state.json').read_text())
+    assert set(state['stages']) == {'other'}
+
+
+def test_reports_stage_builds_the_policy_report(tmp_path, monkeypatch):
+    pytest.importorskip('matplotlib')
+    pytest.importorskip('seaborn')
+    monkeypatch.setattr(Settings, '_snapshot', None)
+    monkeypatch.setattr(Settings, '_overrides', {})
+    config = Settings()
+    config.reload({
+        'paths.policy_report': str(tmp_path / 'report'),
+        'policy_report.dpi': 20,
+        'policy_report.workers': 1,
+    })
+
+    stage = build_pipeline(config).stages['reports']
+    stage.func()
+
+    assert stage.outputs == [tmp_path / 'report']
+    written = {p.name for p in (tmp_path / 'report').iterdir()}
+    assert {
+        'comparison_report.txt', 'detailed_policy_analysis.txt', 'requirements.csv',
+        'dedication_periods_analysis.png', 'requirements_comparison.png',
+    } <= written
+
+
+def test_building_the_pipeline_skips_heavy_imports(tmp_path):
+    code = (
+        'import sys; from ag_dedicated.pipeline import build_pipeline; build_pipeline(); '
+        'print(sorted({"pandas", "numpy"} & set(sys.modules)))'
+    )
+
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=tmp_path,
+    )
+
+    assert result.stdout.strip() == '[]'
+
+
+def test_cycle_rejected(tmp_path):
+    x, y = tmp_path / 'x', tmp_path / 'y'
+    pipeline = Pipeline(tmp_path / 'state.json')
+    pipeline.add(Stage('x', lambda: None, inputs=[y], outputs=[x]))
+    pipeline.add(Stage('y', lambda: None, inputs=[x], outputs=[y]))
+
+    with pytest.raises(ValueError, match='cycle'):
+        pipeline.order()
+
+
+def test_map_stage_attaches_latest_snapshot_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, '_snapshot', None)
+    monkeypatch.setattr(Settings, '_overrides', {})
+    config = Settings()
+    config.reload({
+        'paths.output': str(tmp_path / 'output'),
+        'paths.parcel_map': str(tmp_path / 'parcels.json'),
+        'paths.parcel_map_packed': str(tmp_path / 'parcels.bin'),
+        'pipeline.state_file': str(tmp_path / 'state.json'),
+    })
+    (tmp_path / 'output').mkdir()
+    pd.DataFrame({
+        'Parcel ID (TMK)': ['130010010000', '130010010000', '130010020000'],
+        'Petition Number': ['A10050001', 'A10150002', 'A05100003'],
+        'End Year': [2015, 2025, 2015],
+        'Year': [2014, 2020, 2014],
+    }).to_csv(tmp_path / 'output' / 'cleaned_output.csv', index=False)
+    features = [
+        {'type': 'Feature', 'properties': {'ded_tmk': tmk}, 'geometry': None}
+        for tmk in ['130010010000', '130010020000']
+    ]
+    (tmp_path / 'parcels.json').write_text(
+        json.dumps({'type': 'FeatureCollection', 'features': features})
+    )
+
+    build_pipeline(config).stages['map'].func()
+
+    written = json.loads((tmp_path / 'parcels.json').read_text())['features']
+    petitions = [f['properties']['petitions'] for f in written]
+    assert [[p['number'] for p in row] for row in petitions] == [['A10150002'], []]
+    assert (tmp_path / 'parcels.js').exists()
+    assert (tmp_path / 'parcels.bin').exists()
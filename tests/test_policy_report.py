@@ -0,0 +1,38 @@
+"""Policy report figure caching."""
+
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+from ag_dedicated.analysis.policy_report import PolicyReport
+from ag_dedicated.config import Settings
+
+
+def test_unchanged_build_renders_and_rewrites_nothing(tmp_path):
+    report = PolicyReport(Settings(), output_dir=tmp_path, dpi=20, workers=1)
+
+    def mtimes():
+        return {p.name: p.stat().st_mtime_ns for p in tmp_path.iterdir() if p.suffix != '.json'}
+
+    first = report.build()
+    written = mtimes()
+    second = report.build()
+
+    assert set(first.values()) == {'rendered'}
+    assert set(second.values()) == {'cached'}
+    assert mtimes() == written
+
+
+def test_missing_or_forced_figures_render(tmp_path):
+    report = PolicyReport(Settings(), output_dir=tmp_path, dpi=20, workers=1)
+    report.build()
+
+    periods = tmp_path / 'dedication_periods_analysis.png'
+    periods.unlink()
+    status = report.build()
+
+    assert status['dedication_periods_analysis.png'] == 'rendered'
+    assert status['requirements_comparison.png'] == 'cached'
+    assert periods.exists()
+    assert report.build(force=True) == {name: 'rendered' for name in status}
@@ -0,0 +1,86 @@
+"""Stage profiler."""
+
+import pstats
+import threading
+
+from loguru import logger
+
+from ag_dedicated.utils.profiling import Profiler, get_profiler, stage
+
+
+def busy(n: int = 200_000) -> int:
+    return sum(i * i for i in range(n))
+
+
+def test_stages_record_calls_and_time():
+    profiler = Profiler('test').start()
+    try:
+        assert get_profiler() is profiler
+        for _ in range(2):
+            with stage('work'):
+                busy()
+        with stage('other'):
+            pass
+    finally:
+        report = profiler.stop()
+
+    assert get_profiler() is None
+    assert report['command'] == 'test'
+    assert report['stages']['work']['calls'] == 2
+    assert report['stages']['work']['wall'] > 0
+    assert report['stages']['work']['cpu'] > 0
+    assert report['stages']['other']['calls'] == 1
+    assert report['wall'] >= report['stages']['work']['wall']
+    assert report['peak_traced'] > 0
+    assert report['cprofile_path'] is None
+    assert all(isinstance(size, int) for _, size, _ in report['allocations'])
+
+
+def test_nested_stage_of_the_same_name_counts_once():
+    profiler = Profiler('test').start()
+    try:
+        with stage('scrape'):
+            with stage('scrape'):
+                with stage('parse'):
+                    pass
+    finally:
+        report = profiler.stop()
+
+    assert report['stages']['scrape']['calls'] == 1
+    assert report['stages']['parse']['calls'] == 1
+
+
+def test_stage_binds_log_context_without_a_profiler():
+    records = []
+    sink = logger.add(lambda message: records.append(message.record), level='INFO')
+    try:
+        with stage('merge'):
+            logger.info('inside')
+        logger.info('outside')
+    finally:
+        logger.remove(sink)
+
+    assert records[0]['extra'].get('stage') == 'merge'
+    assert 'stage' not in records[1]['extra']
+    assert get_profiler() is None
+
+
+def test_thread_stages_and_cprofile_dump(tmp_path):
+    def worker():
+        with stage('threaded'):
+            busy()
+
+    profiler = Profiler('cmd', cprofile_dir=tmp_path).start()
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        report = profiler.stop()
+
+    assert report['stages']['threaded']['calls'] == 2
+    assert report['cprofile_path'] == tmp_path / 'cmd.prof'
+    functions = {name for _, _, name in pstats.Stats(str(report['cprofile_path'])).stats}
+    assert 'busy' in functions
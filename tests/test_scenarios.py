@@ -0,0 +1,45 @@
+"""Monte Carlo policy scenarios."""
+
+import pandas as pd
+import pytest
+
+from ag_dedicated.analysis.scenarios import PolicySimulator, apply_overrides, scenario_grid
+
+
+@pytest.fixture
+def parcels() -> pd.DataFrame:
+    return pd.DataFrame({
+        'county': ['Honolulu', 'Honolulu', 'Hawaii', 'Maui', 'Kauai'] * 4,
+        'market_value': [250_000.0, 1_000_000.0, 80_000.0, 400_000.0, 150_000.0] * 4,
+        'term': [10, 5, 10, 10, 5] * 4,
+        'acres': [2.0, 10.0, 40.0, 5.0, 1.0] * 4,
+    })
+
+
+def test_results_do_not_depend_on_workers(parcels):
+    scenarios = scenario_grid({
+        'honolulu.assessment_rates.10_year': [0.01, 0.05],
+        'honolulu.tax_rate': [5.70, 8.0],
+    })
+
+    serial = PolicySimulator(parcels, draws=50, seed=7, workers=1).run(scenarios)
+    parallel = PolicySimulator(parcels, draws=50, seed=7, workers=2).run(scenarios)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert len(serial['scenario'].unique()) == 5
+
+
+def test_baseline_is_the_reference(parcels):
+    scenarios = scenario_grid({'honolulu.tax_rate': [5.70, 11.40]})
+
+    summary = PolicySimulator(parcels, draws=50, seed=7, workers=1).run(scenarios)
+
+    total = summary[summary['county'] == 'total'].set_index('scenario')
+    assert total.loc['baseline', 'revenue_change'] == 0.0
+    assert total.loc['honolulu.tax_rate=5.7', 'revenue_change'] == pytest.approx(0.0)
+    assert total.loc['honolulu.tax_rate=11.4', 'revenue_change'] > 0
+
+
+def test_unknown_county_override_rejected():
+    with pytest.raises(ValueError, match='Unknown county'):
+        apply_overrides({'honolulu': {}}, {'oahu.tax_rate': 1.0})
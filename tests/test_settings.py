@@ -0,0 +1,77 @@
+"""Configuration snapshots and environment overrides."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from ag_dedicated.config.settings import ConfigSnapshot, Settings, env_overrides
+
+
+def test_env_overrides_parse_names_and_values():
+    overrides = env_overrides({
+        'AG_DEDICATED__PIPELINE__WORKERS': '8',
+        'AG_DEDICATED__LOGGING__LEVEL': 'DEBUG',
+        'AG_DEDICATED__SIMULATION__VALUE_SIGMA': '0.25',
+        'AG_DEDICATED__OUTPUT__WRITE_PARQUET': 'false',
+        'AG_DEDICATED__SIMULATION__WORKERS': '',
+        'AG_DEDICATED__TILES__PROPERTIES': '[active_ag, pasture]',
+        'AG_DEDICATED__': 'ignored',
+        'OTHER__PIPELINE__WORKERS': '2',
+    })
+
+    assert overrides == {
+        'pipeline.workers': 8,
+        'logging.level': 'DEBUG',
+        'simulation.value_sigma': 0.25,
+        'output.write_parquet': False,
+        'simulation.workers': None,
+        'tiles.properties': ['active_ag', 'pasture'],
+    }
+
+
+def test_env_overrides_apply_on_reload(monkeypatch):
+    monkeypatch.setattr(Settings, '_snapshot', None)
+    monkeypatch.setattr(Settings, '_overrides', {})
+    monkeypatch.setenv('AG_DEDICATED__PIPELINE__WORKERS', '3')
+    monkeypatch.setenv('AG_DEDICATED__NEW_SECTION__KEY', 'value')
+
+    config = Settings()
+    assert config.get('pipeline.workers') == 3
+    assert config.get('new_section.key') == 'value'
+
+    # Programmatic overrides win over the environment
+    config.reload({'pipeline.workers': 5})
+    assert config.get('pipeline.workers') == 5
+    assert config.get('counties.honolulu.name') == 'City and County of Honolulu'
+
+
+def test_snapshot_is_read_only():
+    snapshot = ConfigSnapshot(
+        {'counties': {'honolulu': {'periods': [5, 10]}}, 'paths': {'output': 'out'}},
+        Path('/project'),
+    )
+    county = snapshot.get('counties.honolulu')
+
+    with pytest.raises(TypeError):
+        county['periods'] = [1]
+    with pytest.raises(TypeError):
+        snapshot.get('counties').update({'maui': {}})
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+    assert county['periods'] == (5, 10)
+    assert snapshot.get('counties.honolulu.periods') == (5, 10)
+    assert snapshot.get_path('paths.output') == Path('/project/out').resolve()
+
+
+def test_snapshot_pickles_to_an_equal_snapshot():
+    snapshot = Settings().snapshot
+
+    restored = pickle.loads(pickle.dumps(snapshot))
+    from_settings = pickle.loads(pickle.dumps(Settings()))
+
+    assert restored.to_dict() == snapshot.to_dict()
+    assert isinstance(from_settings, ConfigSnapshot)
+    assert from_settings.get_path('paths.output') == Settings().get_path('paths.output')
+    with pytest.raises(TypeError):
+        restored.get('counties')['maui'] = {}
@@ -0,0 +1,140 @@
+"""Tax benefit estimates from county rules."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from ag_dedicated.analysis.tax_benefit import (
+    TaxRules,
+    estimate_tax_benefit,
+    parcels_from_map,
+    summarize_tax_benefit,
+)
+
+
+COUNTIES = {
+    'honolulu': {'assessment_rates': {'5_year': 0.03, '10_year': 0.01}, 'tax_rate': 5.70},
+    'hawaii': {
+        'programs': [{'years': 10, 'value_per_acre': 1500}],
+        'min_gross_income': 2000,
+    },
+}
+
+
+@pytest.fixture
+def rules() -> TaxRules:
+    return TaxRules.from_counties(COUNTIES)
+
+
+def feature(ded_tmk, petition_type='10-Year', **properties):
+    return {
+        'type': 'Feature',
+        'properties': {
+            'ded_tmk': ded_tmk, 'county': 'Honolulu', 'acres': 2.0,
+            'net_taxable': '$5,000', 'petitions': [{'type': petition_type}], **properties,
+        },
+        'geometry': None,
+    }
+
+
+def test_assessment_rate_and_tax(rules):
+    parcels = pd.DataFrame({
+        'county': ['Honolulu', 'City and County of Honolulu'],
+        'market_value': [1_000_000.0, 1_000_000.0],
+        'term': [10, 5],
+    })
+
+    result = estimate_tax_benefit(parcels, rules)
+
+    assert result['dedicated_value'].tolist() == [10_000.0, 30_000.0]
+    assert result['tax_market'].tolist() == pytest.approx([5_700.0, 5_700.0])
+    assert result['tax_foregone'].tolist() == pytest.approx([5_643.0, 5_529.0])
+    assert result['eligible'].all()
+
+
+def test_county_without_tax_rate_has_no_taxes(rules):
+    parcels = pd.DataFrame({
+        'county': ['County of Hawaii', 'Hawaii'],
+        'market_value': [500_000.0, 500_000.0],
+        'term': [10, 10],
+        'acres': [4.0, 4.0],
+        'gross_income': [5000.0, 1000.0],
+    })
+
+    result = estimate_tax_benefit(parcels, rules)
+
+    assert result['dedicated_value'].tolist() == [6_000.0, 500_000.0]
+    assert result['eligible'].tolist() == [True, False]
+    assert result[['tax_market', 'tax_dedicated', 'tax_foregone']].isna().all().all()
+
+
+def test_unknown_county_or_term_keeps_market_value(rules):
+    parcels = pd.DataFrame({
+        'county': ['Honolulu', 'Maui'],
+        'market_value': [200_000.0, 200_000.0],
+        'term': [3, 10],
+    })
+
+    result = estimate_tax_benefit(parcels, rules)
+
+    assert not result['rule_found'].any()
+    assert result['dedicated_value'].tolist() == [200_000.0, 200_000.0]
+    assert result['tax_foregone'].iloc[0] == 0.0
+    assert np.isnan(result['tax_foregone'].iloc[1])
+
+
+def test_parcels_from_map_takes_market_value_from_assessments():
+    features = [feature('130010010000'), feature('130010020000', '5-Year'), feature(None)]
+    assessments = pd.DataFrame({
+        'TMK': ['1-1-3-001-001-0000', '130010030000'],
+        'Land_Value': ['$800,000', '$100,000'],
+    })
+
+    parcels = parcels_from_map(features, assessments)
+
+    assert parcels['market_value'].iloc[0] == 800_000.0
+    assert parcels['market_value'].iloc[1:].isna().all()
+    assert parcels['term'].tolist()[:2] == [10.0, 5.0]
+
+
+def test_parcels_from_map_ignores_net_taxable():
+    parcels = parcels_from_map([feature('130010010000')])
+
+    assert parcels['market_value'].isna().all()
+
+
+def test_summary_by_county(rules):
+    parcels = pd.DataFrame({
+        'county': ['Honolulu', 'Honolulu', 'Hawaii'],
+        'market_value': [1_000_000.0, 500_000.0, 500_000.0],
+        'term': [10, 10, 10],
+        'acres': [1.0, 1.0, 4.0],
+    })
+
+    summary = summarize_tax_benefit(estimate_tax_benefit(parcels, rules)).set_index('county')
+
+    assert summary.loc['honolulu', 'parcels'] == 2
+    assert summary.loc['honolulu', 'tax_foregone'] == pytest.approx(0.99 * 1_500_000 * 5.70 / 1000)
+    assert np.isnan(summary.loc['hawaii', 'tax_foregone'])
+    assert summary.loc['total', 'parcels'] == 3
+
+
+def test_summary_flags_counties_left_out_of_tax_totals(rules):
+    parcels = pd.DataFrame({
+        'county': ['Honolulu', 'Hawaii', 'Hawaii', 'Hawaii'],
+        'market_value': [1_000_000.0, 500_000.0, 500_000.0, np.nan],
+        'term': [10, 10, 10, 10],
+        'acres': [1.0, 4.0, 4.0, 4.0],
+    })
+    messages = []
+    sink = logger.add(messages.append, level='WARNING')
+    try:
+        summary = summarize_tax_benefit(estimate_tax_benefit(parcels, rules)).set_index('county')
+    finally:
+        logger.remove(sink)
+
+    assert summary['n_missing_rate'].to_dict() == {'honolulu': 0, 'hawaii': 2, 'total': 2}
+    assert summary.loc['total', 'tax_market'] == summary.loc['honolulu', 'tax_market']
+    assert summary.loc['total', 'market_value'] == 2_000_000.0
+    assert any('exclude 2 parcels' in m and 'hawaii' in m for m in messages)
@@ -0,0 +1,84 @@
+"""Vector tile pyramid of parcel features."""
+
+import json
+
+import numpy as np
+import pytest
+
+mapbox_vector_tile = pytest.importorskip('mapbox_vector_tile')
+
+from ag_dedicated.config import Settings
+from ag_dedicated.geo.tiles import build_tiles, tile_bounds, web_mercator
+
+
+def rectangle(west: float, south: float, east: float, north: float) -> dict:
+    ring = [[west, south], [east, south], [east, north], [west, north], [west, south]]
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+@pytest.fixture(scope='module')
+def features():
+    # The second parcel straddles the 0.0 longitude tile edge at every zoom
+    return [
+        {'type': 'Feature', 'properties': {'tmk': 'a', 'active_ag': 12.5, 'owner': 'X'},
+         'geometry': rectangle(0.01, 0.01, 0.02, 0.02)},
+        {'type': 'Feature', 'properties': {'tmk': 'b', 'active_ag': None},
+         'geometry': rectangle(-0.01, 0.03, 0.01, 0.04)},
+        {'type': 'Feature', 'properties': {'tmk': 'c'}, 'geometry': None},
+    ]
+
+
+@pytest.fixture(scope='module')
+def pyramid(features, tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp('tiles')
+    written = build_tiles(features, output_dir, config=Settings(), min_zoom=8, max_zoom=10)
+    return output_dir, written
+
+
+def read_tile(output_dir, z, x, y):
+    data = (output_dir / str(z) / str(x) / f'{y}.pbf').read_bytes()
+    return mapbox_vector_tile.decode(data, default_options={'y_coord_down': True})['parcels']
+
+
+def test_pyramid_layout(pyramid):
+    output_dir, written = pyramid
+    tilejson = json.loads((output_dir / 'tiles.json').read_text())
+
+    # At zooms 8 and 9 the tile buffer reaches across the equator
+    assert written == {8: 4, 9: 4, 10: 2}
+    assert tilejson['minzoom'] == 8 and tilejson['maxzoom'] == 10
+    assert tilejson['bounds'] == pytest.approx([-0.01, 0.01, 0.02, 0.04])
+    assert tilejson['vector_layers'][0]['fields'] == {'active_ag': 'Number', 'id': 'Number'}
+
+
+def test_tiles_keep_only_styling_properties(pyramid):
+    output_dir, _ = pyramid
+    east = read_tile(output_dir, 10, 512, 511)
+
+    props = {f['id']: f['properties'] for f in east['features']}
+    assert props == {0: {'active_ag': 12.5, 'id': 0}, 1: {'id': 1}}
+
+
+def test_geometry_is_clipped_and_quantized(pyramid):
+    output_dir, _ = pyramid
+    west = read_tile(output_dir, 10, 511, 511)
+
+    (feature,) = west['features']
+    xs = [x for x, _ in feature['geometry']['coordinates'][0]]
+    assert feature['id'] == 1
+    assert all(isinstance(x, int) for x in xs)
+    # Clipped at the tile edge plus the 64-unit buffer
+    assert max(xs) == 4096 + 64
+
+    # Tile 511 ends at longitude 0, the equator runs along its bottom edge
+    assert tile_bounds(10, 511, 511)[2] == pytest.approx(0.0, abs=1e-6)
+    assert tile_bounds(10, 511, 511)[1] == pytest.approx(0.0, abs=1e-6)
+    assert web_mercator(np.array([[180.0, 0.0]]))[0, 0] == pytest.approx(tile_bounds(0, 0, 0)[2])
+
+
+def test_rebuild_replaces_pyramid(features, pyramid, tmp_path):
+    output_dir = tmp_path / 'tiles'
+    build_tiles(features, output_dir, config=Settings(), min_zoom=8, max_zoom=9)
+    build_tiles(features, output_dir, config=Settings(), min_zoom=8, max_zoom=8)
+
+    assert sorted(p.name for p in output_dir.iterdir()) == ['8', 'tiles.json']
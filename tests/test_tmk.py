@@ -0,0 +1,28 @@
+"""TMK parsing into packed integer keys."""
+
+import pandas as pd
+
+from ag_dedicated.utils.tmk import TMK_NULL, encode_tmk, encode_tmks
+
+
+def test_encode_forms():
+    keys = encode_tmks([
+        '220270390000', '134021001', '1-3-4-021-001', '1–3–4–021–001–0002', 1340210010000,
+    ])
+
+    assert keys.tolist() == [
+        1220270390000, 1340210010000, 1340210010000, 1340210010002, 1340210010000,
+    ]
+
+
+def test_unparseable_values_are_null():
+    keys = encode_tmks(pd.Series(['invalid', '', None, '12-34', '1-3-4-021-001-0000-9']))
+
+    assert (keys == TMK_NULL).all()
+    assert encode_tmk('invalid') == TMK_NULL
+
+
+def test_dashes_without_digits_are_null():
+    assert encode_tmks(pd.Series(['-'])).tolist() == [TMK_NULL]
+    assert encode_tmks(pd.Series(['a-b', 'N/A-N/A'])).tolist() == [TMK_NULL, TMK_NULL]
+    assert encode_tmks(pd.Series(['-', '1-3-4-021-001'])).tolist() == [TMK_NULL, 1340210010000]
@@ -0,0 +1,48 @@
+"""Petition number decoding."""
+
+import pandas as pd
+
+from ag_dedicated.utils.validation import PETITION_NULL, decode_petitions
+
+
+def test_decode_fields():
+    decoded = decode_petitions(['A10140066', ' av05980012 ', 'AD20070316B', 'bad', None])
+
+    assert decoded['petition_prefix'].tolist()[:3] == ['A', 'AV', 'AD']
+    assert decoded['term'].tolist()[:3] == [10, 5, 20]
+    assert decoded['start_year'].tolist()[:3] == [2014, 1998, 2007]
+    assert decoded['sequence'].tolist()[:3] == [66, 12, 316]
+    assert decoded['suffix'].tolist()[:3] == ['', '', 'B']
+    assert decoded['valid'].tolist() == [True, True, True, False, False]
+    assert decoded['petition_key'].tolist()[3:] == [PETITION_NULL, PETITION_NULL]
+    assert decoded[['term', 'start_year', 'sequence', 'suffix']].iloc[3:].isna().all().all()
+
+
+def test_key_layout():
+    key = decode_petitions(['AD20070316B'])['petition_key'].iloc[0]
+
+    assert key == 3_20_2007_0316_02
+
+
+def test_keys_sort_by_start_year_across_centuries():
+    petitions = ['A10140066', 'A10990001', 'A10020500', 'A10020499']
+
+    keys = decode_petitions(petitions)['petition_key']
+
+    assert [petitions[i] for i in keys.argsort()] == [
+        'A10990001', 'A10020499', 'A10020500', 'A10140066',
+    ]
+
+
+def test_suffix_keeps_keys_distinct():
+    keys = decode_petitions(['A10070316', 'A10070316A', 'A10070316B'])['petition_key']
+
+    assert keys.is_unique
+    assert keys.is_monotonic_increasing
+
+
+def test_century_pivot():
+    decoded = decode_petitions(pd.Series(['A05690001', 'A05700001'], index=[7, 9]))
+
+    assert decoded.index.tolist() == [7, 9]
+    assert decoded['start_year'].tolist() == [2069, 1970]
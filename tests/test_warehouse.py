@@ -0,0 +1,113 @@
+"""SQLite warehouse build, indexes, and queries."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from ag_dedicated.analysis.warehouse import INDEXES, Warehouse
+from ag_dedicated.extractors.parquet import write_dedications_parquet
+
+
+DEDICATIONS = pd.DataFrame({
+    'Parcel ID (TMK)': ['410010010000', '410010010000', '410010020000', '220270390000'],
+    'Petition Number': ['A10140066', 'A10140066', 'A05150039', 'A20040578'],
+    'Site Address': ['1 FARM RD', '1 FARM RD', '2 FARM RD', '2854 BOOTH RD'],
+    'End Year': [2024, 2024, 2020, 2024],
+    'Year': [2019, 2020, 2019, 2020],
+})
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Cleaned CSV, a scrape CSV, and a parcel map with CDL properties."""
+    cleaned = tmp_path / 'cleaned_output.csv'
+    DEDICATIONS.to_csv(cleaned, index=False)
+
+    scrape = tmp_path / 'honolulu_enriched.csv'
+    pd.DataFrame({
+        'TMK': ['4-1-001-001', '4-1-001-002'],
+        'owner': ['A FARM LLC', 'B RANCH'],
+    }).to_csv(scrape, index=False)
+
+    parcels = tmp_path / 'parcels_cdl.json'
+    parcels.write_text(json.dumps({'type': 'FeatureCollection', 'features': [
+        {
+            'type': 'Feature',
+            'properties': {
+                'ded_tmk': tmk, 'active_ag': active_ag, 'pasture': 100 - active_ag,
+                'petitions': [{'number': 'A10140066'}],
+            },
+            'geometry': None,
+        }
+        for tmk, active_ag in [('410010010000', 80.0), ('410010020000', 10.0)]
+    ]}))
+    return cleaned, scrape, parcels
+
+
+@pytest.mark.parametrize('layout', ['csv', 'parquet'])
+def test_build_and_query(sources, tmp_path, layout):
+    cleaned, scrape, parcels = sources
+    dedications = cleaned
+    if layout == 'parquet':
+        dedications = write_dedications_parquet(DEDICATIONS, tmp_path / 'parquet')
+
+    with Warehouse(db_path=tmp_path / 'wh.sqlite') as wh:
+        wh.build(dedications_path=dedications, scrape_paths=[scrape], parcels_path=parcels)
+
+        assert wh.tables() == ['dedications', 'land_use', 'parcels']
+        counts = wh.query(
+            "SELECT (SELECT COUNT(*) FROM dedications) AS dedications, "
+            "(SELECT COUNT(*) FROM parcels) AS parcels, "
+            "(SELECT COUNT(*) FROM land_use) AS land_use"
+        ).iloc[0].tolist()
+        assert counts == [4, 2, 2]
+
+        indexed = set(wh.query(
+            "SELECT tbl_name, sql FROM sqlite_master WHERE type = 'index'"
+        ).itertuples(index=False, name=None))
+        assert {(table, f"({columns})") for table, columns in INDEXES} == {
+            (table, sql[sql.index('('):]) for table, sql in indexed
+        }
+
+        # Nested petition lists stay out of land_use
+        assert 'petitions' not in wh.query("SELECT * FROM land_use").columns
+
+        joined = wh.query(
+            "SELECT d.petition, d.zone, l.active_ag, p.owner FROM dedications d "
+            "JOIN land_use l USING (tmk_key) LEFT JOIN parcels p USING (tmk_key) "
+            "WHERE d.year = ? ORDER BY d.petition",
+            (2019,),
+        )
+    assert joined.values.tolist() == [
+        ['A05150039', 4, 10.0, 'B RANCH'],
+        ['A10140066', 4, 80.0, 'A FARM LLC'],
+    ]
+    assert not (tmp_path / 'wh.sqlite.tmp').exists()
+
+
+def test_query_without_warehouse(tmp_path):
+    with pytest.raises(FileNotFoundError, match='warehouse build'):
+        Warehouse(db_path=tmp_path / 'missing.sqlite').query("SELECT 1")
+
+
+def test_cli_build_and_query(sources, tmp_path):
+    cleaned, _, parcels = sources
+    db, out = tmp_path / 'wh.sqlite', tmp_path / 'result.csv'
+    env = {**os.environ, 'AG_DEDICATED__LOGGING__LOG_TO_FILE': 'false'}
+
+    def cli(*args):
+        return subprocess.run(
+            [sys.executable, '-m', 'ag_dedicated.cli', *args],
+            capture_output=True, text=True, check=True, cwd=tmp_path, env=env,
+        )
+
+    cli('warehouse', 'build', '--dedications', str(cleaned), '--parcels', str(parcels),
+        '--db', str(db))
+    cli('query', 'SELECT tmk_key, active_ag FROM land_use ORDER BY active_ag', '--db', str(db),
+        '--output-file', str(out))
+
+    assert pd.read_csv(out)['active_ag'].tolist() == [10.0, 80.0]
@@ -0,0 +1,70 @@
+"""CDL zonal statistics on the synthetic raster."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('rasterio')
+
+from ag_dedicated.config import Settings
+from ag_dedicated.geo.zonal import CDLLegend, attach_land_use, zonal_stats
+
+
+@pytest.fixture(scope='module')
+def stats(synthetic_cdl) -> pd.DataFrame:
+    path, features = synthetic_cdl
+    legend = CDLLegend.from_config(Settings())
+    return zonal_stats(features, path, legend=legend, workers=1).set_index('tmk')
+
+
+def test_category_percentages(stats):
+    categories = ['active_ag', 'pasture', 'other_ag', 'non_ag']
+    assert stats.loc['crops', categories].tolist() == [100, 0, 0, 0]
+    assert stats.loc['crops', 'pixels'] == 40 * 40
+    assert stats.loc['crops', 'top_crop'] == 'Other Crops'
+
+    assert stats.loc['split', ['active_ag', 'pasture']].tolist() == [50, 50]
+    forest = stats.loc['forest', ['non_ag', 'top_crop', 'top_crop_pct']]
+    assert forest.tolist() == [100, 'Forest', 100]
+
+
+def test_ignored_and_degenerate_parcels(stats):
+    # Background pixels are left out of the denominator
+    assert stats.loc['background', 'pixels'] == 20 * 40
+    assert stats.loc['background', 'active_ag'] == 100
+
+    # Smaller than a pixel: the touched pixel counts
+    assert stats.loc['tiny', 'pixels'] == 1
+    assert stats.loc['tiny', 'other_ag'] == 100
+
+    for tmk in ('outside', 'empty'):
+        assert stats.loc[tmk, 'pixels'] == 0
+        assert np.isnan(stats.loc[tmk, 'active_ag'])
+        assert pd.isna(stats.loc[tmk, 'top_crop'])
+
+
+def test_tiles_and_workers_agree(synthetic_cdl, stats):
+    path, features = synthetic_cdl
+    tiled = zonal_stats(
+        features, path, legend=CDLLegend.from_config(Settings()), tile_size=64, workers=2,
+    ).set_index('tmk')
+
+    pd.testing.assert_frame_equal(tiled, stats)
+
+
+def test_unlisted_codes_are_unclassified_non_ag():
+    legend = CDLLegend({'Corn': [1]}, {'active_ag': ['Corn']}, ignore=[0])
+
+    assert legend.names[legend.class_lut[250]] == 'Unclassified'
+    assert legend.class_category[legend.class_lut[250]] == 3
+    assert legend.class_lut[0] == -1
+
+
+def test_attach_land_use(synthetic_cdl, stats):
+    _, features = synthetic_cdl
+    features = [{**f, 'properties': dict(f['properties'])} for f in features]
+
+    attach_land_use(features, stats.reset_index())
+
+    assert features[0]['properties']['active_ag'] == 100.0
+    assert features[-1]['properties']['top_crop'] is None
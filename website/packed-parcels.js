@@ -0,0 +1,139 @@
+/*
+ * Decoder for parcels.bin, written by ag_dedicated.geo.packed.write_packed_parcels.
+ *
+ * PackedParcels.decode(arrayBuffer) returns a GeoJSON FeatureCollection.
+ * Properties are decoded up front from their columns; coordinates are
+ * decoded the first time any feature's geometry is read, so pages that
+ * draw from vector tiles never pay for them.
+ */
+(function (global) {
+  'use strict';
+
+  var ARRAY_TYPES = {
+    uint8: Uint8Array,
+    uint16: Uint16Array,
+    uint32: Uint32Array,
+    int32: Int32Array,
+    float64: Float64Array,
+  };
+  var NULL_INT = -2147483648;
+  var GEOMETRY_TYPES = [null, 'Polygon', 'MultiPolygon'];
+
+  function decode(buffer) {
+    var bytes = new Uint8Array(buffer);
+    if (String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== 'AGPK') {
+      throw new Error('Not a packed parcel file');
+    }
+    var headerLength = new DataView(buffer).getUint32(4, true);
+    var header = JSON.parse(new TextDecoder().decode(bytes.subarray(8, 8 + headerLength)));
+    var body = 8 + headerLength;
+
+    function array(name) {
+      var spec = header.arrays[name];
+      return new ARRAY_TYPES[spec[0]](buffer, body + spec[1], spec[2]);
+    }
+
+    function column(spec) {
+      var i, values;
+      if (spec.kind === 'records') {
+        var offsets = array(spec.offsets);
+        var fields = spec.fields.map(function (field) {
+          return [field.name.slice(spec.name.length + 1), column(field)];
+        });
+        values = new Array(offsets.length - 1);
+        for (i = 0; i < values.length; i++) {
+          var rows = [];
+          for (var r = offsets[i]; r < offsets[i + 1]; r++) {
+            var record = {};
+            for (var f = 0; f < fields.length; f++) record[fields[f][0]] = fields[f][1][r];
+            rows.push(record);
+          }
+          values[i] = rows;
+        }
+        return values;
+      }
+
+      var data = array(spec.array);
+      values = new Array(data.length);
+      if (spec.kind === 'float') {
+        for (i = 0; i < data.length; i++) values[i] = isNaN(data[i]) ? null : data[i];
+      } else if (spec.kind === 'number') {
+        for (i = 0; i < data.length; i++) values[i] = data[i] === NULL_INT ? null : data[i] / spec.scale;
+      } else {
+        var lookup = [null].concat(spec.dictionary.map(function (text) {
+          text = spec.prefix + text;
+          return spec.kind === 'json' ? JSON.parse(text) : text;
+        }));
+        for (i = 0; i < data.length; i++) values[i] = lookup[data[i]];
+      }
+      return values;
+    }
+
+    var geometries = null;
+
+    function decodeGeometries() {
+      var g = header.geometry;
+      var types = array(g.types);
+      var polygons = array(g.polygons);
+      var rings = array(g.rings);
+      var vertices = array(g.vertices);
+      var varints = array(g.coords);
+
+      // Zigzag varint deltas -> absolute coordinates (arithmetic, not bit
+      // operations, so values past 2^31 stay exact)
+      var coords = new Float64Array(2 * vertices[vertices.length - 1]);
+      var position = [0, 0];
+      var value = 0, scale = 1, k = 0;
+      for (var b = 0; b < varints.length; b++) {
+        value += (varints[b] & 0x7f) * scale;
+        if (varints[b] & 0x80) { scale *= 128; continue; }
+        position[k & 1] += value % 2 ? -(value + 1) / 2 : value / 2;
+        coords[k] = position[k & 1] / header.precision;
+        k++;
+        value = 0;
+        scale = 1;
+      }
+
+      geometries = new Array(types.length);
+      for (var i = 0; i < types.length; i++) {
+        var type = GEOMETRY_TYPES[types[i]];
+        if (!type) { geometries[i] = null; continue; }
+        var shapes = [];
+        for (var p = polygons[i]; p < polygons[i + 1]; p++) {
+          var polygon = [];
+          for (var r = rings[p]; r < rings[p + 1]; r++) {
+            var ring = [];
+            for (var v = vertices[r]; v < vertices[r + 1]; v++) ring.push([coords[2 * v], coords[2 * v + 1]]);
+            ring.push([ring[0][0], ring[0][1]]);
+            polygon.push(ring);
+          }
+          shapes.push(polygon);
+        }
+        geometries[i] = { type: type, coordinates: type === 'Polygon' ? shapes[0] : shapes };
+      }
+    }
+
+    function feature(i, properties) {
+      var f = { type: 'Feature', properties: properties };
+      Object.defineProperty(f, 'geometry', {
+        enumerable: true,
+        get: function () {
+          if (!geometries) decodeGeometries();
+          return geometries[i];
+        },
+      });
+      return f;
+    }
+
+    var columns = header.columns.map(function (spec) { return [spec.name, column(spec)]; });
+    var features = new Array(header.count);
+    for (var i = 0; i < header.count; i++) {
+      var properties = {};
+      for (var c = 0; c < columns.length; c++) properties[columns[c][0]] = columns[c][1][i];
+      features[i] = feature(i, properties);
+    }
+    return { type: 'FeatureCollection', features: features };
+  }
+
+  global.PackedParcels = { decode: decode };
+})(typeof window !== 'undefined' ? window : globalThis);